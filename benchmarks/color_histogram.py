@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Renk histogramı karşılaştırması
+===============================
+
+bmp_manipulator.analysis modülünün vektörel histogram motorunu, GUI'nin eski piksel
+piksel okuyan Counter döngüsüyle aynı dosya üzerinde çalıştırır, sonuçların
+aynı olduğunu doğrular ve hızlanmayı raporlar.
+
+    python benchmarks/color_histogram.py --width 2000 --height 1500 --colors 256
+"""
+
+import os
+import sys
+import time
+import struct
+import argparse
+import tempfile
+from collections import Counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source"))
+
+from bmp_manipulator import analysis as bmp_analysis
+
+
+def make_image(path, width, height, colors):
+    """Kanal başına colors farklı değerden oluşan rastgele 24-bit bir BMP yazar."""
+    row_size = ((width * 24 + 31) // 32) * 4
+    pixels = np.zeros((height, row_size), dtype=np.uint8)
+    pixels[:, :width * 3] = np.random.randint(0, colors, (height, width * 3), dtype=np.uint8)
+
+    with open(path, "wb") as f:
+        f.write(struct.pack('<2sIHHI', b'BM', 54 + pixels.size, 0, 0, 54))
+        f.write(struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0, pixels.size, 2835, 2835, 0, 0))
+        f.write(pixels.tobytes())
+
+
+def reference_histogram(file_path):
+    """Eski GUI döngüsü: her piksel için f.read ve demet anahtarlı Counter."""
+    width, height, data_offset, bit_depth = bmp_analysis.read_bmp_header(file_path)
+    bytes_per_pixel = bit_depth // 8
+    row_size = ((width * bit_depth + 31) // 32) * 4
+    unique_colors = Counter()
+
+    with open(file_path, 'rb') as f:
+        f.seek(data_offset)
+        for _ in range(abs(height)):
+            row_start = f.tell()
+            for _ in range(width):
+                blue, green, red = f.read(bytes_per_pixel)
+                unique_colors[(red, green, blue)] += 1
+            f.seek(row_start + row_size)
+
+    return width * abs(height), len(unique_colors), unique_colors
+
+
+def timed(func, *args, **kwargs):
+    """Fonksiyonu çalıştırır, (sonuç, saniye) döndürür."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Renk histogramı motorlarını karşılaştır")
+    parser.add_argument("--width", type=int, default=2000)
+    parser.add_argument("--height", type=int, default=1500)
+    parser.add_argument("--colors", type=int, default=256, help="Kanal başına farklı değer sayısı (1-256)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Paralel histogram için işçi süreç sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument("--skip-reference", action="store_true", help="Yavaş eski döngüyü çalıştırma")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "image.bmp")
+        make_image(path, args.width, args.height, args.colors)
+        megapixels = args.width * args.height / 1e6
+        print(f"Görüntü: {args.width}x{args.height} ({megapixels:.1f} MP), kanal başına {args.colors} değer")
+
+        (total, codes, counts, _), hist_time = timed(bmp_analysis.color_histogram, path)
+        result, analyze_time = timed(bmp_analysis.analyze_bmp_colors, path)
+        print(f"  histogram (diziler):         {hist_time:8.3f} sn ({megapixels / hist_time:8.1f} MP/sn), "
+              f"{len(codes):,} benzersiz renk")
+        print(f"  analyze_bmp_colors:          {analyze_time:8.3f} sn")
+
+        if args.workers > 1:
+            # Küçük görüntülerde de süreçlere bölünsün
+            bmp_analysis.PARALLEL_MIN_PIXELS = 0
+            (_, parallel_codes, parallel_counts, _), parallel_time = timed(
+                bmp_analysis.color_histogram, path, workers=args.workers)
+            print(f"  histogram ({args.workers} süreç):        {parallel_time:8.3f} sn "
+                  f"({hist_time / parallel_time:.2f}x)")
+
+            if not (np.array_equal(codes, parallel_codes) and np.array_equal(counts, parallel_counts)):
+                print("HATA: paralel histogram farklı")
+                return 1
+
+        if args.skip_reference:
+            return 0
+
+        reference, reference_time = timed(reference_histogram, path)
+        print(f"  eski piksel döngüsü:         {reference_time:8.3f} sn "
+              f"(histogram {reference_time / hist_time:.0f}x, analiz {reference_time / analyze_time:.0f}x daha yavaş)")
+
+        distribution = result[2]
+        _, top_time = timed(distribution.most_common, 100)
+        _, reference_top_time = timed(lambda: reference[2].most_common()[10:])
+        print(f"  ilk 100 renk (argpartition): {top_time:8.3f} sn, "
+              f"Counter tam sıralama: {reference_top_time:8.3f} sn")
+
+        if reference[:2] != result[:2] or dict(distribution.most_common()) != dict(reference[2]):
+            print("HATA: sonuçlar farklı")
+            return 1
+
+        print("Sonuçlar aynı.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LSB motoru karşılaştırması
+=========================
+
+Döngü tabanlı ("python") ve vektörel ("numpy") LSB motorlarını aynı
+taşıyıcı ve yük üzerinde çalıştırır, çıktıların bayt bayt aynı olduğunu
+doğrular ve süreleri raporlar. Her motor önce ölçülmeden bir kez çalıştırılır
+(numpy gibi tembel yüklenen modüller ilk çağrıda içe aktarılır), ardından
+--repeat turun en iyi süresi raporlanır.
+
+    python benchmarks/lsb_engines.py --width 1024 --height 768 --payload-kb 64
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source"))
+
+import bmp_manipulator as bm
+
+
+def make_carrier(path, width, height):
+    """Rastgele piksellerden oluşan 24-bit bir taşıyıcı BMP yazar."""
+    with bm.BMPStreamWriter(path, width, height, 24) as writer:
+        for _ in range(height):
+            writer.write_rows(os.urandom(width * 3))
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Fonksiyonu ısınma turundan sonra repeat kez çalıştırır, (sonuç, en iyi saniye) döndürür."""
+    result = func(*args, **kwargs)
+    best = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LSB motorlarını karşılaştır")
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--height", type=int, default=768)
+    parser.add_argument("--payload-kb", type=int, default=64)
+    parser.add_argument("--bit-depth", type=int, default=1)
+    parser.add_argument("--channels", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm turu; en iyi süre raporlanır")
+    args = parser.parse_args()
+
+    payload = os.urandom(args.payload_kb * 1024)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        carrier = os.path.join(tmp, "carrier.bmp")
+        make_carrier(carrier, args.width, args.height)
+
+        outputs = {}
+        print(f"Taşıyıcı: {args.width}x{args.height}, yük: {len(payload):,} bayt, "
+              f"bit derinliği: {args.bit_depth}, kanal: {args.channels}")
+
+        for engine in ("python", "numpy"):
+            bmp = bm.BMPFile(carrier)
+            stego = bm.LSBSteganography(bmp)
+
+            # Aynı yük aynı bitlere yazıldığı için tekrarlanan gizleme çıktıyı değiştirmez
+            repeat = max(1, args.repeat)
+            _, hide_time = timed(stego.hide_data, payload, args.bit_depth, args.channels,
+                                 repeat=repeat, engine=engine)
+            extracted, extract_time = timed(stego.extract_data, args.bit_depth, args.channels,
+                                            repeat=repeat, engine=engine)
+
+            if extracted != payload:
+                print(f"HATA: {engine} motoru yükü geri çıkaramadı")
+                return 1
+
+            outputs[engine] = bytes(bmp.pixel_data)
+            mb = len(payload) / (1024 * 1024)
+            print(f"  {engine:<7} gizleme: {hide_time:8.3f} sn ({mb / hide_time:8.2f} MB/sn)  "
+                  f"çıkarma: {extract_time:8.3f} sn ({mb / extract_time:8.2f} MB/sn)")
+
+        if outputs["python"] != outputs["numpy"]:
+            print("HATA: motorların çıktıları farklı")
+            return 1
+
+        print("Çıktılar bayt bayt aynı.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
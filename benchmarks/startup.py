@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Başlangıç süresi kontrolü
+=========================
+
+`import bmp_manipulator` ve `python -m bmp_manipulator info` komutlarını ayrı
+süreçlerde tekrar tekrar çalıştırır, boş yorumlayıcının açılış süresini
+çıkararak medyan ek süreyi bütçeyle karşılaştırır. Paket içe aktarıldığında
+ağır modüllerin (numpy, cryptography, argparse, analiz motoru) yüklenmediği de
+doğrulanır. Bütçe aşılırsa çıkış kodu 1 olur; CI'da doğrudan kullanılabilir.
+
+    python benchmarks/startup.py --runs 15 --import-budget 100 --info-budget 200
+"""
+
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source")
+
+# Paket içe aktarıldığında yüklenmemesi gereken modüller
+HEAVY_MODULES = ("numpy", "cryptography", "argparse", "bmp_manipulator.analysis", "multiprocessing")
+
+
+def make_image(path, width=64, height=48):
+    """Küçük, düz renkli 24-bit bir BMP yazar."""
+    row_size = ((width * 24 + 31) // 32) * 4
+    pixels = bytes(row_size * height)
+
+    with open(path, "wb") as f:
+        f.write(struct.pack('<2sIHHI', b'BM', 54 + len(pixels), 0, 0, 54))
+        f.write(struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0, len(pixels), 2835, 2835, 0, 0))
+        f.write(pixels)
+
+
+def run(command, env):
+    """Komutu yeni bir süreçte çalıştırır ve süresini milisaniye olarak döndürür."""
+    start = time.perf_counter()
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def median_time(command, env, runs):
+    """Komutun runs çalıştırmadaki medyan süresi (ms)."""
+    # İlk çalıştırma .pyc dosyalarını ve disk önbelleğini ısıtır
+    run(command, env)
+    return statistics.median(run(command, env) for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Komut satırı başlangıç süresini ölç ve bütçeyle karşılaştır")
+    parser.add_argument("--runs", type=int, default=15, help="Ölçüm başına çalıştırma sayısı")
+    parser.add_argument("--import-budget", type=float, default=100,
+                        help="import bmp_manipulator için izin verilen ek süre (ms)")
+    parser.add_argument("--info-budget", type=float, default=200,
+                        help="info komutu için izin verilen ek süre (ms)")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yaz")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SOURCE_DIR, os.environ.get("PYTHONPATH")])))
+    python = sys.executable
+    failures = []
+
+    # İçe aktarma sırasında yüklenen ağır modüller
+    probe = (f"import sys, bmp_manipulator; "
+             f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    loaded = subprocess.run([python, "-c", probe], env=env, check=True,
+                            capture_output=True, text=True).stdout.split()
+    if loaded:
+        failures.append(f"import bmp_manipulator ağır modülleri yüklüyor: {', '.join(loaded)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ornek.bmp")
+        make_image(path)
+
+        baseline = median_time([python, "-c", "pass"], env, args.runs)
+        import_time = median_time([python, "-c", "import bmp_manipulator"], env, args.runs) - baseline
+        info_time = median_time([python, "-m", "bmp_manipulator", "info", path], env, args.runs) - baseline
+
+    if import_time > args.import_budget:
+        failures.append(f"import süresi {import_time:.1f} ms > {args.import_budget:.0f} ms")
+    if info_time > args.info_budget:
+        failures.append(f"info süresi {info_time:.1f} ms > {args.info_budget:.0f} ms")
+
+    if args.json:
+        print(json.dumps({
+            "interpreter_ms": round(baseline, 1),
+            "import_ms": round(import_time, 1),
+            "info_ms": round(info_time, 1),
+            "import_budget_ms": args.import_budget,
+            "info_budget_ms": args.info_budget,
+            "heavy_modules": loaded,
+            "ok": not failures,
+        }, indent=2))
+    else:
+        print(f"Yorumlayıcı açılışı:       {baseline:7.1f} ms")
+        print(f"import bmp_manipulator:    {import_time:7.1f} ms (bütçe {args.import_budget:.0f} ms)")
+        print(f"bmp_manipulator info:      {info_time:7.1f} ms (bütçe {args.info_budget:.0f} ms)")
+
+    for failure in failures:
+        print(f"HATA: {failure}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
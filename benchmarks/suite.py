@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Performans ölçüm paketi
+=======================
+
+Sentetik BMP taşıyıcılarından bir derlem oluşturur ve kütüphanenin temel
+işlemlerini bu derlem üzerinde ölçer:
+
+- BMPFile yükleme (okuma ve mmap) ve kaydetme
+- Metadata.to_bytes / Metadata.from_bytes
+- LSBSteganography.hide_data / extract_data (parolasız ve parolalı)
+- bmp_manipulator.analysis.analyze_bmp_colors
+
+Derlem 8/24/32-bit, satır dolgusu gerektiren tek genişlikli, alttan üste
+(bottom-up) ve üstten alta (top-down) dosyalardan oluşur. Her ölçüm ayrı bir
+süreçte yapılır; böylece tepe bellek (peak RSS) o işleme aittir. Sonuçlar
+MB/sn, saniye ve MB cinsinden tabloya ve isteğe bağlı olarak JSON rapora
+yazılır; önceki bir raporla karşılaştırıldığında gerilemeler hata koduyla
+bildirilir.
+
+    python benchmarks/suite.py --sizes 64 1024 4096 --output sonuc.json
+    python benchmarks/suite.py --sizes 20000 --bit-depths 24 --corpus-dir /veri/derlem
+    python benchmarks/suite.py --compare onceki.json --tolerance 0.15
+"""
+
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+import platform
+import tempfile
+import multiprocessing
+import importlib.util
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "source"))
+
+import bmp_manipulator as bm
+
+REPORT_VERSION = 1
+PASSWORD = "benchmark-parolasi"
+
+# Ölçülen işlemler; metadata işlemleri görüntüden bağımsızdır ve bir kez çalışır
+IMAGE_OPERATIONS = ("load", "load-mmap", "save", "hide", "extract", "hide-password", "extract-password", "analyze")
+METADATA_OPERATIONS = ("metadata-to-bytes", "metadata-from-bytes")
+OPERATIONS = IMAGE_OPERATIONS + METADATA_OPERATIONS
+
+# Piksel verisi bu büyüklükte bantlar halinde üretilir
+GENERATE_BAND_BYTES = 8 * 1024 * 1024
+
+
+def case_name(bit_depth, width, height, top_down):
+    """Derlem dosyası için okunabilir ad: 24bit-1023x1024-td"""
+    return f"{bit_depth}bit-{width}x{height}-{'td' if top_down else 'bu'}"
+
+
+def corpus_cases(sizes, bit_depths, orientations):
+    """
+    Derlemdeki dosyaların (bit derinliği, genişlik, yükseklik, top_down) listesi.
+
+    Her boyut için kare bir görüntü ve genişliği bir eksik olan bir görüntü
+    üretilir; böylece genişliklerden biri tektir ve 8 ve 24-bit satırlar
+    dolgu gerektirir.
+    """
+    cases = []
+    for size in sizes:
+        for bit_depth in bit_depths:
+            for width in (size, size - 1):
+                for top_down in orientations:
+                    cases.append((bit_depth, width, size, top_down))
+    return cases
+
+
+def palette_header(width, height):
+    """256 gri tonluk paletli 8-bit bir BITMAPINFOHEADER başlığı (boyut alanları yazıcıda doldurulur)."""
+    palette = b''.join(bytes((level, level, level, 0)) for level in range(256))
+    file_header = struct.pack('<2sIHHI', b'BM', 0, 0, 0, 0)
+    dib_header = struct.pack('<IiiHHIIiiII', 40, width, height, 1, 8, 0, 0, 2835, 2835, 256, 0)
+    return file_header + dib_header + palette
+
+
+def make_carrier(path, bit_depth, width, height, top_down):
+    """Rastgele piksellerden oluşan sentetik bir BMP yazar; bellekte en fazla bir bant tutulur."""
+    header = None
+    if bit_depth == 8:
+        header = palette_header(width, -height if top_down else height)
+
+    row_bytes = width * bit_depth // 8
+    band_rows = max(1, GENERATE_BAND_BYTES // row_bytes)
+
+    with bm.BMPStreamWriter(path, width, height, bit_depth, top_down=top_down, header=header) as writer:
+        for start in range(0, height, band_rows):
+            writer.write_rows(os.urandom(row_bytes * min(band_rows, height - start)))
+
+
+def build_corpus(directory, cases):
+    """
+    Eksik derlem dosyalarını oluşturur; beklenen boyuttaki mevcut dosyalar yeniden kullanılır.
+
+    Returns:
+        dict: durum adı -> dosya yolu
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {}
+
+    for bit_depth, width, height, top_down in cases:
+        name = case_name(bit_depth, width, height, top_down)
+        path = os.path.join(directory, name + ".bmp")
+        row_size = ((width * bit_depth + 31) // 32) * 4
+        palette_size = 1024 if bit_depth == 8 else 0
+        expected_size = 54 + palette_size + row_size * height
+
+        if not (os.path.exists(path) and os.path.getsize(path) == expected_size):
+            start = time.perf_counter()
+            make_carrier(path, bit_depth, width, height, top_down)
+            print(f"  oluşturuldu: {name}.bmp ({expected_size / 1e6:.1f} MB, "
+                  f"{time.perf_counter() - start:.1f} sn)", file=sys.stderr)
+
+        paths[name] = path
+
+    return paths
+
+
+def make_metadata(entries, value_bytes):
+    """Metin ve JSON değerleri karışık, entries girişli bir Metadata oluşturur."""
+    metadata = bm.Metadata()
+    text = ("ölçüm " * value_bytes)[:value_bytes]
+
+    for i in range(entries):
+        if i % 4 == 0:
+            metadata.add(f"json-{i}", {"index": i, "note": text[:value_bytes // 2]})
+        else:
+            metadata.add(f"anahtar-{i}", text)
+
+    return metadata
+
+
+def peak_rss_mb():
+    """Sürecin şimdiye kadarki tepe bellek kullanımı (MB); ölçülemiyorsa None."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _payload_size(stego, payload_bytes):
+    """Taşıyıcı kapasitesine sığan, şifreleme ek yükü için pay bırakılmış yük boyutu."""
+    return max(1, min(payload_bytes, stego.calculate_capacity() - 1024))
+
+
+def prepare(operation, path, options):
+    """
+    İşlemi hazırlar ve ölçülecek çağrıyı döndürür.
+
+    Returns:
+        tuple: (argümansız fonksiyon, işlenen bayt sayısı) veya atlama nedeni (str)
+    """
+    if operation in METADATA_OPERATIONS:
+        metadata = make_metadata(options["metadata_entries"], options["metadata_value_bytes"])
+        data = metadata.to_bytes()
+        if operation == "metadata-to-bytes":
+            return metadata.to_bytes, len(data)
+        return (lambda: bm.Metadata.from_bytes(data)), len(data)
+
+    file_size = os.path.getsize(path)
+
+    if operation == "load":
+        return (lambda: bm.BMPFile(path)), file_size
+    if operation == "load-mmap":
+        return (lambda: bm.BMPFile(path, use_mmap=True).close()), file_size
+    if operation == "save":
+        bmp = bm.BMPFile(path)
+        output = os.path.join(options["scratch_dir"], "kayit.bmp")
+        return (lambda: bmp.save(output)), file_size
+
+    if operation == "analyze":
+        if importlib.util.find_spec("numpy") is None:
+            return "numpy kurulu değil"
+        from bmp_manipulator import analysis
+        return (lambda: analysis.analyze_bmp_colors(path)), file_size
+
+    # Steganografi işlemleri
+    bmp = bm.BMPFile(path)
+    try:
+        stego = bm.LSBSteganography(bmp)
+    except bm.SteganographyError as e:
+        return str(e)
+
+    password = PASSWORD if operation.endswith("-password") else None
+    if password and not bm.CRYPTO_AVAILABLE:
+        return "cryptography kurulu değil"
+
+    payload = os.urandom(_payload_size(stego, options["payload_bytes"]))
+
+    if operation.startswith("hide"):
+        return (lambda: stego.hide_data(payload, password=password)), len(payload)
+
+    stego.hide_data(payload, password=password)
+    return (lambda: stego.extract_data(password=password)), len(payload)
+
+
+def measure(task):
+    """
+    Tek bir (durum, işlem) ölçümü; ayrı süreçte çalıştırılmak üzere tasarlanmıştır.
+
+    Returns:
+        dict: Rapor satırı
+    """
+    case, operation, path, options = task
+    row = {"case": case, "operation": operation}
+
+    prepared = prepare(operation, path, options)
+    if isinstance(prepared, str):
+        row["skipped"] = prepared
+        return row
+
+    func, processed = prepared
+    rss_before = peak_rss_mb()
+    best = None
+
+    for _ in range(options["repeat"]):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    rss_after = peak_rss_mb()
+    row.update({
+        "bytes": processed,
+        "seconds": best,
+        "mb_per_s": processed / (1024 * 1024) / best if best > 0 else None,
+        "peak_rss_mb": rss_after,
+        "rss_growth_mb": rss_after - rss_before if rss_after is not None else None,
+    })
+    return row
+
+
+def run_tasks(tasks, isolate):
+    """Ölçümleri sırayla çalıştırır; isolate ise her ölçüm yeni bir süreçte yapılır."""
+    if not isolate:
+        for task in tasks:
+            yield measure(task)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    for task in tasks:
+        with context.Pool(1) as pool:
+            yield pool.apply(measure, (task,))
+
+
+def environment():
+    """Raporla birlikte saklanan çalışma ortamı bilgisi."""
+    info = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "bmp_manipulator": bm.__version__,
+        "crypto": bm.CRYPTO_AVAILABLE,
+        "numpy": None,
+    }
+    if bm.NUMPY_AVAILABLE:
+        import numpy
+        info["numpy"] = numpy.__version__
+    return info
+
+
+def compare_reports(baseline, results, tolerance, compare_memory=True):
+    """
+    Sonuçları önceki bir raporla karşılaştırır.
+
+    Hız (MB/sn) tolerance oranından fazla düşen veya tepe belleği aynı oranda
+    (ve en az 8 MB) artan ölçümler gerileme sayılır. Tepe bellek yalnızca iki
+    rapor da ayrı süreçlerde ölçüldüyse (compare_memory) karşılaştırılır.
+
+    Returns:
+        list: Gerileme açıklamaları
+    """
+    previous = {(row["case"], row["operation"]): row for row in baseline.get("results", [])
+                if "skipped" not in row}
+    regressions = []
+
+    print(f"\n{'Durum':<24} {'İşlem':<20} {'Önce MB/sn':>12} {'Şimdi MB/sn':>12} {'Oran':>7}")
+    for row in results:
+        old = previous.get((row["case"], row["operation"]))
+        if old is None or "skipped" in row or not old.get("mb_per_s") or not row.get("mb_per_s"):
+            continue
+
+        ratio = row["mb_per_s"] / old["mb_per_s"]
+        marker = ""
+        if ratio < 1 - tolerance:
+            marker = "  <- yavaşladı"
+            regressions.append(f"{row['case']} {row['operation']}: hız {ratio:.2f}x")
+
+        old_rss, new_rss = old.get("peak_rss_mb"), row.get("peak_rss_mb")
+        if compare_memory and old_rss and new_rss and new_rss > old_rss * (1 + tolerance) and new_rss - old_rss >= 8:
+            marker += "  <- bellek arttı"
+            regressions.append(f"{row['case']} {row['operation']}: tepe bellek "
+                               f"{old_rss:.0f} MB -> {new_rss:.0f} MB")
+
+        print(f"{row['case']:<24} {row['operation']:<20} {old['mb_per_s']:12.1f} "
+              f"{row['mb_per_s']:12.1f} {ratio:6.2f}x{marker}")
+
+    return regressions
+
+
+def print_row(row):
+    """Bir ölçüm satırını tabloya yazar."""
+    if "skipped" in row:
+        print(f"{row['case']:<24} {row['operation']:<20} atlandı: {row['skipped']}")
+        return
+
+    rss = f"{row['peak_rss_mb']:9.1f}" if row["peak_rss_mb"] is not None else f"{'-':>9}"
+    speed = f"{row['mb_per_s']:10.1f}" if row["mb_per_s"] is not None else f"{'-':>10}"
+    print(f"{row['case']:<24} {row['operation']:<20} {row['seconds']:10.4f} {speed} {rss}", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentetik BMP derlemi üzerinde performans ölçümü")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 1024, 4096],
+                        help="Görüntü kenar uzunlukları (en fazla 20000 önerilir); varsayılan: 64 1024 4096")
+    parser.add_argument("--bit-depths", type=int, nargs="+", choices=[8, 24, 32], default=[8, 24, 32])
+    parser.add_argument("--orientations", nargs="+", choices=["bottom-up", "top-down"],
+                        default=["bottom-up", "top-down"])
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS),
+                        help="Ölçülecek işlemler (varsayılan: hepsi)")
+    parser.add_argument("--repeat", type=int, default=3, help="İşlem başına tekrar; en iyi süre raporlanır")
+    parser.add_argument("--payload-mb", type=float, default=4,
+                        help="Steganografi yükü üst sınırı (MB); kapasite daha küçükse kapasite kullanılır")
+    parser.add_argument("--metadata-entries", type=int, default=1000)
+    parser.add_argument("--metadata-value-bytes", type=int, default=256)
+    parser.add_argument("--corpus-dir", help="Derlem dizini; verilirse dosyalar korunur ve sonraki çalıştırmalarda "
+                                             "yeniden kullanılır (varsayılan: geçici dizin)")
+    parser.add_argument("--generate-only", action="store_true", help="Yalnızca derlemi oluştur")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Ölçümleri tek süreçte yap (daha hızlı, ancak tepe bellek birikimli olur)")
+    parser.add_argument("--output", "-o", help="JSON raporun yazılacağı dosya")
+    parser.add_argument("--compare", help="Karşılaştırılacak önceki JSON rapor")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Karşılaştırmada gerileme sayılmayan oran (varsayılan: 0.15)")
+    args = parser.parse_args()
+
+    if min(args.sizes) < 2:
+        parser.error("Görüntü boyutu en az 2 olmalı")
+
+    orientations = [orientation == "top-down" for orientation in args.orientations]
+    cases = corpus_cases(args.sizes, args.bit_depths, orientations)
+    image_operations = [op for op in args.operations if op in IMAGE_OPERATIONS]
+    metadata_operations = [op for op in args.operations if op in METADATA_OPERATIONS]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus_dir or os.path.join(tmp, "derlem")
+        print(f"Derlem: {len(cases)} dosya ({corpus_dir})", file=sys.stderr)
+        paths = build_corpus(corpus_dir, cases)
+
+        if args.generate_only:
+            return 0
+
+        options = {
+            "repeat": max(1, args.repeat),
+            "payload_bytes": int(args.payload_mb * 1024 * 1024),
+            "metadata_entries": args.metadata_entries,
+            "metadata_value_bytes": args.metadata_value_bytes,
+            "scratch_dir": tmp,
+        }
+
+        tasks = [("metadata", op, None, options) for op in metadata_operations]
+        tasks += [(name, op, path, options) for name, path in paths.items() for op in image_operations]
+
+        print(f"{'Durum':<24} {'İşlem':<20} {'Süre (sn)':>10} {'MB/sn':>10} {'Tepe MB':>9}")
+        results = []
+        start = time.perf_counter()
+
+        for row in run_tasks(tasks, isolate=not args.in_process):
+            print_row(row)
+            results.append(row)
+
+        print(f"{len(results)} ölçüm, {time.perf_counter() - start:.1f} sn", file=sys.stderr)
+
+    report = {
+        "version": REPORT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "settings": {
+            "sizes": args.sizes,
+            "bit_depths": args.bit_depths,
+            "orientations": args.orientations,
+            "repeat": options["repeat"],
+            "payload_bytes": options["payload_bytes"],
+            "metadata_entries": args.metadata_entries,
+            "metadata_value_bytes": args.metadata_value_bytes,
+            "isolated": not args.in_process,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Rapor yazıldı: {args.output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        isolated = baseline.get("settings", {}).get("isolated") and not args.in_process
+        regressions = compare_reports(baseline, results, args.tolerance, compare_memory=isolated)
+        for regression in regressions:
+            print(f"GERİLEME: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
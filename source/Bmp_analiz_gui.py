@@ -1,16 +1,17 @@
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox, scrolledtext
-import struct
 import os
 import time
-from collections import Counter
+import queue
 import threading
-from PIL import Image, ImageTk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import numpy as np
+
+from bmp_manipulator import analysis as bmp_analysis, profiling
 
 class BMPAnalyzerApp:
+    # Kanal istatistikleri sekmesindeki adlar ve grafik renkleri
+    CHANNEL_NAMES = {"red": "Kırmızı", "green": "Yeşil", "blue": "Mavi", "alpha": "Alfa"}
+    CHANNEL_COLORS = {"red": "red", "green": "green", "blue": "blue", "alpha": "gray"}
+    
     def __init__(self, root):
         self.root = root
         self.root.title("BMP Dosya & Renk Analiz Programı")
@@ -27,6 +28,19 @@ class BMPAnalyzerApp:
         self.image_data = None
         self.analysis_result = None
         self.color_distribution = None
+        self.approximate = tk.BooleanVar(value=False)
+        self.sample_rate = tk.StringVar(value="100%")
+        
+        # Analiz iş parçacığı Tk'ye dokunmaz; olayları bu kuyruğa yazar, ana thread root.after ile okur
+        self.analysis_events = queue.Queue()
+        self.cancel_event = None
+        
+        # Kesin analiz sonuçları kullanıcı önbellek dizininde saklanır (yol + boyut + mtime)
+        self.analysis_cache = bmp_analysis.AnalysisCache()
+        
+        # Önizleme arka planda üretilir; küçük resimler de diskte önbelleklenir
+        self.thumbnail_cache = bmp_analysis.ThumbnailCache()
+        self.preview_events = queue.Queue()
         
         # Ana çerçeve
         self.main_frame = ttk.Frame(root)
@@ -45,6 +59,17 @@ class BMPAnalyzerApp:
         self.analyze_button = ttk.Button(self.file_frame, text="Analiz Et", command=self.start_analysis)
         self.analyze_button.pack(side="left", padx=5, pady=5)
         
+        self.cancel_button = ttk.Button(self.file_frame, text="İptal", command=self.cancel_analysis, state="disabled")
+        self.cancel_button.pack(side="left", padx=5, pady=5)
+        
+        # Yaklaşık analiz: çok büyük dosyalar için sabit bellekli tahmin ve satır örnekleme
+        self.approximate_check = ttk.Checkbutton(self.file_frame, text="Yaklaşık", variable=self.approximate)
+        self.approximate_check.pack(side="left", padx=5, pady=5)
+        
+        self.sample_rate_box = ttk.Combobox(self.file_frame, textvariable=self.sample_rate, width=6,
+                                            values=("100%", "50%", "25%", "10%", "1%"), state="readonly")
+        self.sample_rate_box.pack(side="left", padx=5, pady=5)
+        
         # Orta panel - Analiz sonuçları
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill="both", expand=True, padx=5, pady=5)
@@ -84,10 +109,9 @@ class BMPAnalyzerApp:
         self.chart_frame = ttk.LabelFrame(self.color_pane, text="Renk Dağılımı")
         self.color_pane.add(self.chart_frame, weight=2)
         
-        # Renk grafiği için placeholder
-        self.figure = plt.Figure(figsize=(5, 4), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.figure, self.chart_frame)
-        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        # Renk grafiği create_charts ile pencere açıldıktan sonra eklenir
+        self.figure = None
+        self.canvas = None
         
         # Sağ taraf - En Çok Kullanılan Renkler Listesi
         self.color_list_frame = ttk.LabelFrame(self.color_pane, text="En Çok Kullanılan Renkler")
@@ -109,13 +133,76 @@ class BMPAnalyzerApp:
         scrollbar.pack(side="right", fill="y")
         self.color_list.pack(side="left", fill="both", expand=True)
         
-        # Durum çubuğu
+        # Sekme 3: Kanal İstatistikleri
+        self.channel_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.channel_frame, text="Kanal İstatistikleri")
+        
+        # Üst taraf - Kanal başına özet ve bit düzlemi oranları
+        self.channel_table_frame = ttk.LabelFrame(self.channel_frame, text="Kanal Özeti ve Bit Düzlemleri (1 oranı)")
+        self.channel_table_frame.pack(fill="x", padx=5, pady=5)
+        
+        bit_columns = [f"bit{bit}" for bit in range(7, -1, -1)]
+        self.channel_list = ttk.Treeview(self.channel_table_frame,
+                                         columns=("channel", "min", "max", "mean", "std", "entropy", *bit_columns),
+                                         show="headings", height=4)
+        self.channel_list.heading("channel", text="Kanal")
+        self.channel_list.heading("min", text="En Küçük")
+        self.channel_list.heading("max", text="En Büyük")
+        self.channel_list.heading("mean", text="Ortalama")
+        self.channel_list.heading("std", text="Std. Sapma")
+        self.channel_list.heading("entropy", text="Entropi (bit)")
+        for bit in range(8):
+            # Bit 0 (LSB), LSB steganografinin değiştirdiği düzlemdir
+            self.channel_list.heading(f"bit{bit}", text="LSB" if bit == 0 else f"Bit {bit}")
+        
+        self.channel_list.column("channel", width=70)
+        for column in ("min", "max", "mean", "std", "entropy"):
+            self.channel_list.column(column, width=75)
+        for column in bit_columns:
+            self.channel_list.column(column, width=55)
+        
+        self.channel_list.pack(fill="x", padx=5, pady=5)
+        
+        # Alt taraf - Kanal histogramları
+        self.channel_chart_frame = ttk.LabelFrame(self.channel_frame, text="Kanal Histogramları")
+        self.channel_chart_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        self.channel_figure = None
+        self.channel_canvas = None
+        
+        # Durum çubuğu ve analiz ilerlemesi
         self.status_bar = ttk.Label(root, textvariable=self.status_text, relief="sunken", anchor="w")
         self.status_bar.pack(side="bottom", fill="x")
         
+        self.progress_bar = ttk.Progressbar(root, mode="determinate", maximum=100)
+        self.progress_bar.pack(side="bottom", fill="x", padx=10)
+        
         # İleri düzey özellikler için menü
         self.create_menu()
         
+        # matplotlib yüklenmesi uzun sürer; pencere önce görünsün
+        self.root.after_idle(self.create_charts)
+        
+    def create_charts(self):
+        """
+        Renk ve kanal grafiklerinin matplotlib tuvallerini oluşturur.
+        
+        matplotlib ilk çağrıda içe aktarılır; grafikler zaten varsa bir şey yapılmaz.
+        """
+        if self.figure is not None:
+            return
+        
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
+        self.figure = Figure(figsize=(5, 4), dpi=100)
+        self.canvas = FigureCanvasTkAgg(self.figure, self.chart_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        
+        self.channel_figure = Figure(figsize=(5, 3), dpi=100)
+        self.channel_canvas = FigureCanvasTkAgg(self.channel_figure, self.channel_chart_frame)
+        self.channel_canvas.get_tk_widget().pack(fill="both", expand=True)
+        
     def create_menu(self):
         menubar = tk.Menu(self.root)
         
@@ -159,51 +246,118 @@ class BMPAnalyzerApp:
             
             # Seçilen dosyayı göster
             self.load_image_preview()
+            
+            # Dosya daha önce analiz edildiyse sonuçları önbellekten hemen göster
+            self.show_cached_analysis(file_path)
+    
+    def show_cached_analysis(self, file_path):
+        try:
+            cached = bmp_analysis.load_cached_analysis(file_path, self.analysis_cache)
+        except Exception:
+            cached = None
+        
+        if cached is None:
+            self.analysis_result = None
+            self.color_distribution = None
+            return False
+        
+        result = cached[0]
+        total_pixels, unique_color_count, color_distribution = result
+        self.analysis_result = result
+        self.color_distribution = color_distribution
+        
+        self.update_analysis_results(total_pixels, unique_color_count, color_distribution)
+        self.status_text.set(f"Önceki analiz sonucu önbellekten yüklendi. {unique_color_count:,} benzersiz renk.")
+        return True
     
     def load_image_preview(self):
+        file_path = self.file_path.get()
+        if not file_path:
+            return
+        
+        # Temel dosya bilgilerini göster (yalnızca header okunur)
         try:
-            file_path = self.file_path.get()
-            if not file_path:
-                return
-            
-            # PIL ile görüntüyü yükle
-            img = Image.open(file_path)
-            
-            # Görüntüyü uygun boyuta getir
-            width, height = img.size
-            max_size = 400
-            
-            if width > max_size or height > max_size:
-                ratio = min(max_size / width, max_size / height)
-                new_width = int(width * ratio)
-                new_height = int(height * ratio)
-                img = img.resize((new_width, new_height), Image.LANCZOS)
-            
-            # Tkinter için görüntüyü hazırla
-            self.image_data = ImageTk.PhotoImage(img)
-            self.image_label.config(image=self.image_data)
-            
-            # Temel dosya bilgilerini göster
             file_size = os.path.getsize(file_path)
-            file_size_kb = file_size / 1024
-            file_size_mb = file_size_kb / 1024
-            
-            file_info = (
-                f"Dosya: {os.path.basename(file_path)}\n"
-                f"Boyut: {file_size:,} byte"
-            )
-            
-            if file_size_kb >= 1:
-                file_info += f" ({file_size_kb:.2f} KB)"
-            if file_size_mb >= 1:
-                file_info += f" ({file_size_mb:.2f} MB)"
-            
-            file_info += f"\nGenişlik: {width} piksel\nYükseklik: {height} piksel\n"
-            
-            self.update_details_text(file_info)
+        except OSError as e:
+            messagebox.showerror("Hata", f"Görüntü yüklenirken bir hata oluştu:\n{str(e)}")
+            self.status_text.set("Hata: Görüntü yüklenemedi.")
+            return
+        
+        file_size_kb = file_size / 1024
+        file_size_mb = file_size_kb / 1024
+        
+        file_info = (
+            f"Dosya: {os.path.basename(file_path)}\n"
+            f"Boyut: {file_size:,} byte"
+        )
+        
+        if file_size_kb >= 1:
+            file_info += f" ({file_size_kb:.2f} KB)"
+        if file_size_mb >= 1:
+            file_info += f" ({file_size_mb:.2f} MB)"
+        
+        try:
+            width, height, data_offset, bit_depth = self.read_bmp_header(file_path)
+            file_info += f"\nGenişlik: {width} piksel\nYükseklik: {abs(height)} piksel\n"
+        except Exception:
+            file_info += "\n"
+        
+        self.update_details_text(file_info)
+        
+        # Küçük resmi arka planda hazırla; ana thread yalnızca PhotoImage oluşturur
+        self.image_label.config(image="")
+        self.image_data = None
+        
+        preview_thread = threading.Thread(target=self.build_preview, args=(file_path, self.preview_events))
+        preview_thread.daemon = True
+        preview_thread.start()
+        
+        self.root.after(50, self.poll_preview_events)
+    
+    def build_preview(self, file_path, events):
+        """
+        Önizleme görüntüsünü arka planda hazırlar ve kuyruğa yazar.
+        
+        BMP piksel bloğundan yalnızca her N. satır/sütun okunur ve sonuç
+        disk önbelleğine yazılır; bu yolla çözülemeyen dosyalar (sıkıştırılmış
+        BMP vb.) PIL ile açılıp küçültülür. Tk nesnelerine dokunulmaz.
+        
+        Args:
+            file_path (str): Görüntü dosyasının yolu
+            events (queue.Queue): ("preview", yol, PIL görüntüsü) veya ("preview_error", yol, mesaj)
+        """
+        try:
+            from PIL import Image
             
+            with profiling.span("gui.preview"):
+                try:
+                    img = Image.fromarray(bmp_analysis.cached_thumbnail(file_path, self.thumbnail_cache))
+                except Exception:
+                    img = Image.open(file_path)
+                    img.thumbnail((bmp_analysis.THUMBNAIL_SIZE, bmp_analysis.THUMBNAIL_SIZE), Image.LANCZOS)
+            events.put(("preview", file_path, img))
+        
         except Exception as e:
-            messagebox.showerror("Hata", f"Görüntü yüklenirken bir hata oluştu:\n{str(e)}")
+            events.put(("preview_error", file_path, str(e)))
+    
+    def poll_preview_events(self):
+        try:
+            kind, file_path, payload = self.preview_events.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self.poll_preview_events)
+            return
+        
+        # Bu arada başka bir dosya seçildiyse eski önizlemeyi gösterme
+        if file_path != self.file_path.get():
+            return
+        
+        if kind == "preview":
+            # Tkinter için görüntüyü hazırla
+            from PIL import ImageTk
+            self.image_data = ImageTk.PhotoImage(payload)
+            self.image_label.config(image=self.image_data)
+        else:
+            messagebox.showerror("Hata", f"Görüntü yüklenirken bir hata oluştu:\n{payload}")
             self.status_text.set("Hata: Görüntü yüklenemedi.")
     
     def update_details_text(self, text):
@@ -221,38 +375,105 @@ class BMPAnalyzerApp:
         # Analizi arka planda çalıştır
         self.status_text.set("Analiz yapılıyor... Lütfen bekleyin.")
         self.analyze_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.progress_bar["value"] = 0
+        
+        # Seçenekler Tk değişkenlerinden ana thread'de okunur
+        approximate = self.approximate.get()
+        sample_rate = int(self.sample_rate.get().rstrip("%")) / 100 if approximate else 1.0
         
         # Analizi ayrı bir thread'de başlat
-        thread = threading.Thread(target=self.run_analysis, daemon=True)
+        self.cancel_event = threading.Event()
+        thread = threading.Thread(target=self.run_analysis,
+                                  args=(file_path, approximate, sample_rate, self.cancel_event), daemon=True)
         thread.start()
+        
+        self.root.after(100, self.poll_analysis_events)
+    
+    def cancel_analysis(self):
+        # Analiz bir sonraki bant sınırında durur
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_button.config(state="disabled")
+            self.status_text.set("Analiz iptal ediliyor...")
     
-    def run_analysis(self):
+    def run_analysis(self, file_path, approximate=False, sample_rate=1.0, cancel_event=None):
+        # Bu metot arka plan thread'inde çalışır: sonuçlar yalnızca kuyruğa yazılır
+        events = self.analysis_events
+        start_time = time.time()
+        
+        def report_progress(rows_done, rows_total):
+            events.put(("progress", rows_done, rows_total, time.time() - start_time))
+        
         try:
-            file_path = self.file_path.get()
-            start_time = time.time()
-            
-            # BMP analizi
-            result = self.analyze_bmp_colors(file_path)
-            
-            if result:
-                total_pixels, unique_color_count, color_distribution = result
-                self.analysis_result = result
-                self.color_distribution = color_distribution
+            with profiling.span("gui.analysis", approximate=approximate, sample_rate=sample_rate):
+                result = self.analyze_bmp_colors(file_path, approximate, sample_rate,
+                                                 progress=report_progress, cancel=cancel_event)
+            profiling.count("pixels_analyzed", result[0])
+            events.put(("done", result, time.time() - start_time))
+        
+        except bmp_analysis.AnalysisCancelled:
+            events.put(("cancelled",))
+        
+        except Exception as e:
+            events.put(("error", str(e)))
+    
+    def poll_analysis_events(self):
+        finished = False
+        
+        try:
+            while True:
+                event = self.analysis_events.get_nowait()
+                kind = event[0]
                 
-                # GUI güncelleme işlemleri ana thread'de yapılmalı
-                self.root.after(0, lambda: self.update_analysis_results(total_pixels, unique_color_count, color_distribution))
+                if kind == "progress":
+                    self.show_progress(*event[1:])
                 
-                elapsed_time = time.time() - start_time
-                self.status_text.set(f"Analiz tamamlandı ({elapsed_time:.2f} saniye). {unique_color_count:,} benzersiz renk bulundu.")
-            else:
-                self.status_text.set("Analiz sırasında bir hata oluştu.")
+                elif kind == "done":
+                    finished = True
+                    result, elapsed_time = event[1], event[2]
+                    total_pixels, unique_color_count, color_distribution = result
+                    self.analysis_result = result
+                    self.color_distribution = color_distribution
+                    self.progress_bar["value"] = 100
+                    
+                    self.update_analysis_results(total_pixels, unique_color_count, color_distribution)
+                    
+                    unique_text = self.format_unique_count(unique_color_count, color_distribution)
+                    self.status_text.set(f"Analiz tamamlandı ({elapsed_time:.2f} saniye). {unique_text} benzersiz renk bulundu.")
+                
+                elif kind == "cancelled":
+                    finished = True
+                    self.progress_bar["value"] = 0
+                    self.status_text.set("Analiz iptal edildi.")
+                
+                elif kind == "error":
+                    finished = True
+                    self.status_text.set("Hata: Analiz tamamlanamadı.")
+                    messagebox.showerror("Analiz Hatası", f"Analiz sırasında bir hata oluştu:\n{event[1]}")
+        
+        except queue.Empty:
+            pass
+        
+        if finished:
+            self.cancel_event = None
+            self.analyze_button.config(state="normal")
+            self.cancel_button.config(state="disabled")
+        else:
+            self.root.after(100, self.poll_analysis_events)
+    
+    def show_progress(self, rows_done, rows_total, elapsed_time):
+        # İşlenen satırlar, hız ve kalan süre tahmini
+        fraction = rows_done / rows_total if rows_total else 1.0
+        self.progress_bar["value"] = fraction * 100
         
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Analiz Hatası", f"Analiz sırasında bir hata oluştu:\n{str(e)}"))
-            self.status_text.set("Hata: Analiz tamamlanamadı.")
+        rate = rows_done / elapsed_time if elapsed_time > 0 else 0
+        remaining = (rows_total - rows_done) / rate if rate > 0 else 0
         
-        finally:
-            self.root.after(0, lambda: self.analyze_button.config(state="normal"))
+        self.status_text.set(
+            f"Analiz yapılıyor... {rows_done:,}/{rows_total:,} satır (%{fraction*100:.0f}), "
+            f"{rate:,.0f} satır/sn, kalan ~{remaining:.1f} sn"
+        )
     
     def update_analysis_results(self, total_pixels, unique_color_count, color_distribution):
         # Dosya bilgilerini güncelle
@@ -271,7 +492,7 @@ class BMPAnalyzerApp:
                 f"Yükseklik: {abs(height)} piksel\n"
                 f"Bit derinliği: {bit_depth} bit\n"
                 f"Toplam piksel sayısı: {total_pixels:,}\n"
-                f"Benzersiz renk sayısı: {unique_color_count:,}\n"
+                f"Benzersiz renk sayısı: {self.format_unique_count(unique_color_count, color_distribution)}\n"
                 f"Renk çeşitliliği oranı: {unique_color_count/total_pixels*100:.2f}%\n"
             )
             
@@ -279,6 +500,7 @@ class BMPAnalyzerApp:
             
             # Renk analizini güncelle
             self.update_color_analysis(total_pixels, color_distribution)
+            self.update_channel_statistics(color_distribution)
             
             # Renk analizi sekmesine geç
             self.notebook.select(1)
@@ -310,13 +532,15 @@ class BMPAnalyzerApp:
         self.draw_color_chart(color_distribution, total_pixels)
     
     def draw_color_chart(self, color_distribution, total_pixels):
+        self.create_charts()
         self.figure.clear()
         
         # En çok kullanılan 10 renk için pasta grafiği
         ax = self.figure.add_subplot(111)
         
+        # Kalan renkler tüm dağılımı sıralamadan toplamdan çıkarılarak bulunur
         top_colors = color_distribution.most_common(10)
-        others_count = sum(count for _, count in color_distribution.most_common()[10:])
+        others_count = color_distribution.total - sum(count for _, count in top_colors)
         
         if others_count > 0:
             top_colors.append(("Diğer Renkler", others_count))
@@ -363,6 +587,38 @@ class BMPAnalyzerApp:
         self.figure.tight_layout()
         self.canvas.draw()
     
+    def update_channel_statistics(self, color_distribution):
+        # Kanal istatistikleri renk histogramından tek adımda hesaplanır
+        for item in self.channel_list.get_children():
+            self.channel_list.delete(item)
+        
+        statistics = bmp_analysis.channel_statistics(color_distribution, histograms=True)
+        
+        for name, stats in statistics.items():
+            self.channel_list.insert("", "end", values=(
+                self.CHANNEL_NAMES.get(name, name),
+                stats['min'], stats['max'], f"{stats['mean']:.2f}", f"{stats['std']:.2f}",
+                f"{stats['entropy']:.3f}",
+                *(f"{ratio:.3f}" for ratio in reversed(stats['bit_planes']))
+            ))
+        
+        # Kanal histogramlarını çiz
+        self.create_charts()
+        self.channel_figure.clear()
+        ax = self.channel_figure.add_subplot(111)
+        
+        for name, stats in statistics.items():
+            ax.plot(range(256), stats['histogram'], color=self.CHANNEL_COLORS.get(name, "gray"),
+                    label=self.CHANNEL_NAMES.get(name, name), linewidth=1)
+        
+        ax.set_xlim(0, 255)
+        ax.set_xlabel("Değer")
+        ax.set_ylabel("Piksel Sayısı")
+        ax.legend(loc="upper right")
+        
+        self.channel_figure.tight_layout()
+        self.channel_canvas.draw()
+    
     def show_color_analysis(self):
         if not self.color_distribution:
             messagebox.showinfo("Bilgi", "Lütfen önce bir BMP dosyası analiz edin.")
@@ -371,6 +627,10 @@ class BMPAnalyzerApp:
         self.notebook.select(1)  # Renk analizi sekmesine geç
     
     def create_report(self):
+        # Bellekte sonuç yoksa dosyanın önbellekteki analizi kullanılır
+        if not self.analysis_result and self.file_path.get():
+            self.show_cached_analysis(self.file_path.get())
+        
         if not self.analysis_result:
             messagebox.showinfo("Bilgi", "Lütfen önce bir BMP dosyası analiz edin.")
             return
@@ -411,9 +671,32 @@ class BMPAnalyzerApp:
                 f.write("RENK ANALİZİ\n")
                 f.write("-" * 30 + "\n")
                 f.write(f"Toplam Piksel Sayısı: {total_pixels:,}\n")
-                f.write(f"Benzersiz Renk Sayısı: {unique_color_count:,}\n")
+                f.write(f"Benzersiz Renk Sayısı: {self.format_unique_count(unique_color_count, color_distribution)}\n")
                 f.write(f"Renk Çeşitliliği Oranı: {unique_color_count/total_pixels*100:.2f}%\n\n")
                 
+                bounds = getattr(color_distribution, "error_bounds", None)
+                if bounds:
+                    f.write("YAKLAŞIK ANALİZ HATA SINIRLARI\n")
+                    f.write("-" * 30 + "\n")
+                    f.write(f"Örnekleme Oranı: {bounds['sample_rate']*100:.1f}%\n")
+                    f.write(f"Benzersiz Renk Hatası (~%95): ±{bounds['unique_error']:,.0f}\n")
+                    f.write(f"Piksel Sayısı Fazlalığı (%{bounds['confidence']*100:.1f} olasılıkla): "
+                            f"en fazla {bounds['count_error']:,.0f}\n")
+                    if bounds['sampling_error']:
+                        f.write(f"Örnekleme Hatası (~%95): ±{bounds['sampling_error']:,.0f}\n")
+                    f.write("\n")
+                
+                f.write("KANAL İSTATİSTİKLERİ\n")
+                f.write("-" * 30 + "\n")
+                f.write(f"{'Kanal':<10} {'Min':>4} {'Maks':>5} {'Ortalama':>9} {'Std':>8} {'Entropi':>8}  "
+                        f"Bit düzlemi 1 oranı (LSB -> MSB)\n")
+                
+                for name, stats in bmp_analysis.channel_statistics(color_distribution).items():
+                    planes = " ".join(f"{ratio:.3f}" for ratio in stats['bit_planes'])
+                    f.write(f"{self.CHANNEL_NAMES.get(name, name):<10} {stats['min']:>4} {stats['max']:>5} "
+                            f"{stats['mean']:>9.2f} {stats['std']:>8.2f} {stats['entropy']:>8.3f}  {planes}\n")
+                f.write("\n")
+                
                 f.write("EN ÇOK KULLANILAN RENKLER\n")
                 f.write("-" * 30 + "\n")
                 f.write(f"{'Renk':<20} {'Piksel Sayısı':<15} {'Yüzde (%)':<10}\n")
@@ -434,6 +717,17 @@ class BMPAnalyzerApp:
         except Exception as e:
             messagebox.showerror("Hata", f"Rapor oluşturulurken bir hata oluştu:\n{str(e)}")
     
+    def format_unique_count(self, unique_color_count, color_distribution):
+        """Benzersiz renk sayısını, yaklaşık analizde hata payıyla birlikte biçimlendirir."""
+        bounds = getattr(color_distribution, "error_bounds", None)
+        if not bounds:
+            return f"{unique_color_count:,}"
+        
+        text = f"~{unique_color_count:,} (±{bounds['unique_error']:,.0f})"
+        if bounds['unique_lower_bound']:
+            text += " (örneklem, alt sınır)"
+        return text
+    
     def show_about(self):
         about_text = (
             "BMP Dosya Analiz Programı\n\n"
@@ -453,100 +747,28 @@ class BMPAnalyzerApp:
         Returns:
             tuple: (genişlik, yükseklik, veri başlangıç offseti, bit derinliği)
         """
-        with open(file_path, 'rb') as f:
-            # BMP header (14 bytes)
-            header = f.read(14)
-            if len(header) < 14:
-                raise ValueError("Geçersiz BMP dosyası: Header eksik")
-            
-            # BMP imzasını kontrol et
-            if header[0:2] != b'BM':
-                raise ValueError("Geçersiz BMP dosyası: BM imzası bulunamadı")
-            
-            # Veri offsetini al (piksel verisinin başladığı yer)
-            data_offset = struct.unpack('<I', header[10:14])[0]
-            
-            # DIB header boyutu bilgisini al
-            dib_header_size = struct.unpack('<I', f.read(4))[0]
-            
-            # DIB header'ı oku (boyutu değişebilir)
-            f.seek(14)  # BMP header sonrasına git
-            dib_header = f.read(dib_header_size)
-            
-            # Görüntü bilgilerini al
-            width = struct.unpack('<i', dib_header[4:8])[0]
-            height = struct.unpack('<i', dib_header[8:12])[0]
-            bit_depth = struct.unpack('<H', dib_header[14:16])[0]
-            
-        return width, height, data_offset, bit_depth
+        return bmp_analysis.read_bmp_header(file_path)
 
-    def analyze_bmp_colors(self, file_path):
+    def analyze_bmp_colors(self, file_path, approximate=False, sample_rate=1.0, progress=None, cancel=None):
         """
         BMP dosyasındaki benzersiz renkleri ve piksel sayısını analiz eder.
         
+        Sayım bmp_manipulator.analysis modülünün vektörel histogram motoruyla yapılır;
+        kesin analizde büyük görüntülerin satır bantları tüm çekirdeklere
+        dağıtılır ve sonuç disk önbelleğine yazılır.
+        
         Args:
             file_path (str): BMP dosyasının yolu
+            approximate (bool): Sabit bellekli yaklaşık analiz
+            sample_rate (float): Yaklaşık analizde işlenecek satır oranı
+            progress (callable): progress(işlenen satır, toplam satır)
+            cancel (threading.Event): İptal isteği
             
         Returns:
             tuple: (toplam piksel sayısı, benzersiz renk sayısı, renk dağılımı)
         """
-        try:
-            # BMP header bilgilerini oku
-            width, height, data_offset, bit_depth = self.read_bmp_header(file_path)
-            
-            # Görüntünün toplam piksel sayısı
-            total_pixels = width * abs(height)  # Height negatif olabilir (görüntü yönü)
-            
-            # Renk analizi için gerekli ayarlar
-            bytes_per_pixel = bit_depth // 8
-            row_size = ((width * bit_depth + 31) // 32) * 4  # Her satır 4 byte'a göre hizalanır
-            
-            # Benzersiz renkleri saymak için counter kullan
-            unique_colors = Counter()
-            
-            with open(file_path, 'rb') as f:
-                # Piksel verisinin başlangıcına git
-                f.seek(data_offset)
-                
-                for y in range(abs(height)):
-                    row_start = f.tell()
-                    
-                    for x in range(width):
-                        # Piksel verisini oku
-                        pixel_data = f.read(bytes_per_pixel)
-                        
-                        if len(pixel_data) < bytes_per_pixel:
-                            print(f"Uyarı: Dosya beklenenden kısa ({y}/{height} satırında kesildi)")
-                            break
-                        
-                        # Renk değeri olarak tüm pikseli bir tuple olarak kaydet
-                        # BGR formatı için: (Blue, Green, Red)
-                        if bit_depth == 24:  # 24-bit
-                            blue, green, red = pixel_data
-                            color = (red, green, blue)  # RGB formatında kaydet
-                        elif bit_depth == 32:  # 32-bit (BGRA)
-                            blue, green, red, alpha = pixel_data
-                            color = (red, green, blue, alpha)
-                        elif bit_depth == 8:  # 8-bit (indeksli)
-                            color = pixel_data[0]
-                        else:
-                            # Diğer bit derinlikleri için basit bir yaklaşım
-                            color = pixel_data
-                        
-                        # Rengi say
-                        unique_colors[color] += 1
-                    
-                    # Satır sonuna git (padding var ise atla)
-                    f.seek(row_start + row_size)
-            
-            # Analiz sonuçları
-            unique_color_count = len(unique_colors)
-            
-            return total_pixels, unique_color_count, unique_colors
-            
-        except Exception as e:
-            messagebox.showerror("Analiz Hatası", f"BMP analizi sırasında bir hata oluştu:\n{str(e)}")
-            return None
+        return bmp_analysis.analyze_bmp_colors(file_path, approximate, sample_rate, workers=None,
+                                               progress=progress, cancel=cancel, cache=self.analysis_cache)
 
 def main():
     root = tk.Tk()
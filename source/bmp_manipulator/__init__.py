@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+BMP Manipülatörü
+===============
+
+BMP dosyalarında metadata işleme ve steganografi araçları.
+
+    from bmp_manipulator import BMPFile, LSBSteganography
+    python -m bmp_manipulator info ornek.bmp
+
+Kütüphane sınıfları core modülündedir; komut satırı arayüzü (cli) ve
+ağır bağımlılıklar (argparse, cryptography, numpy) yalnızca ilk
+kullanımda yüklenir. numpy gerektiren renk analizi motoru ayrıca içe
+aktarılır: from bmp_manipulator import analysis.
+"""
+
+from .core import (
+    __version__, __author__,
+    BMPError, MetadataError, SteganographyError, EncryptionError,
+    MetadataStorageMethod, StegoMethod, BMPFileHeader, DIBHeader,
+    Keyring, SegmentedEncryptor, SegmentedDecryptor,
+    segmented_header_size, encrypt_payload, decrypt_payload, benchmark_ciphers, is_segmented,
+    Metadata, BMPFile, BMPStreamWriter, LSBSteganography,
+    CRYPTO_AVAILABLE, NUMPY_AVAILABLE, CIPHERS, DEFAULT_CIPHER, LSB_ENGINES,
+)
+
+# Komut satırı arayüzündeki adlar argparse'ı yalnızca istendiğinde yükler
+_CLI_NAMES = ("main", "run_batch", "iter_batch_paths", "BATCH_OPERATIONS")
+
+
+def __getattr__(name):
+    if name in _CLI_NAMES:
+        from . import cli
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
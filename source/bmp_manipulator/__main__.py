@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""python -m bmp_manipulator ile komut satırı arayüzünü çalıştırır."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
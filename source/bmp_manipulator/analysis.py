@@ -0,0 +1,1555 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BMP Renk Analizi
+================
+
+BMP dosyalarının renk histogramını çıkaran vektörel analiz motoru.
+
+Piksel bloğu bellek eşlemeli (np.memmap) olarak bantlar hâlinde okunur,
+her piksel tek bir uint32 renk koduna paketlenir ve sayım np.bincount /
+np.unique ile yapılır. 24-bit görüntülerde büyük dosyalar için 2^24
+girdilik yoğun bir sayım tablosu kullanılır. GUI (Bmp_analiz_gui.py) ve
+komut satırının analyze komutu bu modülü kullanır; modül tkinter'a bağlı
+değildir, numpy gerektirir ve paket içe aktarılırken yüklenmez.
+"""
+
+import os
+import sys
+import struct
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .paths import iter_bmp_files
+
+# Bir bantta işlenecek en fazla piksel sayısı (geçici kod dizisinin boyutunu sınırlar)
+DEFAULT_BAND_PIXELS = 1 << 22
+
+# 24-bit görüntüde bu kadar veya daha fazla piksel varsa yoğun 2^24 tablo kullanılır;
+# daha küçük görüntülerde np.unique tablo ayırmaktan daha ucuzdur
+DENSE_TABLE_MIN_PIXELS = 1 << 21
+
+# Bu kadar pikselden küçük görüntülerde süreç başlatma maliyeti kazançtan büyüktür
+PARALLEL_MIN_PIXELS = 1 << 23
+
+# Paralel analizde her işçiye düşen görev sayısı: ilerleme ve iptal bu
+# görevlerin sınırlarında işlenir
+PARALLEL_TASKS_PER_WORKER = 4
+
+# Analiz önbelleği: kullanıcı önbellek dizini altında, boyut tavanı aşılınca
+# en uzun süredir kullanılmayan girdiler silinir
+CACHE_APP_NAME = "bmp-manipulator"
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
+CACHE_FORMAT_VERSION = 2
+
+# Önizleme küçük resimleri: en uzun kenar ve disk önbelleği tavanı
+THUMBNAIL_SIZE = 400
+DEFAULT_THUMBNAIL_CACHE_BYTES = 64 * 1024 * 1024
+
+# Desteklenen piksel derinlikleri ve sıkıştırma yöntemleri
+SUPPORTED_BIT_DEPTHS = (1, 4, 8, 16, 24, 32)
+BI_RGB = 0
+BI_BITFIELDS = 3
+BI_ALPHABITFIELDS = 6
+SUPPORTED_COMPRESSIONS = (BI_RGB, BI_BITFIELDS, BI_ALPHABITFIELDS)
+
+# BI_RGB için varsayılan kanal maskeleri (kırmızı, yeşil, mavi, alfa);
+# 32-bit BI_RGB'de dördüncü bayt alfa olarak korunur
+DEFAULT_MASKS = {
+    16: (0x7C00, 0x03E0, 0x001F, 0),
+    32: (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000),
+}
+
+# Yaklaşık analiz ayarları: HyperLogLog 2^14 yazmaç (~%0.8 standart hata),
+# count-min sketch 4 x 2^16 sayaç (2 MB), izlenen aday renk sayısı top_k'nın katı
+DEFAULT_HLL_PRECISION = 14
+DEFAULT_SKETCH_WIDTH = 1 << 16
+DEFAULT_SKETCH_DEPTH = 4
+DEFAULT_APPROX_TOP_K = 100
+CANDIDATE_FACTOR = 4
+# Aday sık renkler her banttan bu kadar rastgele piksel örneklenerek bulunur
+CANDIDATE_SAMPLE_PIXELS = 1 << 16
+
+
+class AnalysisCancelled(Exception):
+    """Analiz, iptal isteği üzerine bir bant sınırında durduruldu."""
+    pass
+
+
+def _checkpoint(progress, cancel, rows_done, rows_total):
+    """
+    Bant sınırında iptal isteğini denetler ve ilerlemeyi bildirir.
+
+    Args:
+        progress (callable): progress(işlenen satır, toplam satır) veya None
+        cancel (threading.Event): is_set() True dönerse analiz durur; veya None
+        rows_done (int): Şimdiye kadar işlenen satır sayısı
+        rows_total (int): İşlenecek toplam satır sayısı
+    """
+    if cancel is not None and cancel.is_set():
+        raise AnalysisCancelled("Analiz iptal edildi")
+
+    if progress is not None:
+        progress(rows_done, rows_total)
+
+
+def read_bmp_header(file_path):
+    """
+    BMP dosyasının header bilgilerini okur ve görüntü boyutlarını döndürür.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+
+    Returns:
+        tuple: (genişlik, yükseklik, veri başlangıç offseti, bit derinliği)
+    """
+    with open(file_path, 'rb') as f:
+        # BMP header (14 bytes)
+        header = f.read(14)
+        if len(header) < 14:
+            raise ValueError("Geçersiz BMP dosyası: Header eksik")
+
+        # BMP imzasını kontrol et
+        if header[0:2] != b'BM':
+            raise ValueError("Geçersiz BMP dosyası: BM imzası bulunamadı")
+
+        # Veri offsetini al (piksel verisinin başladığı yer)
+        data_offset = struct.unpack('<I', header[10:14])[0]
+
+        # DIB header boyutu bilgisini al
+        dib_header_size = struct.unpack('<I', f.read(4))[0]
+
+        # DIB header'ı oku (boyutu değişebilir)
+        f.seek(14)  # BMP header sonrasına git
+        dib_header = f.read(dib_header_size)
+
+        # Görüntü bilgilerini al (BITMAPCOREHEADER'da boyutlar 16-bit'tir)
+        if dib_header_size == 12:
+            width, height, _, bit_depth = struct.unpack('<HhHH', dib_header[4:12])
+        else:
+            width = struct.unpack('<i', dib_header[4:8])[0]
+            height = struct.unpack('<i', dib_header[8:12])[0]
+            bit_depth = struct.unpack('<H', dib_header[14:16])[0]
+
+    return width, height, data_offset, bit_depth
+
+
+class PixelFormat:
+    """
+    Ham piksel değerlerini RGB renk kodlarına çevirmek için gereken başlık bilgileri.
+
+    Histogram ham piksel değerleri (palet indeksi, 16/32-bit tamsayı veya
+    paketlenmiş BGR) üzerinden çıkarılır; colors() yalnızca bulunan
+    benzersiz değerlere uygulanır. Paletli görüntülerde renk tablosu,
+    16-bit ve bit alanlı görüntülerde maske/kaydırma kullanılır. Sonuç
+    kodları 0xAARRGGBB biçimindedir; alfa yalnızca has_alpha ise anlamlıdır.
+    """
+
+    def __init__(self, width, height, data_offset, bit_depth, compression=BI_RGB, palette=None, masks=None):
+        self.width = width
+        self.height = height
+        self.data_offset = data_offset
+        self.bit_depth = bit_depth
+        self.compression = compression
+        # Paletli görüntülerde 2^bit_depth girdilik 0x00RRGGBB kod tablosu
+        self.palette = palette
+        # 16/32-bit için (kırmızı, yeşil, mavi, alfa) maskeleri
+        self.masks = masks
+
+    @property
+    def has_alpha(self):
+        return self.masks is not None and self.masks[3] != 0
+
+    @property
+    def color_depth(self):
+        """Renk kodlarının derinliği: alfa kanalı varsa 32, yoksa 24."""
+        return 32 if self.has_alpha else 24
+
+    @property
+    def identity(self):
+        """Ham değer zaten 0xAARRGGBB renk kodu mu?"""
+        return self.bit_depth == 24 or (self.bit_depth == 32 and self.masks == DEFAULT_MASKS[32])
+
+    def colors(self, values):
+        """
+        Ham piksel değerlerini renk kodlarına çevirir.
+
+        Args:
+            values (np.ndarray): Ham piksel değerleri
+
+        Returns:
+            np.ndarray: uint32 renk kodları
+        """
+        values = np.asarray(values, dtype=np.uint32)
+
+        if self.palette is not None:
+            return self.palette[values]
+
+        if self.identity:
+            return values
+
+        codes = np.zeros(values.shape, dtype=np.uint32)
+        for mask, shift in zip(self.masks, (16, 8, 0, 24)):
+            if not mask:
+                continue
+            low = (mask & -mask).bit_length() - 1
+            maximum = mask >> low
+            channel = (values & np.uint32(mask)) >> np.uint32(low)
+            # Kanalı 8 bite ölçekle (5 bit -> 0..255 vb.)
+            channel = (channel.astype(np.uint64) * 255 + maximum // 2) // maximum
+            codes |= channel.astype(np.uint32) << np.uint32(shift)
+        return codes
+
+    def convert_histogram(self, values, counts):
+        """
+        Ham değer histogramını renk kodu histogramına çevirir.
+
+        Farklı ham değerler aynı renge düşebilir (tekrarlı palet girdileri,
+        maske dışı bitler); bu durumda sayılar birleştirilir.
+
+        Returns:
+            tuple: (artan sıralı renk kodları, sayılar)
+        """
+        if self.identity:
+            return values, counts
+
+        codes, inverse = np.unique(self.colors(values), return_inverse=True)
+        counts = np.bincount(inverse.reshape(-1), weights=counts, minlength=codes.size)
+        return codes, counts.astype(np.int64)
+
+
+def read_pixel_format(file_path):
+    """
+    BMP başlığından piksel biçimini (palet, maskeler, sıkıştırma) okur.
+
+    Renk tablosu, BMPFile.palette ile aynı bölgeden (DIB header sonu ile
+    piksel verisi arası) okunur. Bit alanı maskeleri V2+ başlıklarda
+    başlığın içinden, BITMAPINFOHEADER'da başlıktan hemen sonra okunur.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+
+    Returns:
+        PixelFormat: Piksel biçimi
+
+    Raises:
+        ValueError: Desteklenmeyen bit derinliği veya sıkıştırma (RLE, JPEG, PNG)
+    """
+    width, height, data_offset, bit_depth = read_bmp_header(file_path)
+
+    if bit_depth not in SUPPORTED_BIT_DEPTHS:
+        raise ValueError(f"Desteklenmeyen bit derinliği: {bit_depth}")
+
+    with open(file_path, 'rb') as f:
+        f.seek(14)
+        dib_header_size = struct.unpack('<I', f.read(4))[0]
+        f.seek(14)
+        dib_header = f.read(dib_header_size)
+        compression = struct.unpack('<I', dib_header[16:20])[0] if dib_header_size >= 20 else BI_RGB
+        colors_used = struct.unpack('<I', dib_header[32:36])[0] if dib_header_size >= 36 else 0
+
+        if compression not in SUPPORTED_COMPRESSIONS or (compression != BI_RGB and bit_depth not in (16, 32)):
+            raise ValueError(f"Desteklenmeyen sıkıştırma yöntemi: {compression} ({bit_depth}-bit)")
+
+        palette = None
+        masks = DEFAULT_MASKS.get(bit_depth)
+
+        if compression != BI_RGB:
+            mask_count = 4 if compression == BI_ALPHABITFIELDS else 3
+            if dib_header_size >= 52:
+                fields = dib_header[40:56 if dib_header_size >= 56 else 52]
+            else:
+                fields = f.read(4 * mask_count)
+            fields = fields[:len(fields) // 4 * 4]
+            masks = (struct.unpack(f'<{len(fields) // 4}I', fields) + (0, 0, 0, 0))[:4]
+
+        if bit_depth <= 8:
+            # BITMAPCOREHEADER paleti 3 baytlık BGR, diğerleri 4 baytlık BGRX girdilerdir
+            entry_size = 3 if dib_header_size == 12 else 4
+            count = min(colors_used or (1 << bit_depth), 1 << bit_depth)
+            palette_start = 14 + dib_header_size
+            count = max(0, min(count, (data_offset - palette_start) // entry_size))
+
+            f.seek(palette_start)
+            table = np.frombuffer(f.read(count * entry_size), dtype=np.uint8)
+            table = table[:len(table) // entry_size * entry_size].reshape(-1, entry_size).astype(np.uint32)
+
+            # Tabloda olmayan indeksler siyah kabul edilir
+            palette = np.zeros(1 << bit_depth, dtype=np.uint32)
+            palette[:len(table)] = (table[:, 2] << 16) | (table[:, 1] << 8) | table[:, 0]
+            masks = None
+
+    return PixelFormat(width, height, data_offset, bit_depth, compression, palette, masks)
+
+
+def pixel_rows(file_path, pixel_format=None):
+    """
+    Piksel bloğunu satır dolgusu dahil (satır, satır boyutu) biçiminde eşler.
+
+    Dosya beklenenden kısaysa yalnızca tam okunabilen satırlar döndürülür.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        pixel_format (PixelFormat): Önceden okunmuş piksel biçimi (None ise okunur)
+
+    Returns:
+        tuple: (np.memmap satır dizisi, genişlik, bit derinliği)
+    """
+    pixel_format = pixel_format or read_pixel_format(file_path)
+    width, height = pixel_format.width, pixel_format.height
+    data_offset, bit_depth = pixel_format.data_offset, pixel_format.bit_depth
+
+    row_size = ((width * bit_depth + 31) // 32) * 4  # Her satır 4 byte'a göre hizalanır
+    available = max(0, os.path.getsize(file_path) - data_offset) // row_size if row_size else 0
+    rows = min(abs(height), available)
+
+    if rows == 0:
+        return np.zeros((0, row_size), dtype=np.uint8), width, bit_depth
+
+    mapped = np.memmap(file_path, dtype=np.uint8, mode='r', offset=data_offset, shape=(rows, row_size))
+    return mapped, width, bit_depth
+
+
+def pack_colors(rows, width, bit_depth):
+    """
+    Satır bandındaki pikselleri ham piksel değerlerine paketler.
+
+    24/32-bit için değer, BGR(A) baytlarının küçük sonlu (little-endian)
+    tamsayı değeridir: 0xAARRGGBB. 1/4/8-bit için palet indeksi, 16-bit
+    için ham piksel değeridir; gerçek renge PixelFormat.colors ile çevrilir.
+
+    Args:
+        rows (np.ndarray): (satır, satır boyutu) uint8 dizisi
+        width (int): Piksel olarak genişlik
+        bit_depth (int): Piksel başına bit
+
+    Returns:
+        np.ndarray: Tek boyutlu renk kodu dizisi
+    """
+    if bit_depth == 1:
+        # En anlamlı bit en soldaki pikseldir
+        return np.unpackbits(rows, axis=1)[:, :width].reshape(-1)
+
+    if bit_depth == 4:
+        indices = np.empty((rows.shape[0], rows.shape[1] * 2), dtype=np.uint8)
+        indices[:, 0::2] = rows >> 4
+        indices[:, 1::2] = rows & 0x0F
+        return indices[:, :width].reshape(-1)
+
+    bytes_per_pixel = bit_depth // 8
+    pixels = rows[:, :width * bytes_per_pixel]
+
+    if bit_depth == 8:
+        return pixels.reshape(-1)
+
+    if bit_depth == 24:
+        return _pack_bgr(np.ascontiguousarray(rows), width)
+
+    # 16 ve 32-bit: satır içindeki baytları doğrudan tamsayı olarak yorumla
+    dtype = np.dtype('<u2') if bit_depth == 16 else np.dtype('<u4')
+    return np.ascontiguousarray(pixels).view(dtype).reshape(-1)
+
+
+def _pack_bgr(rows, width):
+    """
+    24-bit satırları tek geçişte 0x00RRGGBB kodlarına çevirir.
+
+    Her piksel, 3 bayt adımla ilerleyen 4 baytlık hizasız bir uint32
+    görünümüyle okunur ve sonraki pikselin baytı maskelenir. Satırın son
+    pikseli satır (veya dosya) sınırını aşmamak için ayrıca paketlenir.
+    """
+    count, row_size = rows.shape
+    codes = np.empty((count, width), dtype=np.uint32)
+
+    if width > 1:
+        words = np.ndarray((count, width - 1), dtype='<u4', buffer=rows, strides=(row_size, 3))
+        np.bitwise_and(words, 0xFFFFFF, out=codes[:, :-1])
+
+    last = rows[:, (width - 1) * 3:width * 3].astype(np.uint32)
+    codes[:, -1] = last[:, 0] | (last[:, 1] << 8) | (last[:, 2] << 16)
+    return codes.reshape(-1)
+
+
+def color_histogram(file_path, band_pixels=DEFAULT_BAND_PIXELS, workers=1, progress=None, cancel=None):
+    """
+    Dosyanın renk histogramını renk kodları ve sayıları olarak döndürür.
+
+    Piksel bloğu band_pixels sınırını aşmayan satır bantlarıyla işlenir;
+    bellekte aynı anda yalnızca bir bandın kodları ve sayım tablosu bulunur.
+    workers > 1 ise (None: işlemci sayısı) büyük görüntülerin satırları
+    işçi süreçler arasında bölünür; her süreç dosyayı kendisi eşler, piksel
+    baytları süreçler arasında kopyalanmaz ve kısmi histogramlar sonda
+    birleştirilir.
+
+    Her bant (paralel analizde her görev) bittiğinde progress(işlenen satır,
+    toplam satır) çağrılır; cancel.is_set() True olursa bir sonraki sınırda
+    AnalysisCancelled yükseltilir ve ara tablolar serbest bırakılır.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        band_pixels (int): Bir bantta işlenecek en fazla piksel sayısı
+        workers (int): İşçi süreç sayısı
+        progress (callable): İlerleme bildirimi
+        cancel (threading.Event): İptal isteği
+
+    Sayım ham piksel değerleri üzerinden yapılır; bulunan benzersiz değerler
+    sonda piksel biçimine göre RGB(A) renk kodlarına çevrilir.
+
+    Returns:
+        tuple: (toplam piksel sayısı, artan sıralı renk kodları, sayılar, renk kodu derinliği)
+    """
+    pixel_format = read_pixel_format(file_path)
+    rows, width, bit_depth = pixel_rows(file_path, pixel_format)
+    row_count = rows.shape[0]
+    total_pixels = row_count * width
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, row_count)
+
+    if workers > 1 and total_pixels >= PARALLEL_MIN_PIXELS:
+        codes, counts = _parallel_histogram(file_path, row_count, bit_depth, workers, band_pixels,
+                                            progress, cancel)
+    else:
+        codes, counts = _histogram_rows(rows, width, bit_depth, band_pixels, progress, cancel)
+
+    codes, counts = pixel_format.convert_histogram(codes, counts)
+    return total_pixels, codes, counts, pixel_format.color_depth
+
+
+def _histogram_rows(rows, width, bit_depth, band_pixels=DEFAULT_BAND_PIXELS, progress=None, cancel=None,
+                    dense_24=True):
+    """
+    Satır dizisinin ham piksel değeri histogramını bant bant çıkarır.
+
+    dense_24=False ise 24-bit görüntüler büyük olsalar da seyrek yolla
+    sayılır; işçi süreçler 2^24 elemanlı tabloyu ayrı ayrı ayırmaz.
+
+    Returns:
+        tuple: (artan sıralı ham değerler, sayılar)
+    """
+    total_pixels = rows.shape[0] * width
+    band_rows = max(1, band_pixels // max(1, width))
+
+    # Yoğun tablo: 16-bit ve altı her zaman, 24-bit yalnızca büyük görüntülerde
+    if bit_depth <= 16 or (bit_depth == 24 and dense_24 and total_pixels >= DENSE_TABLE_MIN_PIXELS):
+        table_size = 1 << min(bit_depth, 24)
+        table = None
+
+        # Her bant tabloyu bir kez daha toplar; bant kod dizisi tablodan büyük olmadıkça
+        # bantları büyütmek bellek tepesini değiştirmez
+        band_rows = max(band_rows, table_size // max(1, width))
+
+        for start in range(0, rows.shape[0], band_rows):
+            _checkpoint(None, cancel, start, rows.shape[0])
+            codes = pack_colors(rows[start:start + band_rows], width, bit_depth)
+            counts = np.bincount(codes, minlength=table_size)
+            if table is None:
+                table = counts
+            else:
+                table += counts
+            _checkpoint(progress, None, min(start + band_rows, rows.shape[0]), rows.shape[0])
+
+        if table is None:
+            table = np.zeros(table_size, dtype=np.int64)
+
+        codes = np.flatnonzero(table).astype(np.uint32)
+        return codes, table[codes]
+
+    # Seyrek: bant başına np.unique, sonra kısmi histogramları birleştir
+    partial_codes, partial_counts = [], []
+
+    for start in range(0, rows.shape[0], band_rows):
+        _checkpoint(None, cancel, start, rows.shape[0])
+        codes = pack_colors(rows[start:start + band_rows], width, bit_depth)
+        codes, counts = np.unique(codes, return_counts=True)
+        partial_codes.append(codes)
+        partial_counts.append(counts)
+        _checkpoint(progress, None, min(start + band_rows, rows.shape[0]), rows.shape[0])
+
+    return merge_histograms(partial_codes, partial_counts)
+
+
+def _histogram_band(file_path, start, stop, band_pixels):
+    """İşçi süreç: dosyayı kendisi eşler ve [start, stop) satırlarını sayar."""
+    rows, width, bit_depth = pixel_rows(file_path)
+    # 24-bit yoğun tablo (tablo + bincount geçicisi + genişletilmiş bant) süreç başına
+    # yüzlerce MB tutar; işçi sayısıyla çarpılmaması için yalnızca ana süreç tabloya toplar
+    return _histogram_rows(rows[start:stop], width, bit_depth, band_pixels, dense_24=False)
+
+
+def _parallel_histogram(file_path, row_count, bit_depth, workers, band_pixels, progress=None, cancel=None):
+    """
+    Satırları ardışık görevlere böler ve işçi süreçlerde sayar.
+
+    Süreçler "spawn" ile başlatılır: çağıran taraf (örn. GUI) iş parçacıkları
+    çalıştırırken fork güvenli değildir. İşçiler seyrek (kod, sayı)
+    histogramları döndürür; 24-bit yoğun birleştirme tablosu yalnızca ana
+    süreçte bir kez ayrılır. İptalde bekleyen görevler hiç
+    başlatılmaz; çalışmakta olanlar kendi görevlerini bitirir.
+    """
+    tasks = min(row_count, workers * PARALLEL_TASKS_PER_WORKER)
+    bounds = np.linspace(0, row_count, tasks + 1).astype(int)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    rows_done = 0
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(_histogram_band, file_path, int(start), int(stop), band_pixels): int(stop - start)
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start}
+        try:
+            for future in as_completed(futures):
+                results.append(future.result())
+                rows_done += futures[future]
+                _checkpoint(progress, cancel, rows_done, row_count)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    table_size = 1 << bit_depth if bit_depth <= 24 else None
+    return merge_histograms([codes for codes, _ in results], [counts for _, counts in results], table_size)
+
+
+def merge_histograms(partial_codes, partial_counts, table_size=None):
+    """
+    Kısmi (kod, sayı) histogramlarını tek bir sıralı histogramda birleştirir.
+
+    table_size verilirse (kod uzayı küçükse) birleştirme sıralama yerine
+    yoğun bir tabloya toplanarak yapılır.
+
+    Args:
+        partial_codes (list): Renk kodu dizileri (her biri kendi içinde tekil)
+        partial_counts (list): Aynı sıradaki sayı dizileri
+        table_size (int): Kod uzayının boyutu
+
+    Returns:
+        tuple: (artan sıralı renk kodları, sayılar)
+    """
+    if not partial_codes:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.int64)
+
+    if len(partial_codes) == 1:
+        return partial_codes[0], partial_counts[0].astype(np.int64)
+
+    if table_size is not None:
+        table = np.zeros(table_size, dtype=np.int64)
+        for codes, counts in zip(partial_codes, partial_counts):
+            table[codes] += counts
+        codes = np.flatnonzero(table).astype(np.uint32)
+        return codes, table[codes]
+
+    codes, inverse = np.unique(np.concatenate(partial_codes), return_inverse=True)
+    counts = np.bincount(inverse.reshape(-1), weights=np.concatenate(partial_counts), minlength=codes.size)
+    return codes, counts.astype(np.int64)
+
+
+def decode_colors(codes, bit_depth):
+    """
+    Renk kodlarını GUI'nin kullandığı renk anahtarlarına çevirir.
+
+    24-bit için (R, G, B), 32-bit için (R, G, B, A) demetleri; 8 ve 16-bit
+    için ham piksel değeri (tamsayı) döndürülür.
+
+    Args:
+        codes (np.ndarray): Renk kodları
+        bit_depth (int): Piksel başına bit
+
+    Returns:
+        list: Renk anahtarları
+    """
+    codes = np.asarray(codes, dtype=np.uint32)
+
+    if bit_depth not in (24, 32):
+        return codes.tolist()
+
+    channels = [(codes >> 16) & 0xFF, (codes >> 8) & 0xFF, codes & 0xFF]
+    if bit_depth == 32:
+        channels.append(codes >> 24)
+
+    return list(zip(*(channel.tolist() for channel in channels)))
+
+
+def encode_color(color, bit_depth):
+    """
+    decode_colors'ın tersi: renk anahtarını renk koduna çevirir.
+
+    Args:
+        color (tuple | int): (R, G, B[, A]) demeti veya ham piksel değeri
+        bit_depth (int): Piksel başına bit
+
+    Returns:
+        int: Renk kodu
+    """
+    if bit_depth not in (24, 32):
+        return int(color)
+
+    red, green, blue = color[:3]
+    alpha = color[3] if bit_depth == 32 and len(color) > 3 else 0
+    return (alpha << 24) | (red << 16) | (green << 8) | blue
+
+
+class ColorDistribution:
+    """
+    Renk dağılımını kod ve sayı dizileri olarak tutan, Counter benzeri yapı.
+
+    Kodlar artan sıralıdır. most_common(k) tüm tabloyu sıralamaz:
+    np.argpartition ile en büyük k sayı O(n) sürede seçilir, yalnızca bu k
+    girdi sıralanır. Eşit sayılı renkler kodlarına göre sıralanır.
+    """
+
+    def __init__(self, codes, counts, bit_depth):
+        self.codes = np.asarray(codes, dtype=np.uint32)
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.bit_depth = bit_depth
+        self.total = int(self.counts.sum())
+
+    def __len__(self):
+        return int(self.codes.size)
+
+    def __getitem__(self, color):
+        # Counter gibi: bulunmayan (veya bu derinlikte geçersiz) renk için 0
+        try:
+            code = encode_color(color, self.bit_depth)
+        except (TypeError, ValueError):
+            return 0
+
+        index = int(np.searchsorted(self.codes, code))
+        if index < self.codes.size and self.codes[index] == code:
+            return int(self.counts[index])
+        return 0
+
+    def __iter__(self):
+        return iter(decode_colors(self.codes, self.bit_depth))
+
+    def top_indices(self, k):
+        """
+        En sık k rengin dizi indekslerini azalan sayı sırasıyla döndürür.
+
+        Args:
+            k (int): İstenen renk sayısı
+
+        Returns:
+            np.ndarray: İndeks dizisi
+        """
+        size = self.codes.size
+        k = max(0, min(k, size))
+
+        if k == 0:
+            return np.zeros(0, dtype=np.intp)
+
+        if k < size:
+            indices = np.argpartition(self.counts, size - k)[size - k:]
+        else:
+            indices = np.arange(size)
+
+        order = np.lexsort((self.codes[indices], -self.counts[indices]))
+        return indices[order]
+
+    def most_common(self, n=None):
+        """
+        Counter.most_common ile aynı biçimde [(renk, sayı), ...] döndürür.
+
+        Args:
+            n (int): Döndürülecek renk sayısı (None ise tümü)
+
+        Returns:
+            list: Azalan sayı sırasıyla (renk, sayı) çiftleri
+        """
+        indices = self.top_indices(len(self) if n is None else n)
+        return list(zip(decode_colors(self.codes[indices], self.bit_depth), self.counts[indices].tolist()))
+
+    def others_count(self, k):
+        """
+        En sık k renk dışında kalan piksel sayısını döndürür (toplam - ilk k).
+
+        Args:
+            k (int): Ayrı gösterilecek renk sayısı
+
+        Returns:
+            int: Kalan piksel sayısı
+        """
+        return self.total - int(self.counts[self.top_indices(k)].sum())
+
+    def channel_histograms(self):
+        """
+        Kanal başına 256 girdilik piksel histogramlarını döndürür.
+
+        Pikseller yeniden okunmaz: renk histogramındaki her renk, sayısı
+        ağırlık olarak kanal değerine eklenir (O(benzersiz renk)).
+
+        Returns:
+            dict: {"red"|"green"|"blue"[|"alpha"]: np.ndarray (256,) int64}
+        """
+        histograms = {}
+        for name, shift in _channel_shifts(self.bit_depth):
+            values = (self.codes >> np.uint32(shift)) & 0xFF
+            histograms[name] = np.bincount(values, weights=self.counts, minlength=256).astype(np.int64)
+        return histograms
+
+
+def _channel_shifts(bit_depth):
+    """Renk kodundaki kanal adları ve bit kaydırmaları (alfa yalnızca 32-bit kodlarda)."""
+    shifts = [("red", 16), ("green", 8), ("blue", 0)]
+    if bit_depth == 32:
+        shifts.append(("alpha", 24))
+    return shifts
+
+
+def _mix64(values, seed=0):
+    """
+    uint64 dizisini splitmix64 karıştırmasıyla vektörel olarak özetler.
+
+    Args:
+        values (np.ndarray): Renk kodları
+        seed (int): Farklı özet fonksiyonları için tohum
+
+    Returns:
+        np.ndarray: uint64 özet değerleri
+    """
+    with np.errstate(over='ignore'):
+        z = values.astype(np.uint64) + np.uint64((0x9E3779B97F4A7C15 * (seed + 1)) & 0xFFFFFFFFFFFFFFFF)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+class HyperLogLog:
+    """
+    Benzersiz renk sayısını sabit bellekle tahmin eden HyperLogLog sayacı.
+
+    2^precision adet 1 baytlık yazmaç kullanır; tahminin bağıl standart
+    hatası 1.04 / sqrt(2^precision) değerindedir.
+    """
+
+    def __init__(self, precision=DEFAULT_HLL_PRECISION):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"Geçersiz HyperLogLog hassasiyeti: {precision}")
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self):
+        """Tahminin bağıl standart hatası."""
+        return 1.04 / np.sqrt(self.registers.size)
+
+    def add(self, codes):
+        """Renk kodlarını sayaca ekler (tekrarlar sonucu değiştirmez)."""
+        self.add_hashes(_mix64(np.asarray(codes)))
+
+    def add_hashes(self, hashes):
+        """_mix64 ile özetlenmiş kodları sayaca ekler."""
+        if hashes.size == 0:
+            return
+
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+
+        # Sıra: alt 32 bitteki ilk 1 bitinin konumu (hepsi sıfırsa 33)
+        low = (hashes & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        rank = np.full(low.shape, 33, dtype=np.uint8)
+        nonzero = low > 0
+        rank[nonzero] = 32 - np.floor(np.log2(low[nonzero])).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """Başka bir sayacın yazmaçlarını bu sayaca katar."""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self):
+        """Benzersiz değer sayısı tahminini döndürür."""
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        # Küçük kümelerde doğrusal sayım daha isabetlidir
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return float(m * np.log(m / zeros))
+
+        return float(raw)
+
+
+class CountMinSketch:
+    """
+    Renk sıklıklarını sabit bellekle tahmin eden count-min sketch.
+
+    Tahmin hiçbir zaman gerçek değerin altında değildir; en fazla
+    (e / width) * toplam kadar fazladır ve bu sınır 1 - e^-depth olasılıkla
+    geçerlidir.
+    """
+
+    def __init__(self, width=DEFAULT_SKETCH_WIDTH, depth=DEFAULT_SKETCH_DEPTH):
+        if width <= 0 or width & (width - 1) or depth <= 0:
+            raise ValueError(f"Geçersiz sketch boyutu: {width}x{depth} (genişlik 2'nin kuvveti olmalı)")
+
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    @property
+    def epsilon(self):
+        """Toplam sayıya göre bağıl ek hata sınırı."""
+        return np.e / self.width
+
+    @property
+    def confidence(self):
+        """Hata sınırının geçerli olma olasılığı."""
+        return 1 - np.exp(-self.depth)
+
+    def _indices(self, hashes, codes=None):
+        """
+        Her satır için sayaç indekslerini üretir.
+
+        Bir 64 bitlik özet, genişlik bitleri kadar dilime bölünerek birden
+        fazla satıra yeter; özet bitince kodlar farklı tohumla yeniden özetlenir.
+        """
+        bits = self.width.bit_length() - 1
+        per_hash = max(1, 64 // max(1, bits))
+        mask = np.uint64(self.width - 1)
+
+        for row in range(self.depth):
+            seed, slot = divmod(row, per_hash)
+            if slot == 0 and seed > 0:
+                hashes = _mix64(codes, seed)
+            yield ((hashes >> np.uint64(slot * bits)) & mask).astype(np.intp)
+
+    def add(self, codes, counts=None):
+        """Renk kodlarını ekler; counts verilmezse her kod bir kez sayılır."""
+        codes = np.asarray(codes)
+        self.add_hashes(_mix64(codes), codes, counts)
+
+    def add_hashes(self, hashes, codes, counts=None):
+        """_mix64 ile özetlenmiş kodları ekler (codes ek tohumlar için gereklidir)."""
+        for row, index in enumerate(self._indices(hashes, codes)):
+            table = np.bincount(index, weights=counts, minlength=self.width)
+            self.table[row] += table if counts is None else table.astype(np.int64)
+        self.total += int(hashes.size if counts is None else np.sum(counts))
+
+    def merge(self, other):
+        """Aynı boyuttaki başka bir sketch'i bu sketch'e katar."""
+        self.table += other.table
+        self.total += other.total
+
+    def estimate(self, codes):
+        """Renk kodlarının sıklık tahminlerini döndürür."""
+        codes = np.asarray(codes)
+        estimates = None
+        for row, index in enumerate(self._indices(_mix64(codes), codes)):
+            values = self.table[row, index]
+            estimates = values if estimates is None else np.minimum(estimates, values)
+        return estimates
+
+
+class ApproximateDistribution(ColorDistribution):
+    """
+    Yaklaşık analiz sonucu: aday sık renkler ve hata sınırları.
+
+    codes/counts yalnızca izlenen aday renkleri içerir; sayılar örnekleme
+    oranına göre ölçeklenmiş count-min tahminleridir. Aday dışındaki
+    renkler için indeksleme sketch'e sorulur. total kesin piksel sayısı,
+    len() ise benzersiz renk tahminidir.
+
+    error_bounds alanları:
+        unique_error: benzersiz renk tahmininin ~%95 güven aralığı yarıçapı
+        count_error: sıklık tahminlerinin en fazla fazlalığı (sketch)
+        sampling_error: örneklemeden gelen sıklık hatası (~%95, satırlar bağımsız varsayılır)
+        confidence: count_error sınırının geçerli olma olasılığı
+        sample_rate: işlenen satır oranı
+        unique_lower_bound: örnekleme yapıldıysa benzersiz tahmin yalnızca alt sınırdır
+    """
+
+    def __init__(self, codes, counts, bit_depth, total, unique_estimate, error_bounds, sketch=None, scale=1.0,
+                 channel_counts=None):
+        order = np.argsort(codes)
+        super().__init__(np.asarray(codes)[order], np.asarray(counts)[order], bit_depth)
+        self.total = total
+        self.unique_estimate = unique_estimate
+        self.error_bounds = error_bounds
+        self._sketch = sketch
+        self._scale = scale
+        self._channel_counts = channel_counts
+
+    def __len__(self):
+        return int(self.unique_estimate)
+
+    def __getitem__(self, color):
+        count = super().__getitem__(color)
+        if count or self._sketch is None:
+            return count
+
+        try:
+            code = encode_color(color, self.bit_depth)
+        except (TypeError, ValueError):
+            return 0
+
+        return int(self._sketch.estimate(np.array([code], dtype=np.uint32))[0] * self._scale)
+
+    def top_indices(self, k):
+        return super().top_indices(min(k, self.codes.size))
+
+    def channel_histograms(self):
+        # Aday renkler tüm görüntüyü temsil etmez; kanal histogramları tarama sırasında
+        # (örneklenen satırlardan, ölçeklenerek) tutulur
+        if self._channel_counts is None:
+            return super().channel_histograms()
+        return {name: (counts * self._scale).round().astype(np.int64)
+                for name, counts in self._channel_counts.items()}
+
+
+def _sample_rows(row_count, sample_rate, seed=None):
+    """Satırlardan tekdüze rastgele, artan sıralı bir alt küme seçer."""
+    if sample_rate >= 1:
+        return np.arange(row_count)
+
+    if not 0 < sample_rate:
+        raise ValueError(f"Geçersiz örnekleme oranı: {sample_rate}")
+
+    sample_size = max(1, int(round(row_count * sample_rate))) if row_count else 0
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(row_count, size=sample_size, replace=False))
+
+
+def approximate_histogram(file_path, sample_rate=1.0, top_k=DEFAULT_APPROX_TOP_K,
+                          precision=DEFAULT_HLL_PRECISION, sketch_width=DEFAULT_SKETCH_WIDTH,
+                          sketch_depth=DEFAULT_SKETCH_DEPTH, band_pixels=DEFAULT_BAND_PIXELS, seed=None,
+                          progress=None, cancel=None):
+    """
+    Renk dağılımını sabit bellek tavanıyla yaklaşık olarak çıkarır.
+
+    Benzersiz renk sayısı HyperLogLog ile, sıklıklar count-min sketch ile
+    tahmin edilir; her bantta en sık renkler aday olarak izlenir ve
+    aday kümesi top_k * CANDIDATE_FACTOR ile sınırlanır. sample_rate < 1
+    ise satırların yalnızca bu oranı (tekdüze rastgele) işlenir ve sayılar
+    ölçeklenir. Bellek kullanımı görüntüdeki renk sayısından bağımsızdır:
+    yazmaçlar, sketch tablosu ve bir bandın kodları. Paletli ve 16-bit
+    görüntülerde benzersiz sayı ham piksel değerleri üzerinden tahmin edilir.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        sample_rate (float): İşlenecek satır oranı (0-1]
+        top_k (int): Raporlanacak sık renk sayısı
+        precision (int): HyperLogLog hassasiyeti (yazmaç sayısı 2^precision)
+        sketch_width (int): Count-min sketch genişliği (2'nin kuvveti)
+        sketch_depth (int): Count-min sketch derinliği
+        band_pixels (int): Bir bantta işlenecek en fazla piksel sayısı
+        seed (int): Örnekleme için rastgele tohum
+        progress (callable): progress(işlenen satır, işlenecek satır)
+        cancel (threading.Event): İptal isteği (bkz. color_histogram)
+
+    Returns:
+        ApproximateDistribution: Tahminler ve hata sınırları
+    """
+    pixel_format = read_pixel_format(file_path)
+    rows, width, bit_depth = pixel_rows(file_path, pixel_format)
+    row_count = rows.shape[0]
+    selected = _sample_rows(row_count, sample_rate, seed)
+    band_rows = max(1, band_pixels // max(1, width))
+    capacity = max(1, top_k * CANDIDATE_FACTOR)
+
+    hll = HyperLogLog(precision)
+    sketch = CountMinSketch(sketch_width, sketch_depth)
+    candidates = np.zeros(0, dtype=np.uint32)
+    shifts = _channel_shifts(pixel_format.color_depth)
+    channel_counts = {name: np.zeros(256, dtype=np.int64) for name, _ in shifts}
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, selected.size, band_rows):
+        _checkpoint(None, cancel, start, selected.size)
+        band = selected[start:start + band_rows]
+        # Tam analizde bantlar ardışıktır; dilimleme kopya oluşturmaz
+        block = rows[band[0]:band[-1] + 1] if sample_rate >= 1 else rows[band]
+        codes = pack_colors(block, width, bit_depth)
+
+        hashes = _mix64(codes)
+        hll.add_hashes(hashes)
+        sketch.add_hashes(hashes, codes)
+
+        # Kanal histogramları aynı bant üzerinden, 256 girdilik sayaçlarla
+        colors = pixel_format.colors(codes)
+        for name, shift in shifts:
+            channel_counts[name] += np.bincount((colors >> np.uint32(shift)) & 0xFF, minlength=256)
+
+        # Sık renkler küçük rastgele bir piksel örneğinde de sık görünür: örneğin en sık
+        # renkleri aday kümesine katılır, küme sketch tahminine göre budanır
+        if codes.size > CANDIDATE_SAMPLE_PIXELS:
+            codes = codes[rng.integers(0, codes.size, CANDIDATE_SAMPLE_PIXELS)]
+        codes, counts = np.unique(codes, return_counts=True)
+        if codes.size > capacity:
+            codes = codes[np.argpartition(counts, codes.size - capacity)[codes.size - capacity:]]
+        candidates = np.union1d(candidates, codes.astype(np.uint32))
+
+        if candidates.size > capacity:
+            estimates = sketch.estimate(candidates)
+            candidates = candidates[np.argpartition(estimates, candidates.size - capacity)[candidates.size - capacity:]]
+
+        _checkpoint(progress, None, start + band.size, selected.size)
+
+    total_pixels = row_count * width
+    sampled_pixels = selected.size * width
+    scale = row_count / selected.size if selected.size else 1.0
+
+    unique_estimate = hll.estimate() if sampled_pixels else 0.0
+    # Benzersiz renk sayısı örneklenen piksel sayısını aşamaz
+    unique_estimate = min(unique_estimate, sampled_pixels)
+
+    sampling_error = 0.0
+    if sample_rate < 1 and sampled_pixels:
+        # En kötü durum (p = 0.5) oran hatası, sonlu kitle düzeltmesiyle
+        sampling_error = 2 * total_pixels * np.sqrt(0.25 / sampled_pixels * (1 - selected.size / row_count))
+
+    error_bounds = {
+        'unique_error': float(2 * hll.relative_error * unique_estimate),
+        'count_error': float(sketch.epsilon * sketch.total * scale),
+        'sampling_error': float(sampling_error),
+        'confidence': float(sketch.confidence),
+        'sample_rate': selected.size / row_count if row_count else 1.0,
+        'unique_lower_bound': sample_rate < 1,
+    }
+
+    counts = (sketch.estimate(candidates) * scale).round().astype(np.int64)
+
+    # Sketch ham değerleri tutar; ham değer renk kodu değilse adaylar dönüştürülür
+    # ve aday dışı renkler için sketch'e sorulamaz
+    if not pixel_format.identity:
+        candidates, counts = pixel_format.convert_histogram(candidates, counts)
+        sketch = None
+
+    return ApproximateDistribution(candidates, counts, pixel_format.color_depth, total_pixels, unique_estimate,
+                                   error_bounds, sketch, scale, channel_counts)
+
+
+def user_cache_dir(*parts):
+    """
+    Platformun kullanıcı önbellek dizini altında bir yol döndürür.
+
+    Windows'ta %LOCALAPPDATA%, macOS'ta ~/Library/Caches, diğerlerinde
+    $XDG_CACHE_HOME (varsayılan ~/.cache) kullanılır.
+
+    Args:
+        parts (str): Uygulama dizini altındaki alt dizinler
+
+    Returns:
+        str: Dizin yolu (oluşturulmaz)
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(base, CACHE_APP_NAME, *parts)
+
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """Dosya içeriğinin SHA-256 özetini parça parça okuyarak hesaplar."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Kesin analiz sonuçlarının disk önbelleği.
+
+    Anahtar dosyanın mutlak yolu, boyutu ve değiştirilme zamanıdır (ns).
+    Her girdi sıkıştırılmamış bir .npz dosyasıdır: renk kodları, sayılar,
+    toplam piksel sayısı ve başlık özeti. verify_content=True ise içerik
+    SHA-256 özeti de saklanır ve her okumada yeniden doğrulanır. Okunan
+    girdinin zaman damgası güncellenir; toplam boyut max_bytes'ı aşınca
+    en eski girdiler silinir (LRU). Bozuk girdiler sessizce atılır.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_CACHE_BYTES, verify_content=False):
+        self.directory = directory or user_cache_dir("analysis")
+        self.max_bytes = max_bytes
+        self.verify_content = verify_content
+
+    def key(self, file_path, stat=None):
+        """Dosya kimliğinden (yol, boyut, mtime) önbellek anahtarı üretir."""
+        stat = stat or os.stat(file_path)
+        identity = f"{CACHE_FORMAT_VERSION}|{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, file_path, stat=None):
+        return os.path.join(self.directory, self.key(file_path, stat) + ".npz")
+
+    def snapshot(self, file_path):
+        """
+        Analizden önce dosya kimliğini yakalar; sonuç store'a bununla yazılır.
+
+        Analiz sürerken dosya yeniden yazılırsa eski sonuç yeni kimlikle
+        saklanmamalıdır. Bu yüzden stat bilgisi, başlık özeti ve (gerekirse)
+        içerik özeti analizden önce alınır; store yazmadan önce stat'ın
+        değişmediğini doğrular.
+
+        Args:
+            file_path (str): BMP dosyasının yolu
+
+        Returns:
+            dict: stat, header ve digest anahtarları
+        """
+        stat = os.stat(file_path)
+        return {
+            'stat': stat,
+            'header': read_bmp_header(file_path),
+            'digest': file_digest(file_path) if self.verify_content else None,
+        }
+
+    @staticmethod
+    def _unchanged(file_path, snapshot):
+        """Dosyanın boyutu ve mtime'ı snapshot alındığından beri değişmediyse True."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        before = snapshot['stat']
+        return (stat.st_size, stat.st_mtime_ns) == (before.st_size, before.st_mtime_ns)
+
+    def load(self, file_path):
+        """
+        Dosyanın önbellekteki sonucunu döndürür.
+
+        Args:
+            file_path (str): BMP dosyasının yolu
+
+        Returns:
+            dict: total_pixels, codes, counts, bit_depth, header anahtarları; yoksa None
+        """
+        try:
+            entry = self._entry_path(file_path)
+        except OSError:
+            return None
+
+        if not os.path.exists(entry):
+            return None
+
+        try:
+            with np.load(entry) as data:
+                result = {
+                    'total_pixels': int(data['total_pixels']),
+                    'codes': data['codes'],
+                    'counts': data['counts'],
+                    'bit_depth': int(data['bit_depth']),
+                    'header': tuple(int(value) for value in data['header']),
+                }
+                digest = str(data['digest']) if 'digest' in data.files else ''
+        except Exception:
+            self._remove(entry)
+            return None
+
+        if self.verify_content and digest != file_digest(file_path):
+            self._remove(entry)
+            return None
+
+        # LRU: son kullanım zamanını güncelle
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return result
+
+    def store(self, file_path, total_pixels, codes, counts, bit_depth, snapshot=None):
+        """
+        Dosyanın analiz sonucunu önbelleğe yazar ve boyut tavanını uygular.
+
+        snapshot analizden önce alınmışsa girdi o anki kimlikle yazılır;
+        dosya o zamandan beri değiştiyse hiçbir şey yazılmaz.
+
+        Returns:
+            bool: Girdi yazıldıysa True
+        """
+        if snapshot is None:
+            snapshot = self.snapshot(file_path)
+        elif not self._unchanged(file_path, snapshot):
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        entry = self._entry_path(file_path, snapshot['stat'])
+        temporary = f"{entry}.{os.getpid()}.tmp"
+
+        arrays = {
+            'total_pixels': np.int64(total_pixels),
+            'codes': np.asarray(codes, dtype=np.uint32),
+            'counts': np.asarray(counts, dtype=np.int64),
+            'bit_depth': np.int64(bit_depth),
+            'header': np.asarray(snapshot['header'], dtype=np.int64),
+        }
+        if snapshot['digest'] is not None:
+            arrays['digest'] = np.array(snapshot['digest'])
+
+        try:
+            with open(temporary, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temporary, entry)
+        finally:
+            self._remove(temporary)
+
+        self.prune()
+        return True
+
+    def prune(self):
+        """Toplam boyut max_bytes'ı aşıyorsa en eski girdileri siler."""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".npz")]
+        except OSError:
+            return
+
+        entries = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        """Önbellekteki tüm girdileri siler."""
+        saved = self.max_bytes
+        self.max_bytes = 0
+        try:
+            self.prune()
+        finally:
+            self.max_bytes = saved
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def load_cached_analysis(file_path, cache):
+    """
+    Önbellekteki kesin analiz sonucunu analiz yapmadan döndürür.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        cache (AnalysisCache): Disk önbelleği
+
+    Returns:
+        tuple: ((toplam piksel sayısı, benzersiz renk sayısı, ColorDistribution), başlık) veya None
+    """
+    cached = cache.load(file_path)
+    if cached is None:
+        return None
+
+    distribution = ColorDistribution(cached['codes'], cached['counts'], cached['bit_depth'])
+    return (cached['total_pixels'], len(distribution), distribution), cached['header']
+
+
+def analyze_bmp_colors(file_path, approximate=False, sample_rate=1.0, workers=1, progress=None, cancel=None,
+                       cache=None):
+    """
+    BMP dosyasındaki benzersiz renkleri ve piksel sayısını analiz eder.
+
+    approximate=True ise sayım approximate_histogram ile sabit bellekle
+    yapılır; benzersiz renk sayısı tahmindir ve hata sınırları dağılımın
+    error_bounds alanındadır. cache (AnalysisCache) verilirse kesin analiz
+    sonucu önce önbellekte aranır, yoksa hesaplanıp önbelleğe yazılır.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        approximate (bool): Yaklaşık (sketch tabanlı) analiz
+        sample_rate (float): Yaklaşık analizde işlenecek satır oranı
+        workers (int): Kesin analizde işçi süreç sayısı (None: işlemci sayısı)
+        progress (callable): progress(işlenen satır, işlenecek satır)
+        cancel (threading.Event): İptal isteği; AnalysisCancelled ile sonuçlanır
+        cache (AnalysisCache): Kesin analiz sonuçları için disk önbelleği
+
+    Returns:
+        tuple: (toplam piksel sayısı, benzersiz renk sayısı, ColorDistribution)
+    """
+    if approximate:
+        distribution = approximate_histogram(file_path, sample_rate=sample_rate, progress=progress, cancel=cancel)
+        return distribution.total, int(round(distribution.unique_estimate)), distribution
+
+    if cache is not None:
+        cached = load_cached_analysis(file_path, cache)
+        if cached is not None:
+            return cached[0]
+
+        # Dosya kimliği analizden önce alınır; analiz sırasında dosya değişirse sonuç saklanmaz
+        snapshot = cache.snapshot(file_path)
+
+    total_pixels, codes, counts, bit_depth = color_histogram(file_path, workers=workers,
+                                                             progress=progress, cancel=cancel)
+    if cache is not None:
+        cache.store(file_path, total_pixels, codes, counts, bit_depth, snapshot=snapshot)
+
+    return total_pixels, len(codes), ColorDistribution(codes, counts, bit_depth)
+
+
+def bmp_thumbnail(file_path, max_size=THUMBNAIL_SIZE):
+    """
+    BMP piksel bloğundan yalnızca her N. satır ve sütunu okuyarak küçük resim üretir.
+
+    Görüntü tümüyle çözülmez: bellek eşlemesinden yalnızca seçilen satırlar
+    okunur ve en yakın komşu örneklemesiyle en uzun kenarı max_size'ı
+    aşmayan bir görüntü elde edilir.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        max_size (int): Küçük resmin en uzun kenarı (piksel)
+
+    Returns:
+        np.ndarray: (yükseklik, genişlik, 3) boyutlu, üstten alta RGB uint8 dizisi
+    """
+    pixel_format = read_pixel_format(file_path)
+    rows, width, bit_depth = pixel_rows(file_path, pixel_format)
+
+    step = max(1, -(-max(width, abs(pixel_format.height)) // max_size))
+    row_indices = np.arange(0, len(rows), step)
+    columns = np.arange(0, width, step)
+
+    # Pozitif yükseklik: satırlar alttan üste saklanır
+    if pixel_format.height > 0:
+        row_indices = row_indices[::-1]
+
+    values = pack_colors(rows[row_indices], width, bit_depth).reshape(len(row_indices), width)
+    return color_rgb(pixel_format.colors(values[:, columns]))
+
+
+class ThumbnailCache(AnalysisCache):
+    """
+    Önizleme küçük resimlerinin disk önbelleği.
+
+    AnalysisCache ile aynı dosya kimliği (yol, boyut, mtime) anahtarına
+    küçük resim boyutu eklenir; girdiler ayrı bir dizinde tutulur ve aynı
+    LRU boyut tavanıyla budanır.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_THUMBNAIL_CACHE_BYTES, max_size=THUMBNAIL_SIZE):
+        super().__init__(directory or user_cache_dir("thumbnails"), max_bytes)
+        self.max_size = max_size
+
+    def key(self, file_path, stat=None):
+        return f"{super().key(file_path, stat)}-{self.max_size}"
+
+    def load(self, file_path):
+        """Dosyanın önbellekteki küçük resmini döndürür; yoksa None."""
+        try:
+            entry = self._entry_path(file_path)
+        except OSError:
+            return None
+
+        if not os.path.exists(entry):
+            return None
+
+        try:
+            with np.load(entry) as data:
+                pixels = data['pixels']
+        except Exception:
+            self._remove(entry)
+            return None
+
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+        return pixels
+
+    def store(self, file_path, pixels, snapshot=None):
+        """Küçük resmi önbelleğe yazar; snapshot'tan beri dosya değiştiyse yazmaz."""
+        if snapshot is None:
+            snapshot = self.snapshot(file_path)
+        elif not self._unchanged(file_path, snapshot):
+            return False
+
+        os.makedirs(self.directory, exist_ok=True)
+        entry = self._entry_path(file_path, snapshot['stat'])
+        temporary = f"{entry}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporary, 'wb') as f:
+                np.savez(f, pixels=np.asarray(pixels, dtype=np.uint8))
+            os.replace(temporary, entry)
+        finally:
+            self._remove(temporary)
+
+        self.prune()
+        return True
+
+
+def cached_thumbnail(file_path, cache):
+    """
+    Küçük resmi önbellekten döndürür; yoksa bmp_thumbnail ile üretip önbelleğe yazar.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        cache (ThumbnailCache): Küçük resim önbelleği
+
+    Returns:
+        np.ndarray: (yükseklik, genişlik, 3) boyutlu RGB uint8 dizisi
+    """
+    pixels = cache.load(file_path)
+    if pixels is None:
+        snapshot = cache.snapshot(file_path)
+        pixels = bmp_thumbnail(file_path, cache.max_size)
+        try:
+            cache.store(file_path, pixels, snapshot=snapshot)
+        except OSError:
+            pass
+    return pixels
+
+
+def color_rgb(codes):
+    """
+    Renk kodlarını (..., 3) boyutlu RGB uint8 dizisine çevirir.
+
+    Args:
+        codes (np.ndarray): 0xAARRGGBB renk kodları
+
+    Returns:
+        np.ndarray: Son ekseni (R, G, B) olan dizi
+    """
+    codes = np.asarray(codes, dtype=np.uint32)
+    shifts = np.array([16, 8, 0], dtype=np.uint32)
+    return ((codes[..., None] >> shifts) & 0xFF).astype(np.uint8)
+
+
+def channel_statistics(distribution, histograms=False):
+    """
+    Kanal başına özet istatistikleri kanal histogramlarından hesaplar.
+
+    Her kanal için en küçük/en büyük değer, ortalama, standart sapma,
+    Shannon entropisi (bit) ve bit düzlemlerindeki 1 oranı (bit_planes[0]
+    en düşük anlamlı bit, LSBSteganography'nin değiştirdiği düzlem)
+    döndürülür. Tümü 256 girdilik histogramlar üzerinde vektörel olarak
+    hesaplanır; piksel verisi yeniden taranmaz.
+
+    Args:
+        distribution (ColorDistribution): Renk dağılımı
+        histograms (bool): Kanal histogramlarını da ekle
+
+    Returns:
+        dict: {"red"|"green"|"blue"[|"alpha"]: {"min", "max", "mean", "std", "entropy", "bit_planes"[, "histogram"]}}
+    """
+    channels = {}
+    values = np.arange(256, dtype=np.float64)
+    # (256, 8): her değerin bit düzlemlerindeki bitleri
+    bits = (np.arange(256)[:, None] >> np.arange(8)) & 1
+
+    for name, counts in distribution.channel_histograms().items():
+        total = counts.sum()
+        if not total:
+            continue
+
+        probabilities = counts / total
+        present = np.flatnonzero(counts)
+        mean = float(np.dot(values, probabilities))
+        variance = float(np.dot((values - mean) ** 2, probabilities))
+        nonzero = probabilities[present]
+
+        channels[name] = {
+            'min': int(present[0]),
+            'max': int(present[-1]),
+            'mean': round(mean, 4),
+            'std': round(variance ** 0.5, 4),
+            'entropy': round(abs(float(np.dot(nonzero, np.log2(nonzero)))), 4),
+            'bit_planes': [round(float(ratio), 4) for ratio in probabilities @ bits],
+        }
+        if histograms:
+            channels[name]['histogram'] = counts.tolist()
+
+    return channels
+
+
+def find_bmp_files(paths, recursive=False):
+    """
+    Dosya, dizin ve glob desenlerini BMP dosyası listesine açar.
+
+    Açma kuralları toplu işlemle (batch) ortaktır: paths.iter_bmp_files. Dizinlerden yalnızca .bmp uzantılı dosyalar alınır;
+    doğrudan verilen dosyalar uzantısına bakılmadan eklenir. Sıra korunur,
+    tekrarlar atılır.
+
+    Args:
+        paths (list): Dosya, dizin veya glob desenleri
+        recursive (bool): Dizinlerde alt dizinlere de in; desenlerde ** kullanılabilir
+
+    Returns:
+        list: Dosya yolları
+    """
+    return list(dict.fromkeys(iter_bmp_files(paths, recursive)))
+
+
+def analysis_report(file_path, top_k=10, approximate=False, sample_rate=1.0, workers=1, cache=None,
+                    channel_histograms=False):
+    """
+    Bir BMP dosyasının analizini JSON'a yazılabilir bir sözlük olarak döndürür.
+
+    Yaklaşık analizde kanal istatistikleri örneklenen satırlardan gelir ve
+    hata sınırları "error_bounds" alanına eklenir.
+
+    Args:
+        file_path (str): BMP dosyasının yolu
+        top_k (int): Listelenecek en sık renk sayısı
+        approximate (bool): Yaklaşık (sketch tabanlı) analiz
+        sample_rate (float): Yaklaşık analizde işlenecek satır oranı
+        workers (int): Kesin analizde işçi süreç sayısı (None: işlemci sayısı)
+        cache (AnalysisCache): Kesin analiz sonuçları için disk önbelleği
+        channel_histograms (bool): Kanal histogramlarını (256 değer) da ekle
+
+    Returns:
+        dict: file, header, total_pixels, unique_colors, approximate, top_colors, channels
+    """
+    width, height, data_offset, bit_depth = read_bmp_header(file_path)
+    total_pixels, unique_colors, distribution = analyze_bmp_colors(
+        file_path, approximate, sample_rate, workers=workers, cache=cache)
+
+    indices = distribution.top_indices(top_k)
+    rgb = color_rgb(distribution.codes[indices])
+
+    top_colors = []
+    for code, count, (red, green, blue) in zip(distribution.codes[indices].tolist(),
+                                               distribution.counts[indices].tolist(), rgb.tolist()):
+        entry = {
+            'hex': f"#{red:02X}{green:02X}{blue:02X}",
+            'rgb': [red, green, blue],
+            'count': count,
+            'percent': round(count / total_pixels * 100, 4) if total_pixels else 0.0,
+        }
+        if distribution.bit_depth == 32:
+            entry['alpha'] = code >> 24
+        top_colors.append(entry)
+
+    report = {
+        'file': file_path,
+        'header': {
+            'width': width,
+            'height': abs(height),
+            'top_down': height < 0,
+            'bit_depth': bit_depth,
+            'data_offset': data_offset,
+            'file_size': os.path.getsize(file_path),
+        },
+        'total_pixels': total_pixels,
+        'unique_colors': unique_colors,
+        'approximate': bool(approximate),
+        'top_colors': top_colors,
+        'channels': channel_statistics(distribution, histograms=channel_histograms),
+    }
+
+    if approximate:
+        report['error_bounds'] = distribution.error_bounds
+
+    return report
@@ -0,0 +1,632 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BMP Manipülatörü komut satırı arayüzü.
+
+Tek dosyalık komutlar (info, metadata, stego, analyze), toplu işlem
+(batch) ve şifre hız ölçümü. Ağır bağımlılıklar (cryptography, numpy,
+renk analizi motoru) yalnızca onları kullanan komutlarda yüklenir.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Dict, List, Optional, Any, Iterator
+
+from . import profiling
+from .paths import iter_bmp_files
+from .core import (
+    BMPError, BMPFile, Keyring, LSBSteganography, Metadata, benchmark_ciphers,
+    CIPHERS, DEFAULT_CIPHER, DEFAULT_LSB_DEPTH, DEFAULT_LSB_CHANNELS, DEFAULT_LSB_ENGINE,
+    DEFAULT_SEGMENT_SIZE, LSB_ENGINES,
+)
+
+# Toplu işlem (batch): desteklenen işlemler ve işçilere tek seferde verilen dosya sayısı
+BATCH_OPERATIONS = ("info", "metadata-add", "metadata-extract", "stego-hide", "stego-extract", "analyze")
+BATCH_CHUNK_SIZE = 8
+
+
+def _analysis():
+    """Renk analizi motorunu (analysis, numpy gerektirir) ilk kullanımda yükler."""
+    try:
+        from . import analysis
+    except ModuleNotFoundError as e:
+        # Yalnızca eksik numpy kullanıcı hatasıdır; diğer içe aktarma hataları olduğu gibi iletilir
+        if e.name != "numpy":
+            raise
+        raise BMPError("Renk analizi için numpy gereklidir (pip install numpy)")
+    return analysis
+
+
+def iter_batch_paths(paths: List[str], manifest: Optional[str] = None,
+                     recursive: bool = False) -> Iterator[str]:
+    """Dosya, dizin, glob deseni ve manifest girdilerinden BMP yollarını akış olarak üretir.
+    
+    Yollar analyze komutuyla aynı kurallarla açılır (paths.iter_bmp_files).
+    Manifest her satırda bir yol içerir ("-" standart girdi); boş satırlar
+    ve # ile başlayan satırlar atlanır. analyze'ın aksine yollar listeye
+    toplanmaz ve tekrarlar ayıklanmaz: yüz binlerce dosyalık işler ilk
+    yol bulunur bulunmaz başlar ve bellek kullanımı dosya sayısıyla büyümez.
+    """
+    yield from iter_bmp_files(paths, recursive)
+    
+    if manifest:
+        source = sys.stdin if manifest == "-" else open(manifest, "r", encoding="utf-8")
+        try:
+            for line in source:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield line
+        finally:
+            if source is not sys.stdin:
+                source.close()
+
+
+# Her işçi süreçte bir kez kurulan durum: seçenekler ve (varsa) anahtarlık
+_BATCH_WORKER: Dict[str, Any] = {}
+
+
+def _batch_init(options: Dict[str, Any]) -> None:
+    """İşçi süreci hazırlar: anahtarlık modunda PBKDF2 işçi başına bir kez çalışır."""
+    keyring = None
+    if options.get("keyring") and options.get("password"):
+        keyring = Keyring(options["password"], options.get("master_salt"))
+    
+    _BATCH_WORKER["options"] = options
+    _BATCH_WORKER["keyring"] = keyring
+    _BATCH_WORKER["cache"] = None
+    
+    if options["operation"] == "analyze" and not options.get("no_cache"):
+        _BATCH_WORKER["cache"] = _analysis().AnalysisCache()
+
+
+def _batch_output_path(file_path: str, options: Dict[str, Any], suffix: str = "") -> str:
+    """Çıktı dizini verilmişse dosyanın oradaki karşılığını, yoksa dosyanın kendisini döndürür."""
+    if options.get("output_dir"):
+        return os.path.join(options["output_dir"], os.path.basename(file_path) + suffix)
+    return file_path + suffix if suffix else file_path
+
+
+def _batch_info(file_path: str, options: Dict[str, Any], keyring: Optional[Keyring]) -> Dict[str, Any]:
+    if options.get("fast"):
+        return BMPFile.probe(file_path)
+    
+    with BMPFile(file_path, use_mmap=True, keyring=keyring) as bmp:
+        return bmp.get_info()
+
+
+def _add_metadata_entry(file_path: str, key: str, value: str, output_path: Optional[str] = None,
+                       password: Optional[str] = None, cipher: str = DEFAULT_CIPHER,
+                       keyring: Optional[Keyring] = None, atomic: bool = False, use_mmap: bool = False) -> bool:
+    """Dosyanın metadata'sına bir giriş ekler; dosya yerinde güncellendiyse True döndürür.
+    
+    Çıktı kaynak dosyanın kendisiyse yalnızca başlıklar ve metadata bloğu
+    okunur, yeni blok BMPFile.update_metadata ile dosya sonuna yazılır.
+    Farklı bir çıktı dosyasında görüntü yüklenip save ile kopyalanır.
+    """
+    output_path = output_path or file_path
+    in_place = os.path.exists(output_path) and os.path.samefile(output_path, file_path)
+    
+    if in_place:
+        bmp = BMPFile(keyring=keyring)
+        bmp.load_headers(file_path)
+    else:
+        bmp = BMPFile(file_path, use_mmap=use_mmap, keyring=keyring)
+    
+    with bmp:
+        # Mevcut metadata'yı yükle (şifreliyse aynı parolayla çöz) veya yeni oluştur
+        metadata = bmp.extract_metadata(password=password) or Metadata()
+        metadata.add(key, value)
+        bmp.add_metadata(metadata, password=password, cipher=cipher)
+        
+        if in_place:
+            bmp.update_metadata(atomic=atomic)
+        else:
+            bmp.save(output_path)
+    
+    return in_place
+
+
+def _batch_metadata_add(file_path: str, options: Dict[str, Any], keyring: Optional[Keyring]) -> Dict[str, Any]:
+    output_path = _batch_output_path(file_path, options)
+    in_place = _add_metadata_entry(file_path, options["key"], options["value"], output_path,
+                                  password=options.get("password"), cipher=options["cipher"],
+                                  keyring=keyring, atomic=options.get("atomic", False))
+    return {"output": output_path, "in_place": in_place}
+
+
+def _batch_metadata_extract(file_path: str, options: Dict[str, Any], keyring: Optional[Keyring]) -> Dict[str, Any]:
+    with BMPFile(file_path, use_mmap=True, keyring=keyring) as bmp:
+        metadata = bmp.extract_metadata(password=options.get("password"))
+    return {"metadata": dict(metadata.entries) if metadata else None}
+
+
+def _batch_stego_hide(file_path: str, options: Dict[str, Any], keyring: Optional[Keyring]) -> Dict[str, Any]:
+    output_path = _batch_output_path(file_path, options)
+    hide_options = dict(bit_depth=options["bit_depth"], channels=options["channels"],
+                        password=options.get("password"), engine=options["engine"], cipher=options["cipher"])
+    
+    if options.get("hide_file"):
+        with BMPFile(file_path, use_mmap=True, keyring=keyring) as bmp:
+            with open(options["hide_file"], "rb") as f:
+                hidden = LSBSteganography(bmp, keyring=keyring).hide_stream(f, output_path, **hide_options)
+        return {"output": output_path, "hidden_bytes": hidden}
+    
+    bmp = BMPFile(file_path, keyring=keyring)
+    LSBSteganography(bmp, keyring=keyring).hide_text(options["text"], **hide_options)
+    bmp.save(output_path)
+    return {"output": output_path, "hidden_bytes": len(options["text"].encode("utf-8"))}
+
+
+def _batch_stego_extract(file_path: str, options: Dict[str, Any], keyring: Optional[Keyring]) -> Dict[str, Any]:
+    extract_options = dict(bit_depth=options["bit_depth"], channels=options["channels"],
+                           password=options.get("password"), engine=options["engine"])
+    
+    with BMPFile(file_path, use_mmap=True, keyring=keyring) as bmp:
+        stego = LSBSteganography(bmp, keyring=keyring)
+        
+        # Çıktı dizini verilmişse veri dosyaya akıtılır, yoksa metin olarak döndürülür
+        if options.get("output_dir"):
+            output_path = _batch_output_path(file_path, options, ".bin")
+            with open(output_path, "wb") as f:
+                size = stego.extract_stream(f, **extract_options)
+            return {"output": output_path, "size": size}
+        
+        data = stego.extract_data(**extract_options)
+    
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = None
+    return {"size": len(data), "text": text}
+
+
+def _batch_analyze(file_path: str, options: Dict[str, Any], keyring: Optional[Keyring]) -> Dict[str, Any]:
+    report = _analysis().analysis_report(file_path, top_k=options["top"], approximate=options["approximate"],
+                                          sample_rate=options["sample_rate"], cache=_BATCH_WORKER["cache"])
+    del report["file"]
+    return report
+
+
+_BATCH_HANDLERS = {
+    "info": _batch_info,
+    "metadata-add": _batch_metadata_add,
+    "metadata-extract": _batch_metadata_extract,
+    "stego-hide": _batch_stego_hide,
+    "stego-extract": _batch_stego_extract,
+    "analyze": _batch_analyze,
+}
+
+
+def _batch_run(file_path: str) -> Dict[str, Any]:
+    """Tek dosyada seçili işlemi çalıştırır; hatayı istisna yerine sonuç satırı olarak döndürür."""
+    options = _BATCH_WORKER["options"]
+    handler = _BATCH_HANDLERS[options["operation"]]
+    
+    try:
+        with profiling.span(f"batch.{options['operation']}", file=file_path):
+            result = handler(file_path, options, _BATCH_WORKER["keyring"])
+    except Exception as e:
+        return {"file": file_path, "ok": False, "error": str(e), "error_type": type(e).__name__}
+    
+    return {"file": file_path, "ok": True, **result}
+
+
+def run_batch(paths: Iterator[str], options: Dict[str, Any], jobs: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Dosyaları işçi süreç havuzunda işler, sonuçları bittikçe (sırasız) üretir.
+    
+    Her işçi yorumlayıcıyı, şifreleme kütüphanesini ve (anahtarlık modunda)
+    ana anahtarı bir kez hazırlar; dosyalar BATCH_CHUNK_SIZE'lık gruplar
+    hâlinde dağıtılır. jobs=1 ise havuz kurulmadan bu süreçte çalışılır.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    
+    if jobs == 1:
+        _batch_init(options)
+        try:
+            for file_path in paths:
+                yield _batch_run(file_path)
+        finally:
+            if _BATCH_WORKER.get("keyring") is not None:
+                _BATCH_WORKER["keyring"].wipe()
+        return
+    
+    import multiprocessing
+    
+    with multiprocessing.Pool(jobs, initializer=_batch_init, initargs=(options,)) as pool:
+        yield from pool.imap_unordered(_batch_run, paths, chunksize=BATCH_CHUNK_SIZE)
+
+
+def main():
+    """BMP Manipülatörü için ana komut satırı arayüzü."""
+    parser = argparse.ArgumentParser(description="BMP Manipülatörü - BMP dosyalarını değiştirme ve steganografi aracı")
+    parser.add_argument("--mmap", action="store_true",
+                        help="Dosyayı tamamen okumak yerine bellek eşlemeli (mmap) olarak aç")
+    parser.add_argument("--keyring", action="store_true",
+                        help="Parolayı anahtarlık modunda kullan: ana anahtar bir kez türetilir, "
+                             "dosya anahtarları HKDF ile üretilir")
+    parser.add_argument("--master-salt", help="Anahtarlık ana tuzu (32 haneli onaltılık); "
+                                              "aynı tuzla şifrelenen dosyalar tek KDF ile çözülür")
+    parser.add_argument("--profile", action="store_true",
+                        help="İşlem sürelerini ölç ve JSON izini stderr'e yaz; batch'te işçi "
+                             "süreçlerin süreleri yalnızca -j 1 ile ize girer")
+    parser.add_argument("--profile-output", metavar="DOSYA", help="JSON izini stderr yerine dosyaya yaz")
+    parser.add_argument("--profile-chrome", metavar="DOSYA",
+                        help="Ölçüm izini Chrome trace-event biçiminde de yaz (chrome://tracing, Perfetto)")
+    subparsers = parser.add_subparsers(dest="command", help="Komut")
+    
+    # info komutu
+    parser_info = subparsers.add_parser("info", help="BMP dosyası hakkında bilgi göster")
+    parser_info.add_argument("file", help="BMP dosya yolu")
+    parser_info.add_argument("--fast", action="store_true",
+                             help="Yalnızca başlıkları ve metadata bloğunu oku (piksel verisi okunmaz)")
+    
+    # metadata komutları
+    parser_metadata = subparsers.add_parser("metadata", help="Metadata işlemleri")
+    metadata_subparsers = parser_metadata.add_subparsers(dest="metadata_command", help="Metadata komutu")
+    
+    # metadata add komutu
+    parser_metadata_add = metadata_subparsers.add_parser("add", help="BMP dosyasına metadata ekle")
+    parser_metadata_add.add_argument("file", help="BMP dosya yolu")
+    parser_metadata_add.add_argument("--key", required=True, help="Metadata anahtarı")
+    parser_metadata_add.add_argument("--value", required=True, help="Metadata değeri")
+    parser_metadata_add.add_argument("--output", help="Çıktı dosya yolu (belirtilmezse orijinal dosya üzerine yazılır)")
+    parser_metadata_add.add_argument("--password", help="Metadata şifreleme parolası")
+    parser_metadata_add.add_argument("--cipher", choices=list(CIPHERS), default=DEFAULT_CIPHER,
+                                     help=f"Şifreleme algoritması (varsayılan: {DEFAULT_CIPHER})")
+    parser_metadata_add.add_argument("--atomic", action="store_true",
+                                     help="Dosyayı yerinde güncellemek yerine geçici bir kopyayı atomik olarak "
+                                          "yerine taşı (dosya boyutu kadar okuma/yazma yapar)")
+    
+    # metadata extract komutu
+    parser_metadata_extract = metadata_subparsers.add_parser("extract", help="BMP dosyasından metadata çıkar")
+    parser_metadata_extract.add_argument("file", help="BMP dosya yolu")
+    parser_metadata_extract.add_argument("--password", help="Metadata şifre çözme parolası")
+    
+    # stego komutları
+    parser_stego = subparsers.add_parser("stego", help="Steganografi işlemleri")
+    stego_subparsers = parser_stego.add_subparsers(dest="stego_command", help="Steganografi komutu")
+    
+    # stego hide komutu
+    parser_stego_hide = stego_subparsers.add_parser("hide", help="BMP dosyasında veri gizle")
+    parser_stego_hide.add_argument("file", help="Taşıyıcı BMP dosya yolu")
+    group = parser_stego_hide.add_mutually_exclusive_group(required=True)
+    group.add_argument("--text", help="Gizlenecek metin")
+    group.add_argument("--file", help="Gizlenecek dosya yolu", dest="hide_file")
+    parser_stego_hide.add_argument("--output", required=True, help="Çıktı BMP dosya yolu")
+    parser_stego_hide.add_argument("--bit-depth", type=int, default=DEFAULT_LSB_DEPTH, help=f"Bit derinliği (varsayılan: {DEFAULT_LSB_DEPTH})")
+    parser_stego_hide.add_argument("--channels", type=int, default=DEFAULT_LSB_CHANNELS, help=f"Kullanılacak renk kanalı sayısı (varsayılan: {DEFAULT_LSB_CHANNELS})")
+    parser_stego_hide.add_argument("--password", help="Veri şifreleme parolası")
+    parser_stego_hide.add_argument("--cipher", choices=list(CIPHERS), default=DEFAULT_CIPHER,
+                                   help=f"Şifreleme algoritması (varsayılan: {DEFAULT_CIPHER})")
+    parser_stego_hide.add_argument("--engine", choices=LSB_ENGINES, default=DEFAULT_LSB_ENGINE,
+                                   help=f"LSB motoru (varsayılan: {DEFAULT_LSB_ENGINE})")
+    
+    # stego extract komutu
+    parser_stego_extract = stego_subparsers.add_parser("extract", help="BMP dosyasından gizli veri çıkar")
+    parser_stego_extract.add_argument("file", help="BMP dosya yolu")
+    parser_stego_extract.add_argument("--output", help="Çıktı dosya yolu (belirtilmezse metin olarak göster)")
+    parser_stego_extract.add_argument("--bit-depth", type=int, default=DEFAULT_LSB_DEPTH, help=f"Bit derinliği (varsayılan: {DEFAULT_LSB_DEPTH})")
+    parser_stego_extract.add_argument("--channels", type=int, default=DEFAULT_LSB_CHANNELS, help=f"Kullanılacak renk kanalı sayısı (varsayılan: {DEFAULT_LSB_CHANNELS})")
+    parser_stego_extract.add_argument("--password", help="Veri şifre çözme parolası")
+    parser_stego_extract.add_argument("--engine", choices=LSB_ENGINES, default=DEFAULT_LSB_ENGINE,
+                                   help=f"LSB motoru (varsayılan: {DEFAULT_LSB_ENGINE})")
+    
+    # Şifre hız ölçümü komutu
+    parser_cipher_bench = subparsers.add_parser("cipher-bench",
+                                                help="Şifreleme algoritmalarının bu makinedeki hızını ölç (MB/s)")
+    parser_cipher_bench.add_argument("--size", type=int, default=16,
+                                     help="Tur başına şifrelenecek veri (MB, varsayılan: 16)")
+    parser_cipher_bench.add_argument("--rounds", type=int, default=3, help="Tur sayısı (varsayılan: 3)")
+    parser_cipher_bench.add_argument("--json", action="store_true", help="Sonucu JSON olarak yazdır")
+    
+    # analyze komutu
+    parser_analyze = subparsers.add_parser("analyze", help="Renk analizi yap ve sonucu JSON olarak yazdır")
+    parser_analyze.add_argument("paths", nargs="+", help="BMP dosyaları, dizinler veya glob desenleri")
+    parser_analyze.add_argument("--top", type=int, default=10, help="Listelenecek en sık renk sayısı (varsayılan: 10)")
+    parser_analyze.add_argument("--recursive", action="store_true", help="Dizinlerde alt dizinlere de in")
+    parser_analyze.add_argument("--approximate", action="store_true",
+                                help="Sabit bellekli yaklaşık analiz (HyperLogLog + count-min sketch)")
+    parser_analyze.add_argument("--sample-rate", type=float, default=1.0,
+                                help="Yaklaşık analizde işlenecek satır oranı (0-1, varsayılan: 1)")
+    parser_analyze.add_argument("--workers", type=int, default=1,
+                                help="Kesin analizde işçi süreç sayısı (0: işlemci sayısı, varsayılan: 1)")
+    parser_analyze.add_argument("--no-cache", action="store_true", help="Analiz önbelleğini kullanma")
+    parser_analyze.add_argument("--channel-histograms", action="store_true",
+                                help="Kanal başına 256 değerlik histogramları da yaz")
+    parser_analyze.add_argument("--output", help="JSON çıktı dosyası (belirtilmezse standart çıktıya yazılır)")
+    
+    # batch komutu
+    parser_batch = subparsers.add_parser("batch", help="Bir işlemi çok sayıda dosyada paralel çalıştır (JSON satırları)")
+    parser_batch.add_argument("operation", choices=BATCH_OPERATIONS, help="Her dosyaya uygulanacak işlem")
+    parser_batch.add_argument("paths", nargs="*", help="BMP dosyaları, dizinler veya glob desenleri")
+    parser_batch.add_argument("--manifest", help="Her satırında bir dosya yolu bulunan liste ('-': standart girdi)")
+    parser_batch.add_argument("--recursive", action="store_true", help="Dizinlerde alt dizinlere de in")
+    parser_batch.add_argument("--jobs", "-j", type=int, default=0,
+                              help="İşçi süreç sayısı (0: işlemci sayısı, varsayılan: 0)")
+    parser_batch.add_argument("--output-dir",
+                              help="Çıktı dosyalarının yazılacağı dizin (metadata-add için belirtilmezse "
+                                   "dosyaların üzerine yazılır; stego-extract'te veri <ad>.bin olarak yazılır)")
+    parser_batch.add_argument("--results", help="JSON satırlarının yazılacağı dosya (varsayılan: standart çıktı)")
+    parser_batch.add_argument("--password", help="Şifreleme/şifre çözme parolası")
+    parser_batch.add_argument("--cipher", choices=list(CIPHERS), default=DEFAULT_CIPHER,
+                              help=f"Şifreleme algoritması (varsayılan: {DEFAULT_CIPHER})")
+    parser_batch.add_argument("--fast", action="store_true", help="info: yalnızca başlıkları oku")
+    parser_batch.add_argument("--key", help="metadata-add: metadata anahtarı")
+    parser_batch.add_argument("--value", help="metadata-add: metadata değeri")
+    parser_batch.add_argument("--atomic", action="store_true",
+                              help="metadata-add: dosyaları yerinde değil, geçici kopya üzerinden atomik güncelle")
+    parser_batch.add_argument("--text", help="stego-hide: gizlenecek metin")
+    parser_batch.add_argument("--file", dest="hide_file", help="stego-hide: gizlenecek dosya")
+    parser_batch.add_argument("--bit-depth", type=int, default=DEFAULT_LSB_DEPTH,
+                              help=f"stego: bit derinliği (varsayılan: {DEFAULT_LSB_DEPTH})")
+    parser_batch.add_argument("--channels", type=int, default=DEFAULT_LSB_CHANNELS,
+                              help=f"stego: renk kanalı sayısı (varsayılan: {DEFAULT_LSB_CHANNELS})")
+    parser_batch.add_argument("--engine", choices=LSB_ENGINES, default=DEFAULT_LSB_ENGINE,
+                              help=f"stego: LSB motoru (varsayılan: {DEFAULT_LSB_ENGINE})")
+    parser_batch.add_argument("--top", type=int, default=10, help="analyze: en sık renk sayısı (varsayılan: 10)")
+    parser_batch.add_argument("--approximate", action="store_true", help="analyze: yaklaşık analiz")
+    parser_batch.add_argument("--sample-rate", type=float, default=1.0, help="analyze: satır örnekleme oranı")
+    parser_batch.add_argument("--no-cache", action="store_true", help="analyze: analiz önbelleğini kullanma")
+    
+    # Argümanları ayrıştır
+    args = parser.parse_args()
+    
+    if not args.command:
+        parser.print_help()
+        return
+    
+    profile = args.profile or args.profile_output or args.profile_chrome
+    if profile:
+        trace_path = args.profile_output or ("-" if args.profile else None)
+        profiling.enable(trace_path, args.profile_chrome)
+    
+    keyring = None
+    
+    try:
+        # Anahtarlık modunda PBKDF2 komut boyunca yalnızca bir kez çalışır
+        # (batch'te her işçi kendi anahtarlığını kurar)
+        if args.keyring and getattr(args, "password", None) and args.command != "batch":
+            master_salt = bytes.fromhex(args.master_salt) if args.master_salt else None
+            keyring = Keyring(args.password, master_salt)
+        
+        if args.command == "info":
+            if args.fast:
+                info = BMPFile.probe(args.file)
+            else:
+                bmp = BMPFile(args.file, use_mmap=args.mmap, keyring=keyring)
+                info = bmp.get_info()
+            
+            print(f"BMP Dosya Bilgisi: {info['file_name']}")
+            print(f"Boyut: {info['file_size']} bayt")
+            print(f"Başlık tipi: {info['header_type']}")
+            print(f"Boyutlar: {info['dimensions']}")
+            print(f"Renk derinliği: {info['bit_depth']} bit")
+            print(f"Sıkıştırma: {info['compression']}")
+            
+            if info.get('metadata_encrypted'):
+                print("Metadata: Var (şifreli)")
+            elif info['has_metadata']:
+                print(f"Metadata: Var (Anahtarlar: {', '.join(info['metadata_keys'])})")
+            else:
+                print("Metadata: Yok")
+        
+        elif args.command == "metadata":
+            if args.metadata_command == "add":
+                # Kaynak dosya güncelleniyorsa yalnızca metadata bloğu yeniden yazılır
+                output_path = args.output or args.file
+                in_place = _add_metadata_entry(args.file, args.key, args.value, output_path,
+                                              password=args.password, cipher=args.cipher, keyring=keyring,
+                                              atomic=args.atomic, use_mmap=args.mmap)
+                
+                print(f"Metadata eklendi: {args.key}={args.value}")
+                if in_place:
+                    print(f"Dosya güncellendi: {output_path}")
+                else:
+                    print(f"Dosya kaydedildi: {output_path}")
+            
+            elif args.metadata_command == "extract":
+                bmp = BMPFile(args.file, use_mmap=args.mmap, keyring=keyring)
+                metadata = bmp.extract_metadata(password=args.password)
+                
+                if metadata:
+                    print("BMP Metadata:")
+                    for key, value in metadata.entries.items():
+                        print(f"  {key}: {value}")
+                else:
+                    print("Metadata bulunamadı")
+            
+            else:
+                parser_metadata.print_help()
+        
+        elif args.command == "stego":
+            if args.stego_command == "hide":
+                # Dosya gizleme akış olarak yapılır; taşıyıcı eşlenir, gizlenecek
+                # dosya belleğe okunmaz (parola varsa parça parça şifrelenir)
+                streaming = bool(args.hide_file)
+                bmp = BMPFile(args.file, use_mmap=args.mmap or streaming, keyring=keyring)
+                stego = LSBSteganography(bmp, keyring=keyring)
+                
+                if args.text:
+                    # Metin gizle
+                    stego.hide_text(args.text, bit_depth=args.bit_depth, 
+                                  channels=args.channels, password=args.password,
+                                  engine=args.engine, cipher=args.cipher)
+                    print(f"Metin mesajı gizlendi ({len(args.text)} karakter)")
+                
+                elif streaming:
+                    # Dosyayı parça parça gizle ve doğrudan çıktıya yaz
+                    with open(args.hide_file, "rb") as f:
+                        hidden = stego.hide_stream(f, args.output, bit_depth=args.bit_depth,
+                                                   channels=args.channels, password=args.password,
+                                                   engine=args.engine, cipher=args.cipher)
+                    print(f"Dosya gizlendi: {args.hide_file} ({hidden} bayt)")
+                
+                # Kaydet (akış yolu çıktıyı zaten yazdı)
+                if not streaming:
+                    bmp.save(args.output)
+                print(f"Steganografi uygulanmış BMP kaydedildi: {args.output}")
+            
+            elif args.stego_command == "extract":
+                streaming = bool(args.output)
+                bmp = BMPFile(args.file, use_mmap=args.mmap or streaming, keyring=keyring)
+                stego = LSBSteganography(bmp, keyring=keyring)
+                
+                if streaming:
+                    # Veriyi parça parça dosyaya yaz
+                    with open(args.output, "wb") as f:
+                        extracted = stego.extract_stream(f, bit_depth=args.bit_depth,
+                                                         channels=args.channels, password=args.password,
+                                                         engine=args.engine)
+                    print(f"Çıkarılan veri dosyaya kaydedildi: {args.output} ({extracted} bayt)")
+                    return 0
+                
+                extracted_data = stego.extract_data(bit_depth=args.bit_depth, 
+                                                 channels=args.channels, 
+                                                 password=args.password,
+                                                 engine=args.engine)
+                
+                # Veriyi metin olarak yazdırmayı dene
+                try:
+                    text = extracted_data.decode("utf-8")
+                    print("Çıkarılan metin:")
+                    print(text)
+                except UnicodeDecodeError:
+                    print(f"Çıkarılan veri metin değil. Boyut: {len(extracted_data)} bayt")
+                    print("Veriyi kaydetmek için --output parametresini kullanın")
+            
+            else:
+                parser_stego.print_help()
+        
+        elif args.command == "analyze":
+            bmp_analysis = _analysis()
+            files = bmp_analysis.find_bmp_files(args.paths, recursive=args.recursive)
+            if not files:
+                raise BMPError("Analiz edilecek BMP dosyası bulunamadı")
+            
+            cache = None if args.no_cache else bmp_analysis.AnalysisCache()
+            workers = args.workers or None
+            reports = []
+            failed = 0
+            
+            for file_path in files:
+                try:
+                    with profiling.span("analysis.report", file=file_path):
+                        reports.append(bmp_analysis.analysis_report(
+                            file_path, top_k=args.top, approximate=args.approximate,
+                            sample_rate=args.sample_rate, workers=workers, cache=cache,
+                            channel_histograms=args.channel_histograms))
+                except Exception as e:
+                    # Bir dosyanın hatası diğerlerinin analizini durdurmaz
+                    reports.append({"file": file_path, "error": str(e)})
+                    failed += 1
+            
+            # Tek dosya için nesne, birden fazla dosya için liste yazılır
+            output = json.dumps(reports[0] if len(args.paths) == 1 and len(files) == 1 else reports,
+                                indent=2, ensure_ascii=False)
+            
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as f:
+                    f.write(output + "\n")
+            else:
+                print(output)
+            
+            if failed:
+                return 1
+        
+        elif args.command == "batch":
+            if not args.paths and not args.manifest:
+                raise BMPError("İşlenecek dosya, dizin veya --manifest belirtilmeli")
+            if args.operation == "metadata-add" and (args.key is None or args.value is None):
+                raise BMPError("metadata-add için --key ve --value gerekli")
+            if args.operation == "stego-hide" and (bool(args.text) == bool(args.hide_file) or not args.output_dir):
+                raise BMPError("stego-hide için --text veya --file ve --output-dir gerekli")
+            if args.operation == "analyze":
+                _analysis()
+            
+            if args.output_dir:
+                os.makedirs(args.output_dir, exist_ok=True)
+            
+            options = {
+                "operation": args.operation,
+                "password": args.password,
+                "keyring": args.keyring,
+                "master_salt": bytes.fromhex(args.master_salt) if args.master_salt else None,
+                "cipher": args.cipher,
+                "output_dir": args.output_dir,
+                "fast": args.fast,
+                "key": args.key,
+                "value": args.value,
+                "atomic": args.atomic,
+                "text": args.text,
+                "hide_file": args.hide_file,
+                "bit_depth": args.bit_depth,
+                "channels": args.channels,
+                "engine": args.engine,
+                "top": args.top,
+                "approximate": args.approximate,
+                "sample_rate": args.sample_rate,
+                "no_cache": args.no_cache,
+            }
+            
+            paths = iter_batch_paths(args.paths, args.manifest, args.recursive)
+            output = open(args.results, "w", encoding="utf-8") if args.results else sys.stdout
+            start_time = time.perf_counter()
+            processed = failed = 0
+            
+            results = run_batch(paths, options, args.jobs)
+            
+            try:
+                # Her sonuç bittiği anda bir JSON satırı olarak yazılır
+                for result in results:
+                    processed += 1
+                    failed += not result["ok"]
+                    output.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    output.flush()
+            except BrokenPipeError:
+                # Okuyan taraf (ör. head) kapandı: kalan işler durdurulur, çıkışta hata basılmaz
+                os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+                return 1
+            finally:
+                results.close()  # Havuzu sonlandırır
+                if output is not sys.stdout:
+                    output.close()
+            
+            elapsed = time.perf_counter() - start_time
+            print(f"{processed} dosya işlendi, {failed} hata ({elapsed:.1f} sn)", file=sys.stderr)
+            
+            if failed:
+                return 1
+        
+        elif args.command == "cipher-bench":
+            results = benchmark_ciphers(size=args.size * 1024 * 1024, rounds=args.rounds)
+            
+            if args.json:
+                print(json.dumps(results, indent=2))
+            else:
+                print(f"Şifre hızları ({args.size} MB, {DEFAULT_SEGMENT_SIZE // 1024} KB parçalar, en iyi tur):")
+                for name, result in results.items():
+                    if "error" in result:
+                        print(f"  {name:<18} desteklenmiyor: {result['error']}")
+                    else:
+                        print(f"  {name:<18} şifreleme {result['encrypt_mb_s']:>8.1f} MB/s   "
+                              f"çözme {result['decrypt_mb_s']:>8.1f} MB/s")
+        
+        else:
+            parser.print_help()
+    
+    except Exception as e:
+        print(f"HATA: {e}")
+        return 1
+    
+    finally:
+        if keyring is not None:
+            keyring.wipe()
+        
+        if profile:
+            profiling.write_outputs()
+            profiling.disable()
+    
+    return 0
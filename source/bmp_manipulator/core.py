@@ -0,0 +1,2116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BMP Manipülatörü
+===============
+
+BMP dosyalarında metadata işleme ve steganografi araçları.
+
+Bu modül BMP dosyalarında başlık manipülasyonu, metadata ekleme/çıkarma
+ve steganografi teknikleri için kapsamlı araçlar sunar.
+"""
+
+import io
+import os
+import itertools
+import mmap
+import struct
+import time
+import json
+import binascii
+import importlib
+import importlib.util
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Tuple, Union, Optional, BinaryIO, Any, Iterator
+from dataclasses import dataclass
+from enum import Enum, auto
+
+from . import profiling
+
+
+class _LazyModule:
+    """İlk öznitelik erişiminde içe aktarılan modül vekili.
+    
+    cryptography ve numpy'nin yüklenmesi yorumlayıcı açılışından uzun
+    sürer; `info` gibi komutlar bu kütüphanelere hiç dokunmaz.
+    """
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr: str) -> Any:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+
+def _module_available(name: str) -> bool:
+    """Modülü içe aktarmadan kurulu olup olmadığını denetler."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+CRYPTO_AVAILABLE = _module_available("cryptography")
+_ciphers = _LazyModule("cryptography.hazmat.primitives.ciphers.aead")
+_hashes = _LazyModule("cryptography.hazmat.primitives.hashes")
+_pbkdf2 = _LazyModule("cryptography.hazmat.primitives.kdf.pbkdf2")
+_hkdf = _LazyModule("cryptography.hazmat.primitives.kdf.hkdf")
+
+NUMPY_AVAILABLE = _module_available("numpy")
+np = _LazyModule("numpy")
+
+__version__ = "1.0.0"
+__author__ = "BMP Manipülatör Ekibi"
+
+# BMP Dosya Başlığı Yapısı
+BMP_HEADER_FORMAT = '<2sIHHI'
+BMP_HEADER_SIZE = 14
+
+# DIB Başlık Tipleri
+DIB_HEADER_SIZES = {
+    12: 'BITMAPCOREHEADER',
+    40: 'BITMAPINFOHEADER',
+    52: 'BITMAPV2INFOHEADER',
+    56: 'BITMAPV3INFOHEADER',
+    108: 'BITMAPV4HEADER',
+    124: 'BITMAPV5HEADER'
+}
+
+# Sıkıştırma Metodları
+BI_COMPRESSION = {
+    0: 'BI_RGB',         # Sıkıştırma yok
+    1: 'BI_RLE8',        # 8-bit RLE sıkıştırma
+    2: 'BI_RLE4',        # 4-bit RLE sıkıştırma
+    3: 'BI_BITFIELDS',   # Bit alanları
+    4: 'BI_JPEG',        # JPEG sıkıştırma
+    5: 'BI_PNG',         # PNG sıkıştırma
+    6: 'BI_ALPHABITFIELDS',  # Alfa bit alanları
+    11: 'BI_CMYK',       # CMYK renk uzayı
+    12: 'BI_CMYKRLE8',   # CMYK 8-bit RLE
+    13: 'BI_CMYKRLE4'    # CMYK 4-bit RLE
+}
+
+# Metadata Blok İmzası
+METADATA_SIGNATURE = b'BMPM'
+
+# LSB Steganografi için varsayılan ayarlar
+DEFAULT_LSB_DEPTH = 1  # Değiştirilecek bit sayısı
+DEFAULT_LSB_CHANNELS = 3  # Tüm renkler (R, G, B)
+
+# LSB motorları: "auto" numpy varsa vektörel motoru seçer
+LSB_ENGINES = ("auto", "numpy", "python")
+DEFAULT_LSB_ENGINE = "auto"
+
+# Parçalı (segmented) AEAD kapsayıcısı
+SEGMENTED_MAGIC = b'BMSA'
+SEGMENTED_VERSION = 1
+SEGMENTED_HEADER_FORMAT = '<4sBBBB16s7sI'  # imza, sürüm, şifre, KDF, rezerve, tuz, nonce öneki, parça boyutu
+SEGMENTED_HEADER_SIZE = struct.calcsize(SEGMENTED_HEADER_FORMAT)
+DEFAULT_SEGMENT_SIZE = 64 * 1024
+AEAD_TAG_SIZE = 16
+CIPHER_AES_GCM = 1
+CIPHER_CHACHA20_POLY1305 = 2
+# Şifre adı -> kapsayıcı başlığındaki şifre kimliği
+CIPHERS = {"aes-gcm": CIPHER_AES_GCM, "chacha20-poly1305": CIPHER_CHACHA20_POLY1305}
+DEFAULT_CIPHER = "aes-gcm"
+KDF_PBKDF2 = 1    # Anahtar = PBKDF2(parola, tuz)
+KDF_KEYRING = 2   # Anahtar = HKDF(PBKDF2(parola, ana tuz), tuz); ana tuz başlığa eklenir
+PBKDF2_ITERATIONS = 100000
+
+# Anahtarlık (keyring) ayarları
+DEFAULT_KEYRING_SIZE = 64
+KEYRING_HKDF_INFO = b'bmp-manipulator keyring v1'
+
+# Akış (streaming) okuma/yazma için varsayılan bant yüksekliği (satır)
+DEFAULT_ROW_BAND = 256
+
+# Akış tabanlı gizleme/çıkarma için varsayılan yük parçası boyutu (bayt)
+DEFAULT_STREAM_CHUNK = 1 << 20
+
+
+class BMPError(Exception):
+    """BMP işleme ile ilgili hatalar için özel istisna."""
+    pass
+
+
+class MetadataError(Exception):
+    """Metadata işleme ile ilgili hatalar için özel istisna."""
+    pass
+
+
+class SteganographyError(Exception):
+    """Steganografi işleme ile ilgili hatalar için özel istisna."""
+    pass
+
+
+class EncryptionError(Exception):
+    """Şifreleme ve şifre çözme ile ilgili hatalar için özel istisna."""
+    pass
+
+
+class MetadataStorageMethod(Enum):
+    """Metadata depolama yöntemleri."""
+    HEADER_EXTENSION = auto()
+    APPLICATION_BLOCK = auto()
+    EOF_APPEND = auto()
+
+
+class StegoMethod(Enum):
+    """Desteklenen steganografi yöntemleri."""
+    LSB = auto()
+    PALETTE = auto()
+    HEADER = auto()
+    EOF = auto()
+
+
+@dataclass
+class BMPFileHeader:
+    """BMP dosya başlığı yapısı."""
+    signature: bytes      # 'BM'
+    file_size: int        # Bayt olarak dosya boyutu
+    reserved1: int        # Rezerve edilmiş (genellikle 0)
+    reserved2: int        # Rezerve edilmiş (genellikle 0)
+    pixel_offset: int     # Piksel verilerine offset
+
+
+@dataclass
+class DIBHeader:
+    """DIB başlığı için temel sınıf."""
+    header_size: int      # Başlık boyutu
+    width: int            # Piksel olarak genişlik
+    height: int           # Piksel olarak yükseklik
+    planes: int           # Renk düzlemleri (her zaman 1)
+    bit_count: int        # Piksel başına bit
+    compression: int      # Sıkıştırma yöntemi
+    image_size: int       # Görüntü verisi boyutu
+    x_ppm: int            # X çözünürlüğü (piksel/metre)
+    y_ppm: int            # Y çözünürlüğü (piksel/metre)
+    colors_used: int      # Kullanılan renk sayısı
+    colors_important: int # Önemli renk sayısı
+    raw_data: bytes       # Tüm ham başlık verisi
+    top_down: bool = False  # Negatif yükseklik: satırlar yukarıdan aşağıya
+
+
+def _derive_key(password: Union[str, bytes, bytearray], salt: bytes) -> bytes:
+    """Paroladan PBKDF2-HMAC-SHA256 ile 32 baytlık anahtar türetir."""
+    with profiling.span("kdf.pbkdf2", iterations=PBKDF2_ITERATIONS):
+        kdf = _pbkdf2.PBKDF2HMAC(
+            algorithm=_hashes.SHA256(),
+            length=32,
+            salt=salt,
+            iterations=PBKDF2_ITERATIONS,
+        )
+        return kdf.derive(password.encode() if isinstance(password, str) else bytes(password))
+
+
+def _cipher_id(cipher: str) -> int:
+    """Şifre adını kapsayıcı başlığındaki kimliğe çevirir."""
+    try:
+        return CIPHERS[cipher]
+    except KeyError:
+        raise EncryptionError(f"Desteklenmeyen şifre: {cipher} (seçenekler: {', '.join(CIPHERS)})")
+
+
+def _aead(cipher_id: int, key: bytes):
+    """Şifre kimliğine karşılık gelen AEAD nesnesini oluşturur.
+    
+    AES-GCM donanım hızlandırması (AES-NI) olan makinelerde, ChaCha20-Poly1305
+    ise olmayanlarda daha hızlıdır; ikisi de 32 bayt anahtar ve 12 bayt
+    nonce kullanır.
+    """
+    if cipher_id == CIPHER_AES_GCM:
+        return _ciphers.AESGCM(key)
+    if cipher_id == CIPHER_CHACHA20_POLY1305:
+        return _ciphers.ChaCha20Poly1305(key)
+    raise EncryptionError(f"Desteklenmeyen şifre kimliği: {cipher_id}")
+
+
+def _wipe(buffer: bytearray) -> None:
+    """Değiştirilebilir tampondaki anahtar malzemesini sıfırlar."""
+    for i in range(len(buffer)):
+        buffer[i] = 0
+
+
+class Keyring:
+    """Parola başına PBKDF2 maliyetini bir kez ödeyen anahtar önbelleği.
+    
+    Ana anahtar paroladan ve ana tuzdan (master_salt) PBKDF2 ile bir kez
+    türetilir; her dosyanın anahtarı bu ana anahtardan dosyaya özgü tuzla
+    HKDF-SHA256 ile hızlıca üretilir. Türetilen PBKDF2 anahtarları tuza
+    göre en son kullanılan (LRU) sırasıyla önbelleklenir; evict() tek bir
+    girdiyi, wipe() tüm anahtarları ve parolayı bellekten siler.
+    
+    Aynı parolayla binlerce dosya damgalanırken veya doğrulanırken
+    anahtarlık paylaşılırsa KDF maliyeti yalnızca farklı her ana tuz için
+    ödenir. Python'da değişmez bayt kopyaları oluşabildiği için silme
+    işlemi en iyi çaba esaslıdır.
+    """
+    
+    def __init__(self, password: str, master_salt: Optional[bytes] = None,
+                 max_entries: int = DEFAULT_KEYRING_SIZE):
+        if not CRYPTO_AVAILABLE:
+            raise RuntimeError("Anahtarlık için cryptography kütüphanesi gereklidir")
+        
+        self.master_salt = master_salt if master_salt is not None else os.urandom(16)
+        if len(self.master_salt) != 16:
+            raise EncryptionError(f"Ana tuz 16 bayt olmalı: {len(self.master_salt)}")
+        
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._password: Optional[bytearray] = bytearray(password.encode())
+        self._keys: 'OrderedDict[bytes, bytearray]' = OrderedDict()
+    
+    def __enter__(self) -> 'Keyring':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.wipe()
+    
+    def pbkdf2(self, salt: bytes, cache: bool = True) -> bytes:
+        """Parola ve tuz için PBKDF2 anahtarını döndürür (önbellekten veya türeterek).
+        
+        cache=False ise türetilen anahtar önbelleğe eklenmez; tek seferlik,
+        büyük olasılıkla geçersiz tuzlar LRU girdilerini dışarı atmaz.
+        """
+        salt = bytes(salt)
+        key = self._keys.get(salt)
+        
+        if key is not None:
+            self._keys.move_to_end(salt)
+            self.hits += 1
+            return bytes(key)
+        
+        if self._password is None:
+            raise EncryptionError("Anahtarlık silinmiş, yeni anahtar türetilemez")
+        
+        self.misses += 1
+        if not cache:
+            return _derive_key(self._password, salt)
+        
+        key = bytearray(_derive_key(self._password, salt))
+        self._keys[salt] = key
+        
+        while len(self._keys) > self.max_entries:
+            _, evicted = self._keys.popitem(last=False)
+            _wipe(evicted)
+        
+        return bytes(key)
+    
+    def subkey(self, salt: bytes, master_salt: Optional[bytes] = None) -> bytes:
+        """Ana anahtardan dosya tuzuna özgü alt anahtarı HKDF ile türetir."""
+        master_key = self.pbkdf2(master_salt if master_salt is not None else self.master_salt)
+        with profiling.span("kdf.hkdf"):
+            hkdf = _hkdf.HKDF(
+                algorithm=_hashes.SHA256(),
+                length=32,
+                salt=bytes(salt),
+                info=KEYRING_HKDF_INFO,
+            )
+            return hkdf.derive(master_key)
+    
+    def evict(self, salt: bytes) -> None:
+        """Verilen tuza ait önbellek girdisini siler."""
+        key = self._keys.pop(bytes(salt), None)
+        if key is not None:
+            _wipe(key)
+    
+    def wipe(self) -> None:
+        """Tüm önbelleklenmiş anahtarları ve parolayı siler."""
+        for key in self._keys.values():
+            _wipe(key)
+        self._keys.clear()
+        
+        if self._password is not None:
+            _wipe(self._password)
+            self._password = None
+
+
+class SegmentedEncryptor:
+    """Veriyi sabit boyutlu, ayrı ayrı doğrulanan AEAD parçalarına şifreler.
+    
+    Kapsayıcı: başlık + her parça için (şifreli metin + 16 bayt etiket).
+    Her parçanın nonce'u 7 baytlık rastgele önek, 4 baytlık parça indeksi
+    ve 1 baytlık son parça bayrağından oluşur; başlık her parçaya ek
+    doğrulanmış veri (AAD) olarak bağlanır. Böylece parçaların sırası
+    değiştirilemez, kapsayıcı kesilemez ve şifre çözme ilk bozuk parçada
+    durur. Bellekte aynı anda yalnızca bir parça bulunur.
+    
+    Anahtarlık (keyring) verilirse anahtar ana anahtardan HKDF ile türetilir
+    ve ana tuz başlığın sonuna eklenir. Kullanılan AEAD (cipher) başlıkta
+    kayıtlıdır; çözücü onu başlıktan okur.
+    """
+    
+    def __init__(self, password: Optional[str] = None, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                 keyring: Optional[Keyring] = None, cipher: str = DEFAULT_CIPHER):
+        if not CRYPTO_AVAILABLE:
+            raise RuntimeError("Şifreleme için cryptography kütüphanesi gereklidir")
+        
+        if segment_size <= 0:
+            raise EncryptionError(f"Geçersiz parça boyutu: {segment_size}")
+        
+        cipher_id = _cipher_id(cipher)
+        salt = os.urandom(16)
+        
+        if keyring is not None:
+            kdf, extension = KDF_KEYRING, keyring.master_salt
+            key = keyring.subkey(salt)
+        elif password:
+            kdf, extension = KDF_PBKDF2, b''
+            key = _derive_key(password, salt)
+        else:
+            raise EncryptionError("Şifreleme için parola veya anahtarlık gereklidir")
+        
+        self.segment_size = segment_size
+        self.header = struct.pack(SEGMENTED_HEADER_FORMAT, SEGMENTED_MAGIC, SEGMENTED_VERSION,
+                                  cipher_id, kdf, 0, salt, os.urandom(7), segment_size) + extension
+        self._aead = _aead(cipher_id, key)
+        self._nonce_prefix = self.header[24:31]
+        self._index = 0
+    
+    @staticmethod
+    def encrypted_length(plaintext_length: int, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                         header_size: int = SEGMENTED_HEADER_SIZE) -> int:
+        """Verilen düz metin uzunluğu için kapsayıcının toplam boyutunu döndürür."""
+        segments = max(1, -(-plaintext_length // segment_size))
+        return header_size + plaintext_length + segments * AEAD_TAG_SIZE
+    
+    def container_length(self, plaintext_length: int) -> int:
+        """Bu şifreleyicinin üreteceği kapsayıcının toplam boyutunu döndürür."""
+        return self.encrypted_length(plaintext_length, self.segment_size, len(self.header))
+    
+    def encrypt_segment(self, chunk: bytes, final: bool) -> bytes:
+        """Sıradaki parçayı şifreler; son parça dışındakiler tam segment_size olmalıdır."""
+        if not final and len(chunk) != self.segment_size:
+            raise EncryptionError(f"Ara parça boyutu {self.segment_size} olmalı: {len(chunk)}")
+        
+        nonce = _segment_nonce(self._nonce_prefix, self._index, final)
+        self._index += 1
+        return self._aead.encrypt(nonce, bytes(chunk), self.header)
+    
+    def encrypt_stream(self, fileobj: BinaryIO, length: int) -> Iterator[bytes]:
+        """Başlığı ve ardından dosya nesnesindeki length baytın şifreli parçalarını üretir."""
+        yield self.header
+        
+        remaining = length
+        while True:
+            chunk = _read_exact(fileobj, min(self.segment_size, remaining))
+            remaining -= len(chunk)
+            yield self.encrypt_segment(chunk, final=remaining == 0)
+            if remaining == 0:
+                break
+    
+    def encrypt(self, data: bytes) -> bytes:
+        """Bellekteki verinin tamamını kapsayıcı olarak şifreler."""
+        stream = io.BytesIO(data)
+        return b''.join(self.encrypt_stream(stream, len(data)))
+
+
+class SegmentedDecryptor:
+    """SegmentedEncryptor kapsayıcısını parça parça çözer."""
+    
+    def __init__(self, password: Optional[str], header: bytes, keyring: Optional[Keyring] = None):
+        if not CRYPTO_AVAILABLE:
+            raise RuntimeError("Şifre çözme için cryptography kütüphanesi gereklidir")
+        
+        if not is_segmented(header):
+            raise EncryptionError("Geçersiz kapsayıcı: başlık imzası bulunamadı")
+        
+        (_, version, cipher, kdf, _, salt,
+         nonce_prefix, segment_size) = struct.unpack(SEGMENTED_HEADER_FORMAT, header[:SEGMENTED_HEADER_SIZE])
+        
+        if version != SEGMENTED_VERSION:
+            raise EncryptionError(f"Desteklenmeyen kapsayıcı sürümü: {version}")
+        if cipher not in CIPHERS.values() or kdf not in (KDF_PBKDF2, KDF_KEYRING):
+            raise EncryptionError(f"Desteklenmeyen şifre/KDF: {cipher}/{kdf}")
+        if segment_size <= 0:
+            raise EncryptionError(f"Geçersiz parça boyutu: {segment_size}")
+        
+        header_size = segmented_header_size(header)
+        if len(header) < header_size:
+            raise EncryptionError("Geçersiz kapsayıcı: başlık eksik")
+        
+        if keyring is None and not password:
+            raise EncryptionError("Şifre çözme için parola veya anahtarlık gereklidir")
+        
+        if kdf == KDF_KEYRING:
+            master_salt = bytes(header[SEGMENTED_HEADER_SIZE:header_size])
+            if keyring is not None:
+                key = keyring.subkey(salt, master_salt)
+            else:
+                with Keyring(password, master_salt) as temporary:
+                    key = temporary.subkey(salt)
+        else:
+            key = keyring.pbkdf2(salt) if keyring is not None else _derive_key(password, salt)
+        
+        self.header = bytes(header[:header_size])
+        self.segment_size = segment_size
+        self._aead = _aead(cipher, key)
+        self._nonce_prefix = nonce_prefix
+    
+    def segment_count(self, container_length: int) -> int:
+        """Kapsayıcı uzunluğundan parça sayısını hesaplar."""
+        body = container_length - len(self.header)
+        segments = max(1, -(-body // (self.segment_size + AEAD_TAG_SIZE)))
+        if body < segments * AEAD_TAG_SIZE:
+            raise EncryptionError("Geçersiz kapsayıcı: veri çok kısa")
+        return segments
+    
+    def decrypt_segment(self, index: int, chunk: bytes, final: bool) -> bytes:
+        """index numaralı parçayı çözer ve doğrular."""
+        nonce = _segment_nonce(self._nonce_prefix, index, final)
+        try:
+            return self._aead.decrypt(nonce, bytes(chunk), self.header)
+        except Exception:
+            raise EncryptionError(f"Şifre çözme başarısız ({index}. parça): yanlış parola veya bozuk veri")
+    
+    def decrypt(self, container: bytes) -> bytes:
+        """Bellekteki kapsayıcının tamamını çözer."""
+        segments = self.segment_count(len(container))
+        step = self.segment_size + AEAD_TAG_SIZE
+        body = memoryview(container)[len(self.header):]
+        return b''.join(self.decrypt_segment(i, body[i * step:(i + 1) * step], i == segments - 1)
+                        for i in range(segments))
+
+
+def segmented_header_size(header: bytes) -> int:
+    """Sabit başlık alanlarına bakarak kapsayıcı başlığının toplam boyutunu döndürür."""
+    kdf = header[6]
+    return SEGMENTED_HEADER_SIZE + (16 if kdf == KDF_KEYRING else 0)
+
+
+def encrypt_payload(data: bytes, password: Optional[str] = None,
+                    keyring: Optional[Keyring] = None, cipher: str = DEFAULT_CIPHER) -> bytes:
+    """Veriyi tek seferde şifreler.
+    
+    Parola ve AES-GCM ile eski tek parça biçim (tuz + nonce + şifreli metin)
+    üretilir; anahtarlık veya başka bir şifre seçilirse KDF ve şifre
+    bilgisini taşıyan parçalı kapsayıcı kullanılır.
+    """
+    if not CRYPTO_AVAILABLE:
+        raise RuntimeError("Şifreleme için cryptography kütüphanesi gereklidir")
+    
+    if keyring is not None or _cipher_id(cipher) != CIPHER_AES_GCM:
+        return SegmentedEncryptor(password, keyring=keyring, cipher=cipher).encrypt(data)
+    
+    # 16 baytlık rastgele tuz, PBKDF2 anahtarı ve AES-GCM
+    salt = os.urandom(16)
+    aesgcm = _ciphers.AESGCM(_derive_key(password, salt))
+    nonce = os.urandom(12)
+    ciphertext = aesgcm.encrypt(nonce, data, None)
+    
+    # Salt + nonce + şifreli metni birleştir
+    return salt + nonce + ciphertext
+
+
+def decrypt_payload(encrypted_data: bytes, password: Optional[str] = None,
+                    keyring: Optional[Keyring] = None) -> bytes:
+    """encrypt_payload veya SegmentedEncryptor ile şifrelenmiş veriyi çözer."""
+    if not CRYPTO_AVAILABLE:
+        raise RuntimeError("Şifre çözme için cryptography kütüphanesi gereklidir")
+    
+    # Parçalı kapsayıcı (hide_stream veya anahtarlıkla şifrelenmiş veri)
+    if is_segmented(encrypted_data):
+        try:
+            decryptor = SegmentedDecryptor(password, encrypted_data, keyring=keyring)
+        except EncryptionError:
+            decryptor = None  # Başlık ayrıştırılamadı; imza tesadüfen eşleşmiş olabilir, eski biçimi dene
+        
+        # Başlık geçerliyse parça doğrulama hataları olduğu gibi iletilir
+        if decryptor is not None:
+            return decryptor.decrypt(encrypted_data)
+    
+    if len(encrypted_data) < 28:  # 16 (salt) + 12 (nonce) bayt minimum
+        raise EncryptionError("Geçersiz şifreli veri: çok kısa")
+    
+    if keyring is None and not password:
+        raise EncryptionError("Şifre çözme için parola veya anahtarlık gereklidir")
+    
+    # Tuz ve nonce'yi ayır
+    salt = bytes(encrypted_data[:16])
+    nonce = bytes(encrypted_data[16:28])
+    ciphertext = bytes(encrypted_data[28:])
+    
+    # Başlığı ayrıştırılamayan parçalı kapsayıcının "tuzu" imzayla başlar;
+    # bu anahtar anahtarlık önbelleğine alınırsa gerçek girdileri dışarı atar
+    if keyring is not None:
+        key = keyring.pbkdf2(salt, cache=not is_segmented(encrypted_data))
+    else:
+        key = _derive_key(password, salt)
+    
+    try:
+        return _ciphers.AESGCM(key).decrypt(nonce, ciphertext, None)
+    except Exception:
+        raise EncryptionError("Şifre çözme başarısız: yanlış parola veya bozuk veri")
+
+
+def benchmark_ciphers(size: int = 16 * 1024 * 1024, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                      rounds: int = 3) -> Dict[str, Dict[str, Any]]:
+    """Her AEAD şifresinin bu makinedeki şifreleme/çözme hızını MB/s olarak ölçer.
+    
+    Ölçüm, parçalı kapsayıcının yaptığı gibi segment_size boyutlu parçalar
+    üzerinde yapılır; KDF maliyeti dahil değildir. Her şifre için en iyi
+    turun sonucu döndürülür. Bu makinedeki OpenSSL'in desteklemediği şifre
+    için "error" alanı doldurulur.
+    """
+    if not CRYPTO_AVAILABLE:
+        raise RuntimeError("Şifre ölçümü için cryptography kütüphanesi gereklidir")
+    
+    chunk = os.urandom(segment_size)
+    segments = max(1, size // segment_size)
+    megabytes = segments * segment_size / (1024 * 1024)
+    results: Dict[str, Dict[str, Any]] = {}
+    
+    for name, cipher_id in CIPHERS.items():
+        try:
+            aead = _aead(cipher_id, os.urandom(32))
+            nonce = os.urandom(12)
+            sealed = aead.encrypt(nonce, chunk, None)
+        except Exception as e:
+            results[name] = {"error": str(e)}
+            continue
+        
+        encrypt_time = decrypt_time = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(segments):
+                aead.encrypt(nonce, chunk, None)
+            encrypt_time = min(encrypt_time, time.perf_counter() - start)
+            
+            start = time.perf_counter()
+            for _ in range(segments):
+                aead.decrypt(nonce, sealed, None)
+            decrypt_time = min(decrypt_time, time.perf_counter() - start)
+        
+        results[name] = {
+            "encrypt_mb_s": round(megabytes / encrypt_time, 1),
+            "decrypt_mb_s": round(megabytes / decrypt_time, 1),
+        }
+    
+    return results
+
+
+def is_segmented(data: bytes) -> bool:
+    """Verinin parçalı AEAD kapsayıcısıyla başlayıp başlamadığını döndürür."""
+    return len(data) >= SEGMENTED_HEADER_SIZE and bytes(data[:4]) == SEGMENTED_MAGIC
+
+
+def _segment_nonce(prefix: bytes, index: int, final: bool) -> bytes:
+    """7 bayt önek + 4 bayt parça indeksi + 1 bayt son parça bayrağından nonce üretir."""
+    return prefix + struct.pack(">IB", index, 1 if final else 0)
+
+
+def _read_exact(fileobj: BinaryIO, size: int) -> bytes:
+    """Dosya nesnesinden tam olarak size bayt okur."""
+    data = fileobj.read(size)
+    while len(data) < size:
+        more = fileobj.read(size - len(data))
+        if not more:
+            raise EOFError(f"Akış beklenenden kısa: {size - len(data)} bayt eksik")
+        data += more
+    return data
+
+
+class Metadata:
+    """BMP dosyasına eklenecek metadata yöneticisi."""
+    
+    def __init__(self):
+        self.entries = {}
+        self.creation_date = datetime.now().isoformat()
+    
+    def add(self, key: str, value: Union[str, bytes, int, float, dict, list]) -> None:
+        """Yeni bir metadata girişi ekler."""
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, ensure_ascii=False)
+        
+        if not isinstance(value, (str, bytes, int, float)):
+            raise MetadataError(f"Desteklenmeyen metadata değer tipi: {type(value)}")
+        
+        self.entries[key] = value
+    
+    def get(self, key: str) -> Any:
+        """Belirtilen anahtara sahip metadata değerini döndürür."""
+        if key not in self.entries:
+            raise MetadataError(f"Metadata anahtarı bulunamadı: {key}")
+        return self.entries[key]
+    
+    def remove(self, key: str) -> None:
+        """Belirtilen anahtara sahip metadata girişini siler."""
+        if key not in self.entries:
+            raise MetadataError(f"Metadata anahtarı bulunamadı: {key}")
+        del self.entries[key]
+    
+    def to_dict(self) -> Dict:
+        """Metadata'yı sözlük olarak döndürür."""
+        return {
+            "creation_date": self.creation_date,
+            "entries": self.entries
+        }
+    
+    def to_bytes(self) -> bytes:
+        """Metadata'yı ikili formata dönüştürür."""
+        result = bytearray()
+        
+        # Giriş sayısını ekle (2 bayt)
+        result.extend(struct.pack("<H", len(self.entries)))
+        
+        # Her girişi ekle
+        for key, value in self.entries.items():
+            key_bytes = key.encode('utf-8')
+            
+            # Değeri uygun formata dönüştür
+            if isinstance(value, str):
+                value_bytes = value.encode('utf-8')
+            elif isinstance(value, bytes):
+                value_bytes = value
+            elif isinstance(value, (int, float)):
+                value_bytes = str(value).encode('utf-8')
+            else:
+                raise MetadataError(f"Desteklenmeyen metadata değer tipi: {type(value)}")
+            
+            # Anahtar uzunluğu (2 bayt)
+            result.extend(struct.pack("<H", len(key_bytes)))
+            # Değer uzunluğu (4 bayt)
+            result.extend(struct.pack("<I", len(value_bytes)))
+            # Anahtar
+            result.extend(key_bytes)
+            # Değer
+            result.extend(value_bytes)
+        
+        return bytes(result)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Metadata':
+        """İkili veriden metadata oluşturur."""
+        metadata = cls()
+        
+        # Girdi sayısını oku
+        if len(data) < 2:
+            raise MetadataError("Geçersiz metadata format: veri çok kısa")
+        
+        entry_count = struct.unpack("<H", data[:2])[0]
+        position = 2
+        
+        for _ in range(entry_count):
+            if position + 6 > len(data):
+                raise MetadataError("Geçersiz metadata format: beklenmeyen dosya sonu")
+            
+            # Anahtar ve değer uzunluklarını oku
+            key_length = struct.unpack("<H", data[position:position+2])[0]
+            position += 2
+            
+            value_length = struct.unpack("<I", data[position:position+4])[0]
+            position += 4
+            
+            if position + key_length + value_length > len(data):
+                raise MetadataError("Geçersiz metadata format: eksik veri")
+            
+            # Anahtar ve değeri oku
+            key = data[position:position+key_length].decode('utf-8')
+            position += key_length
+            
+            value = data[position:position+value_length]
+            position += value_length
+            
+            # UTF-8 metin olarak değeri çözmeyi dene
+            try:
+                value = value.decode('utf-8')
+                
+                # JSON olarak çözmeyi dene
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    pass  # Normal metin olarak bırak
+                
+            except UnicodeDecodeError:
+                pass  # İkili veri olarak bırak
+            
+            metadata.add(key, value)
+        
+        return metadata
+
+
+class BMPFile:
+    """BMP dosyası yükleme, işleme ve kaydetme işlemleri için ana sınıf."""
+    
+    def __init__(self, file_path: Optional[str] = None, use_mmap: bool = False,
+                 keyring: Optional[Keyring] = None):
+        self.file_path = file_path
+        self.file_header: Optional[BMPFileHeader] = None
+        self.dib_header: Optional[DIBHeader] = None
+        self.pixel_data: Optional[Union[bytes, memoryview]] = None
+        self.palette: Optional[Union[bytes, memoryview]] = None
+        self.metadata: Optional[Metadata] = None
+        self.raw_data: Optional[Union[bytes, memoryview]] = None
+        self.keyring = keyring
+        self._mmap: Optional[mmap.mmap] = None
+        self._metadata_password: Optional[str] = None
+        self._metadata_cipher = DEFAULT_CIPHER
+        self._encrypted_metadata: Optional[bytes] = None
+        self._metadata_block: Optional[bytes] = None
+        # Yüklendiği andaki piksel tamponu; update_metadata değişiklik olup olmadığını buna göre anlar
+        self._loaded_pixel_data: Optional[Union[bytes, memoryview]] = None
+        
+        if file_path:
+            self.load(file_path, use_mmap=use_mmap)
+    
+    def __enter__(self) -> 'BMPFile':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    @property
+    def is_mapped(self) -> bool:
+        """Dosyanın bellek eşlemeli (mmap) olarak yüklenip yüklenmediğini döndürür."""
+        return self._mmap is not None
+    
+    def load(self, file_path: str, use_mmap: bool = False) -> None:
+        """BMP dosyasını yükler ve analiz eder.
+        
+        use_mmap=True ise dosya tamamen okunmaz; başlıklar eşlemenin ilk
+        baytlarından ayrıştırılır, piksel verisi, palet ve dosya sonu
+        metadata'sı eşleme üzerinde kopyasız memoryview olarak sunulur.
+        Eşleme kopyala-yaz (ACCESS_COPY) modunda açıldığı için piksel
+        verisine yazmak diskteki dosyayı değiştirmez, yalnızca değişen
+        sayfalar belleğe kopyalanır.
+        """
+        self.close()
+        self.file_path = file_path
+        self._reset_metadata()
+        
+        with profiling.span("bmp.load", mmap=use_mmap):
+            if use_mmap:
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size < BMP_HEADER_SIZE:
+                        raise BMPError("Geçersiz BMP dosyası: dosya çok küçük")
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+                self.raw_data = memoryview(self._mmap)
+                profiling.count("bytes_mapped", len(self._mmap))
+            else:
+                with profiling.span("file.read"):
+                    with open(file_path, 'rb') as f:
+                        self.raw_data = f.read()
+                profiling.count("bytes_read", len(self.raw_data))
+            
+            try:
+                with profiling.span("bmp.parse"):
+                    self._parse(self.raw_data)
+            except Exception:
+                self.close()
+                raise
+    
+    def _parse(self, data: Union[bytes, memoryview]) -> None:
+        """Başlıkları, paleti ve piksel verisini verilen tampondan ayrıştırır."""
+        dib_size = self._parse_headers(data)
+        file_size = self.file_header.file_size
+        
+        # Renk paletini yükle
+        if self.dib_header.bit_count <= 8:
+            palette_start = BMP_HEADER_SIZE + dib_size
+            palette_size = self.file_header.pixel_offset - palette_start
+            
+            if palette_size > 0:
+                self.palette = data[palette_start:palette_start+palette_size]
+        
+        # Piksel verisini yükle
+        pixel_start = self.file_header.pixel_offset
+        if pixel_start > len(data):
+            raise BMPError("Geçersiz piksel verisi offseti")
+        
+        self.pixel_data = data[pixel_start:file_size]
+        self._loaded_pixel_data = self.pixel_data
+        
+        # Dosya sonunda metadata olup olmadığını kontrol et
+        self._extract_metadata()
+    
+    def _parse_headers(self, data: Union[bytes, memoryview]) -> int:
+        """Dosya ve DIB başlıklarını ayrıştırır, DIB başlık boyutunu döndürür.
+        
+        Yalnızca dosyanın ilk BMP_HEADER_SIZE + DIB başlık boyutu kadar
+        baytına ihtiyaç duyar.
+        """
+        if len(data) < BMP_HEADER_SIZE:
+            raise BMPError("Geçersiz BMP dosyası: dosya çok küçük")
+        
+        # Dosya başlığını ayrıştır
+        signature, file_size, reserved1, reserved2, pixel_offset = struct.unpack(
+            BMP_HEADER_FORMAT, data[:BMP_HEADER_SIZE]
+        )
+        
+        if signature != b'BM':
+            raise BMPError(f"Geçersiz BMP imzası: {signature}")
+        
+        self.file_header = BMPFileHeader(
+            signature=signature,
+            file_size=file_size,
+            reserved1=reserved1,
+            reserved2=reserved2,
+            pixel_offset=pixel_offset
+        )
+        
+        # DIB başlık boyutunu oku
+        if len(data) < BMP_HEADER_SIZE + 4:
+            raise BMPError("Geçersiz BMP dosyası: DIB başlığı eksik")
+        
+        dib_size = struct.unpack('<I', data[BMP_HEADER_SIZE:BMP_HEADER_SIZE+4])[0]
+        
+        if dib_size not in DIB_HEADER_SIZES:
+            raise BMPError(f"Tanınmayan DIB başlık boyutu: {dib_size}")
+        
+        if len(data) < BMP_HEADER_SIZE + dib_size:
+            raise BMPError("Geçersiz BMP dosyası: DIB başlığı eksik")
+        
+        # Minimum BITMAPINFOHEADER formatı
+        if dib_size >= 40:
+            header_format = '<IiiHHIIiiII'
+            dib_data = data[BMP_HEADER_SIZE:BMP_HEADER_SIZE+40]
+            
+            try:
+                (header_size, width, height, planes, bit_count,
+                 compression, image_size, x_ppm, y_ppm,
+                 colors_used, colors_important) = struct.unpack(header_format, dib_data)
+            except struct.error as e:
+                raise BMPError(f"DIB başlığı ayrıştırma hatası: {e}")
+            
+            self.dib_header = DIBHeader(
+                header_size=header_size,
+                width=width,
+                height=abs(height),  # Yükseklik negatif olabilir - alt-üst olmayan görüntü
+                planes=planes,
+                bit_count=bit_count,
+                compression=compression,
+                image_size=image_size,
+                x_ppm=x_ppm,
+                y_ppm=y_ppm,
+                colors_used=colors_used,
+                colors_important=colors_important,
+                raw_data=bytes(data[BMP_HEADER_SIZE:BMP_HEADER_SIZE+dib_size]),
+                top_down=height < 0
+            )
+        else:
+            # BITMAPCOREHEADER gibi eski formatları desteklemiyoruz
+            raise BMPError(f"Desteklenmeyen BMP formatı: {DIB_HEADER_SIZES.get(dib_size, 'Bilinmeyen')}")
+        
+        return dib_size
+    
+    def close(self) -> None:
+        """Bellek eşlemesini (varsa) serbest bırakır."""
+        if self._mmap is None:
+            return
+        
+        for name in ('pixel_data', 'palette', 'raw_data'):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                try:
+                    view.release()
+                except BufferError:
+                    pass  # Dışarıda hâlâ kullanılan bir görünüm var
+                setattr(self, name, None)
+        
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # Dışa aktarılmış görünümler kapanınca çöp toplayıcı serbest bırakır
+        self._mmap = None
+    
+    def _reset_metadata(self) -> None:
+        """Yüklenmiş metadata durumunu temizler."""
+        self.metadata = None
+        self._metadata_password = None
+        self._encrypted_metadata = None
+        self._metadata_block = None
+    
+    def _extract_metadata(self) -> None:
+        """Dosyadan metadata çıkarmayı dener."""
+        if not self.raw_data or len(self.raw_data) <= self.file_header.file_size:
+            return  # Metadata yok
+        
+        # Dosya sonunda BMPM imzasını ara
+        with profiling.span("metadata.extract"):
+            self._parse_metadata_block(self.raw_data[self.file_header.file_size:])
+    
+    def _parse_metadata_block(self, eof_data: Union[bytes, memoryview]) -> None:
+        """Dosya sonundaki BMPM metadata bloğunu ayrıştırır."""
+        if len(eof_data) >= 16 and eof_data[:4] == METADATA_SIGNATURE:
+            try:
+                # Metadata blok boyutunu oku
+                block_size = struct.unpack("<I", eof_data[4:8])[0]
+                
+                if block_size <= len(eof_data):
+                    # Sürüm, şifreleme bayrakları vb. oku
+                    version = struct.unpack("<H", eof_data[8:10])[0]
+                    is_encrypted = eof_data[10] == 1
+                    
+                    # Metadata verilerini çıkar
+                    metadata_data = eof_data[12:block_size-4]  # Son 4 bayt sağlama toplamıdır
+                    
+                    # Sağlama toplamını doğrula (yazarken blok boyutu alanı
+                    # henüz sıfırken hesaplanır)
+                    stored_checksum = struct.unpack("<I", eof_data[block_size-4:block_size])[0]
+                    calculated_checksum = binascii.crc32(eof_data[:4])
+                    calculated_checksum = binascii.crc32(b'\x00\x00\x00\x00', calculated_checksum)
+                    calculated_checksum = binascii.crc32(eof_data[8:block_size-4], calculated_checksum) & 0xFFFFFFFF
+                    
+                    if stored_checksum != calculated_checksum:
+                        print("UYARI: Metadata sağlama toplamı eşleşmiyor, veri bozulmuş olabilir")
+                    
+                    # Şifreli veri extract_metadata(password) çağrılınca çözülür;
+                    # çözülmeden kaydedilirse blok olduğu gibi korunur
+                    if is_encrypted:
+                        if not CRYPTO_AVAILABLE:
+                            print("UYARI: Şifreli metadata bulundu ama şifreleme kütüphanesi yüklü değil")
+                        self._encrypted_metadata = bytes(metadata_data)
+                        self._metadata_block = bytes(eof_data[:block_size])
+                        return
+                    
+                    # Metadata'yı yükle (mmap modunda küçük blok burada kopyalanır)
+                    self.metadata = Metadata.from_bytes(bytes(metadata_data))
+            except Exception as e:
+                print(f"Metadata ayrıştırma hatası: {e}")
+    
+    @profiling.traced("bmp.load_headers")
+    def load_headers(self, file_path: str) -> None:
+        """Yalnızca başlıkları ve dosya sonu metadata bloğunu okur.
+        
+        Piksel verisi ve palet yüklenmez; okunan bayt miktarı dosya
+        boyutundan bağımsızdır (başlıklar + metadata bloğu).
+        """
+        self.close()
+        self.file_path = file_path
+        self.raw_data = None
+        self.pixel_data = None
+        self._loaded_pixel_data = None
+        self.palette = None
+        self._reset_metadata()
+        
+        with open(file_path, 'rb') as f:
+            # Dosya başlığı + en büyük DIB başlığı tek okumada gelir
+            head = f.read(BMP_HEADER_SIZE + max(DIB_HEADER_SIZES))
+            self._parse_headers(head)
+            
+            # Dosya sonu metadata bloğu (varsa)
+            actual_size = os.fstat(f.fileno()).st_size
+            if actual_size - self.file_header.file_size >= 16:
+                f.seek(self.file_header.file_size)
+                block_head = f.read(8)
+                if block_head[:4] == METADATA_SIGNATURE:
+                    block_size = struct.unpack("<I", block_head[4:8])[0]
+                    if 16 <= block_size <= actual_size - self.file_header.file_size:
+                        self._parse_metadata_block(block_head + f.read(block_size - 8))
+    
+    @classmethod
+    def probe(cls, file_path: str) -> Dict[str, Any]:
+        """Dosyayı tamamen okumadan get_info() ile aynı yapıda bilgi döndürür."""
+        bmp = cls()
+        bmp.load_headers(file_path)
+        return bmp.get_info()
+    
+    def add_metadata(self, metadata: Metadata, method: MetadataStorageMethod = MetadataStorageMethod.EOF_APPEND,
+                     password: Optional[str] = None, cipher: str = DEFAULT_CIPHER) -> None:
+        """BMP dosyasına metadata ekler.
+        
+        Parola (veya BMPFile'a verilmiş anahtarlık) varsa metadata bloğu
+        kaydedilirken cipher ile şifrelenir.
+        """
+        _cipher_id(cipher)
+        self.metadata = metadata
+        self._metadata_password = password
+        self._metadata_cipher = cipher
+        
+        # Şimdilik sadece EOF_APPEND metodu destekleniyor
+        if method != MetadataStorageMethod.EOF_APPEND:
+            raise NotImplementedError(f"Henüz desteklenmeyen metadata depolama metodu: {method}")
+    
+    def save(self, output_path: str) -> None:
+        """BMP dosyasını kaydeder, metadata dahil.
+        
+        Başlıklar, palet ve (değiştirilmiş olabilecek) piksel verisi ayrı
+        ayrı yazılır; tüm dosyanın bellekte ikinci bir kopyası oluşturulmaz.
+        """
+        if not self.file_header or not self.dib_header or not self.pixel_data:
+            raise BMPError("Kaydetmeden önce geçerli bir BMP yüklenmelidir")
+        
+        with profiling.span("bmp.save"):
+            metadata_bytes = self._metadata_bytes()
+            
+            # Eşlenmiş kaynak dosyanın üzerine yazmak eşlemeyi bozar; geçici
+            # dosyaya yazıp atomik olarak yer değiştir
+            replace_source = self._overwrites_mapping(output_path)
+            target_path = output_path + '.tmp' if replace_source else output_path
+            
+            with profiling.span("file.write"):
+                with open(target_path, 'wb') as f:
+                    # Orijinal başlıklar ve palet
+                    f.write(self.raw_data[:self.file_header.pixel_offset])
+                    # Piksel verisi
+                    f.write(self.pixel_data)
+                    # Metadata ekle (varsa)
+                    f.write(metadata_bytes)
+            
+            profiling.count("bytes_written", self.file_header.pixel_offset + len(self.pixel_data) + len(metadata_bytes))
+            
+            if replace_source:
+                os.replace(target_path, output_path)
+    
+    @profiling.traced("bmp.update_metadata")
+    def update_metadata(self, fsync: bool = True, atomic: bool = False) -> int:
+        """Kaynak dosyadaki dosya sonu metadata bloğunu piksel verisine dokunmadan yeniler.
+        
+        Yeni blok file_header.file_size konumundan itibaren yazılır ve dosya
+        bloğun sonunda kesilir; okunan ve yazılan veri metadata boyutu
+        kadardır. Başlıklar load_headers ile okunmuşsa piksel verisi hiç
+        okunmaz. fsync=True ise dönmeden önce veri diske yazdırılır.
+        
+        Yerinde yazma sırasında kesilen bir işlem metadata bloğunu bozuk
+        bırakabilir (piksel verisi etkilenmez). atomic=True ise bunun yerine
+        görüntü kısmı geçici bir dosyaya kopyalanır, yeni blok eklenir ve
+        geçici dosya kaynağın yerine atomik olarak taşınır; bu yol dosya
+        boyutu kadar G/Ç yapar. Yazılan metadata bloğunun boyutunu döndürür.
+        """
+        if not self.file_header or not self.dib_header or not self.file_path:
+            raise BMPError("Metadata güncellemeden önce bir BMP dosyası yüklenmelidir")
+        
+        if self.is_mapped:
+            raise BMPError("Bellek eşlemeli dosyanın metadata'sı yerinde güncellenemez; save() kullanın")
+        
+        if self.pixel_data is not self._loaded_pixel_data:
+            raise BMPError("Piksel verisi değiştirilmiş; yalnızca metadata yazılacağı için save() kullanın")
+        
+        block = self._metadata_bytes()
+        image_size = self.file_header.file_size
+        
+        with open(self.file_path, 'r+b') as f:
+            actual_size = os.fstat(f.fileno()).st_size
+            head = f.read(BMP_HEADER_SIZE)
+            
+            # Dosya yüklendikten sonra değişmişse veya başlıktaki boyut piksel verisini
+            # kapsamıyorsa kesme işlemi görüntüyü bozabilir
+            if len(head) < BMP_HEADER_SIZE or struct.unpack('<I', head[2:6])[0] != image_size:
+                raise BMPError("Dosya yüklendikten sonra değişmiş, metadata güncellenmedi")
+            
+            minimum_size = self.file_header.pixel_offset
+            if self.compression_type in ("BI_RGB", "BI_BITFIELDS", "BI_ALPHABITFIELDS"):
+                minimum_size += self.row_size * abs(self.height)
+            if not minimum_size <= image_size <= actual_size:
+                raise BMPError(f"Başlıktaki dosya boyutu ({image_size}) geçersiz, metadata yerinde güncellenemez")
+            
+            if not atomic:
+                # Önce yaz sonra kes: yeni blok eskisinden kısaysa kalan baytlar silinir
+                f.seek(image_size)
+                f.write(block)
+                f.truncate()
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+                profiling.count("bytes_written", len(block))
+                self._metadata_block = block
+                return len(block)
+            
+            target_path = self.file_path + '.tmp'
+            try:
+                with open(target_path, 'wb') as out:
+                    f.seek(0)
+                    for chunk in _iter_file(f, image_size, DEFAULT_STREAM_CHUNK):
+                        out.write(chunk)
+                    out.write(block)
+                    out.flush()
+                    if fsync:
+                        os.fsync(out.fileno())
+            except BaseException:
+                if os.path.exists(target_path):
+                    os.remove(target_path)
+                raise
+        
+        os.replace(target_path, self.file_path)
+        profiling.count("bytes_written", image_size + len(block))
+        self._metadata_block = block
+        return len(block)
+    
+    def _metadata_bytes(self) -> bytes:
+        """Dosya sonuna yazılacak metadata bloğunu döndürür (yoksa boş)."""
+        if self.metadata:
+            return self._prepare_metadata_block(self._metadata_password)
+        # Çözülmemiş şifreli metadata olduğu gibi korunur
+        return self._metadata_block or b''
+    
+    def _overwrites_mapping(self, output_path: str) -> bool:
+        """Çıktı yolunun bellek eşlemeli kaynak dosyanın kendisi olup olmadığını döndürür."""
+        return (self.is_mapped and os.path.exists(output_path)
+                and os.path.samefile(output_path, self.file_path))
+    
+    def _prepare_metadata_block(self, password: Optional[str] = None) -> bytes:
+        """Metadata bloğunu hazırlar."""
+        if not self.metadata:
+            return b''
+        
+        # Metadata verilerini hazırla
+        metadata_data = self.metadata.to_bytes()
+        is_encrypted = False
+        
+        # Şifreleme (eğer parola veya anahtarlık sağlanmışsa ve kriptografi kütüphanesi mevcutsa)
+        if (password or self.keyring) and CRYPTO_AVAILABLE:
+            metadata_data = self._encrypt_data(metadata_data, password)
+            is_encrypted = True
+        
+        # Metadata başlığını oluştur
+        header = bytearray()
+        header.extend(METADATA_SIGNATURE)  # 4 bayt imza
+        
+        # Tüm blok boyutunu hesaplamak için geçici yer tutucu
+        header.extend(b'\x00\x00\x00\x00')  # 4 bayt blok boyutu (şimdilik 0)
+        
+        # Sürüm, bayraklar vb.
+        header.extend(struct.pack("<H", 1))  # 2 bayt sürüm numarası
+        header.append(1 if is_encrypted else 0)  # 1 bayt şifreleme bayrağı
+        header.append(0)  # 1 bayt rezerve
+        
+        # Metadata verilerini ekle
+        full_block = bytearray(header)
+        full_block.extend(metadata_data)
+        
+        # Sağlama toplamı hesapla ve ekle
+        checksum = binascii.crc32(full_block) & 0xFFFFFFFF
+        full_block.extend(struct.pack("<I", checksum))
+        
+        # Gerçek blok boyutunu güncelle
+        block_size = len(full_block)
+        full_block[4:8] = struct.pack("<I", block_size)
+        
+        return bytes(full_block)
+    
+    def _encrypt_data(self, data: bytes, password: Optional[str]) -> bytes:
+        """Veriyi şifreler."""
+        try:
+            with profiling.span("metadata.encrypt", bytes=len(data)):
+                return encrypt_payload(data, password, self.keyring, self._metadata_cipher)
+        except EncryptionError as e:
+            raise MetadataError(str(e))
+    
+    def _decrypt_data(self, encrypted_data: bytes, password: Optional[str]) -> bytes:
+        """Şifreli veriyi çözer."""
+        try:
+            with profiling.span("metadata.decrypt", bytes=len(encrypted_data)):
+                return decrypt_payload(encrypted_data, password, self.keyring)
+        except EncryptionError as e:
+            raise MetadataError(str(e))
+    
+    @property
+    def width(self) -> int:
+        """Görüntü genişliğini döndürür."""
+        return self.dib_header.width if self.dib_header else 0
+    
+    @property
+    def height(self) -> int:
+        """Görüntü yüksekliğini döndürür."""
+        return self.dib_header.height if self.dib_header else 0
+    
+    @property
+    def bits_per_pixel(self) -> int:
+        """Piksel başına bit sayısını döndürür."""
+        return self.dib_header.bit_count if self.dib_header else 0
+    
+    @property
+    def file_size(self) -> int:
+        """Dosya boyutunu döndürür."""
+        return self.file_header.file_size if self.file_header else 0
+    
+    @property
+    def pixel_data_offset(self) -> int:
+        """Piksel verilerine offseti döndürür."""
+        return self.file_header.pixel_offset if self.file_header else 0
+    
+    @property
+    def compression_type(self) -> str:
+        """Sıkıştırma türünü döndürür."""
+        if not self.dib_header:
+            return "Bilinmeyen"
+        return BI_COMPRESSION.get(self.dib_header.compression, f"Bilinmeyen ({self.dib_header.compression})")
+    
+    @property
+    def row_size(self) -> int:
+        """4 bayta hizalanmış (dolgulu) bir piksel satırının bayt boyutunu döndürür."""
+        return ((self.width * self.bits_per_pixel + 31) // 32) * 4
+    
+    @property
+    def header_type(self) -> str:
+        """Başlık tipini döndürür."""
+        if not self.dib_header:
+            return "Bilinmeyen"
+        return DIB_HEADER_SIZES.get(self.dib_header.header_size, f"Bilinmeyen ({self.dib_header.header_size})")
+    
+    def get_info(self) -> Dict[str, Any]:
+        """BMP dosyası hakkında bilgileri sözlük olarak döndürür."""
+        if not self.file_header or not self.dib_header:
+            return {"error": "BMP yüklenmedi"}
+        
+        info = {
+            "file_name": os.path.basename(self.file_path) if self.file_path else "Bilinmeyen",
+            "file_size": self.file_size,
+            "header_type": self.header_type,
+            "dimensions": f"{self.width}x{self.height}",
+            "bit_depth": self.bits_per_pixel,
+            "compression": self.compression_type,
+            "has_metadata": self.metadata is not None or self._encrypted_metadata is not None
+        }
+        
+        if self.metadata:
+            info["metadata_keys"] = list(self.metadata.entries.keys())
+        elif self._encrypted_metadata is not None:
+            info["metadata_encrypted"] = True
+        
+        return info
+    
+    def as_array(self, writable: bool = False) -> 'np.ndarray':
+        """Piksel verisini (yükseklik, genişlik, kanal) uint8 dizisi olarak döndürür.
+        
+        Dönen dizi piksel tamponuyla belleği paylaşır: satır sonu dolgusu
+        adımlarla (strides) atlanır ve alttan-üste saklanan görüntüler
+        negatif satır adımıyla yukarıdan aşağıya sunulur; kopya yapılmaz.
+        Kanallar BMP'deki sırayla (BGR/BGRA) gelir, 8-bit görüntülerde tek
+        kanal palet indeksidir.
+        
+        writable=True ise piksel tamponu salt okunursa bir kez yazılabilir
+        kopyaya dönüştürülür ve dizi üzerindeki değişiklikler doğrudan
+        pixel_data'ya yansır.
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("Dizi erişimi için numpy kütüphanesi gereklidir")
+        
+        if not self.dib_header or self.pixel_data is None:
+            raise BMPError("Piksel verisi yüklenmedi")
+        
+        if self.bits_per_pixel not in (8, 24, 32) or self.compression_type not in ("BI_RGB", "BI_BITFIELDS"):
+            raise BMPError(f"Dizi erişimi desteklenmiyor: {self.bits_per_pixel}-bit, {self.compression_type}")
+        
+        height, width = self.height, self.width
+        channels = self.bits_per_pixel // 8
+        row_size = self.row_size
+        
+        if len(self.pixel_data) < height * row_size:
+            raise BMPError(f"Piksel verisi eksik: {len(self.pixel_data)} < {height * row_size} bayt")
+        
+        if writable and memoryview(self.pixel_data).readonly:
+            self.pixel_data = bytearray(self.pixel_data)
+        
+        rows = np.frombuffer(self.pixel_data, dtype=np.uint8, count=height * row_size)
+        rows = rows.reshape(height, row_size)
+        
+        # Dolguyu atla; son eksen bitişik olduğu için bu yeniden şekillendirme bir görünümdür
+        array = rows[:, :width * channels]
+        array.shape = (height, width, channels)
+        
+        if not self.dib_header.top_down:
+            array = array[::-1]
+        
+        if not writable:
+            array.flags.writeable = False
+        
+        return array
+    
+    def write_array(self, array: 'np.ndarray') -> None:
+        """(yükseklik, genişlik, kanal) dizisini dolgu ve yönü koruyarak piksel verisine yazar."""
+        target = self.as_array(writable=True)
+        
+        if array.shape != target.shape:
+            raise BMPError(f"Dizi boyutu uyuşmuyor: {array.shape} != {target.shape}")
+        
+        target[...] = array
+    
+    def iter_rows(self, band: int = DEFAULT_ROW_BAND) -> Iterator[Tuple[int, bytes]]:
+        """Piksel satırlarını diskten bant bant okur.
+        
+        Her adımda (ilk satır indeksi, dolgusuz satır verisi) döndürür.
+        Satırlar dosyadaki saklama sırasıyla gelir; alttan-üste dosyalarda
+        0. satır görüntünün en alt satırıdır. Yalnızca başlıkların
+        yüklenmiş olması yeterlidir (bkz. load_headers), bellekte aynı anda
+        tek bir bant tutulur.
+        """
+        if not self.file_header or not self.dib_header or not self.file_path:
+            raise BMPError("Satır okumak için önce BMP başlıkları yüklenmelidir")
+        
+        if band <= 0:
+            raise ValueError(f"Geçersiz bant yüksekliği: {band}")
+        
+        row_size = self.row_size
+        row_bytes = (self.width * self.bits_per_pixel + 7) // 8
+        
+        with open(self.file_path, 'rb') as f:
+            f.seek(self.pixel_data_offset)
+            
+            for first_row in range(0, self.height, band):
+                rows = min(band, self.height - first_row)
+                block = f.read(rows * row_size)
+                
+                if len(block) < rows * row_size:
+                    raise BMPError(f"Dosya beklenenden kısa: {first_row}. satırda kesildi")
+                
+                if row_size != row_bytes:
+                    view = memoryview(block)
+                    block = b''.join(view[i * row_size:i * row_size + row_bytes] for i in range(rows))
+                
+                yield first_row, block
+    
+    def extract_metadata(self, password: Optional[str] = None) -> Optional[Metadata]:
+        """Dosyadan metadata çıkarır ve döndürür, şifreliyse parola veya anahtarlıkla çözer."""
+        if self.metadata is None and self._encrypted_metadata is not None:
+            if not password and self.keyring is None:
+                raise MetadataError("Metadata şifreli: çözmek için parola gereklidir")
+            
+            plaintext = self._decrypt_data(self._encrypted_metadata, password)
+            self.metadata = Metadata.from_bytes(plaintext)
+            self._metadata_password = password
+        
+        return self.metadata
+
+
+class BMPStreamWriter:
+    """Başlığı önce yazıp piksel satırlarını parça parça kabul eden BMP yazıcısı.
+    
+    Satırlar dosyadaki saklama sırasıyla (BMPFile.iter_rows ile aynı sıra)
+    ve dolgusuz olarak verilir; dolgu yazıcı tarafından eklenir. Bellekte
+    hiçbir zaman bir banttan fazla piksel verisi tutulmaz.
+    """
+    
+    def __init__(self, file_path: str, width: int, height: int, bit_count: int = 24,
+                 top_down: bool = False, header: Optional[bytes] = None):
+        if width <= 0 or height <= 0:
+            raise BMPError(f"Geçersiz görüntü boyutu: {width}x{height}")
+        
+        self.file_path = file_path
+        self.width = width
+        self.height = height
+        self.bit_count = bit_count
+        self.row_bytes = (width * bit_count + 7) // 8
+        self.row_size = ((width * bit_count + 31) // 32) * 4
+        self.rows_written = 0
+        self._padding = b'\x00' * (self.row_size - self.row_bytes)
+        self._pending = b''
+        
+        if header is None:
+            if bit_count not in (24, 32):
+                raise BMPError(f"Paletsiz başlık yalnızca 24/32-bit için oluşturulabilir: {bit_count}")
+            header = self._build_header(width, height, bit_count, top_down)
+        
+        # Dosya ve görüntü boyutu alanlarını yazılacak veriye göre güncelle
+        header = bytearray(header)
+        image_size = self.row_size * height
+        struct.pack_into('<I', header, 2, len(header) + image_size)
+        struct.pack_into('<I', header, 10, len(header))
+        struct.pack_into('<I', header, BMP_HEADER_SIZE + 20, image_size)
+        
+        self._file = open(file_path, 'wb')
+        self._file.write(header)
+    
+    @classmethod
+    def like(cls, file_path: str, source: BMPFile) -> 'BMPStreamWriter':
+        """Kaynak BMP'nin başlıklarını ve paletini kopyalayan bir yazıcı oluşturur."""
+        offset = source.pixel_data_offset
+        if source.raw_data is not None:
+            header = bytes(source.raw_data[:offset])
+        else:
+            with open(source.file_path, 'rb') as f:
+                header = f.read(offset)
+        
+        return cls(file_path, source.width, source.height, source.bits_per_pixel,
+                   header=header)
+    
+    @staticmethod
+    def _build_header(width: int, height: int, bit_count: int, top_down: bool) -> bytes:
+        """Paletsiz bir BITMAPINFOHEADER başlığı oluşturur (boyut alanları sonra doldurulur)."""
+        file_header = struct.pack(BMP_HEADER_FORMAT, b'BM', 0, 0, 0, BMP_HEADER_SIZE + 40)
+        dib_header = struct.pack('<IiiHHIIiiII', 40, width, -height if top_down else height,
+                                 1, bit_count, 0, 0, 2835, 2835, 0, 0)
+        return file_header + dib_header
+    
+    def __enter__(self) -> 'BMPStreamWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+    
+    def write_rows(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Dolgusuz satır verisi yazar; satır sınırında bitmeyen kalan bir sonraki çağrıya aktarılır."""
+        if self._pending:
+            data = self._pending + bytes(data)
+            self._pending = b''
+        
+        view = memoryview(data)
+        complete_rows = len(view) // self.row_bytes
+        
+        if self.rows_written + complete_rows > self.height:
+            raise BMPError(f"Fazla satır yazıldı: {self.rows_written + complete_rows} > {self.height}")
+        
+        if self._padding:
+            for i in range(complete_rows):
+                self._file.write(view[i * self.row_bytes:(i + 1) * self.row_bytes])
+                self._file.write(self._padding)
+        else:
+            self._file.write(view[:complete_rows * self.row_bytes])
+        
+        self.rows_written += complete_rows
+        self._pending = bytes(view[complete_rows * self.row_bytes:])
+    
+    def close(self, metadata_block: bytes = b'') -> None:
+        """Satır sayısını doğrular, isteğe bağlı metadata bloğunu ekler ve dosyayı kapatır."""
+        if self._file.closed:
+            return
+        
+        try:
+            if self._pending or self.rows_written != self.height:
+                raise BMPError(f"Eksik satır: {self.rows_written}/{self.height} satır yazıldı")
+            
+            self._file.write(metadata_block)
+        finally:
+            self._file.close()
+
+
+def _iter_file(fileobj: BinaryIO, length: int, read_size: int) -> Iterator[bytes]:
+    """Dosya nesnesinden length baytı read_size'lık okumalarla üretir."""
+    remaining = length
+    while remaining:
+        data = _read_exact(fileobj, min(read_size, remaining))
+        remaining -= len(data)
+        yield data
+
+
+def _rechunk(pieces: Iterator[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Farklı boyuttaki parçaları chunk_size'lık parçalara (son parça daha kısa) böler."""
+    buffer = bytearray()
+    for piece in pieces:
+        buffer.extend(piece)
+        while len(buffer) >= chunk_size:
+            yield bytes(buffer[:chunk_size])
+            del buffer[:chunk_size]
+    
+    if buffer:
+        yield bytes(buffer)
+
+
+def _lsb_group_range(start_bit: int, n_bits: int, per_group: int) -> Tuple[int, int, int]:
+    """Bit aralığını kapsayan piksel grubu aralığını ve ilk gruptaki bit ofsetini döndürür."""
+    first_group = start_bit // per_group
+    end_group = -(-(start_bit + n_bits) // per_group)
+    return first_group, end_group, start_bit - first_group * per_group
+
+
+def _lsb_channel_view(pixels: 'np.ndarray', first_group: int, end_group: int,
+                      bytes_per_pixel: int, usable_channels: int) -> 'np.ndarray':
+    """Piksel tamponu üzerinde (grup, kanal) biçiminde kopyasız görünüm döndürür."""
+    if end_group * bytes_per_pixel > pixels.size:
+        raise SteganographyError("Bit aralığı piksel verisinin dışında")
+    
+    groups = pixels[first_group * bytes_per_pixel:end_group * bytes_per_pixel]
+    return groups.reshape(end_group - first_group, bytes_per_pixel)[:, :usable_channels]
+
+
+def _lsb_read_bits(pixels: 'np.ndarray', start_bit: int, n_bits: int, bytes_per_pixel: int,
+                   usable_channels: int, bit_depth: int) -> 'np.ndarray':
+    """LSB yuvalarından [start_bit, start_bit + n_bits) aralığındaki bitleri okur.
+    
+    Yuva sırası döngü motoruyla aynıdır: piksel, kanal, bit (düşükten yükseğe).
+    """
+    per_group = usable_channels * bit_depth
+    first_group, end_group, offset = _lsb_group_range(start_bit, n_bits, per_group)
+    channel_bytes = _lsb_channel_view(pixels, first_group, end_group, bytes_per_pixel, usable_channels)
+    
+    shifts = np.arange(bit_depth, dtype=np.uint8)
+    bits = (channel_bytes[..., np.newaxis] >> shifts) & 1
+    return bits.reshape(-1)[offset:offset + n_bits]
+
+
+def _lsb_write_bits(pixels: 'np.ndarray', start_bit: int, bits: 'np.ndarray', bytes_per_pixel: int,
+                    usable_channels: int, bit_depth: int) -> None:
+    """Bitleri start_bit yuvasından itibaren piksel tamponuna yerinde yazar."""
+    per_group = usable_channels * bit_depth
+    first_group, end_group, offset = _lsb_group_range(start_bit, bits.size, per_group)
+    channel_bytes = _lsb_channel_view(pixels, first_group, end_group, bytes_per_pixel, usable_channels)
+    
+    # Yazılmayan yuvalar maske dışında kalır ve değişmez
+    slots = (end_group - first_group) * per_group
+    values = np.zeros(slots, dtype=np.uint8)
+    mask = np.zeros(slots, dtype=np.uint8)
+    values[offset:offset + bits.size] = bits
+    mask[offset:offset + bits.size] = 1
+    
+    weights = (1 << np.arange(bit_depth)).astype(np.uint8)
+    shape = (end_group - first_group, usable_channels, bit_depth)
+    values = (values.reshape(shape) * weights).sum(axis=2, dtype=np.uint8)
+    mask = (mask.reshape(shape) * weights).sum(axis=2, dtype=np.uint8)
+    
+    channel_bytes &= ~mask
+    channel_bytes |= values
+
+
+class LSBSteganography:
+    """En Az Önemli Bit (LSB) steganografi sınıfı."""
+    
+    def __init__(self, bmp_file: BMPFile, keyring: Optional[Keyring] = None):
+        self.bmp_file = bmp_file
+        self.keyring = keyring
+        
+        if not self.bmp_file.pixel_data:
+            raise SteganographyError("Steganografi için piksel verisi gereklidir")
+        
+        # BMP formatı kontrolü
+        if self.bmp_file.bits_per_pixel != 24 and self.bmp_file.bits_per_pixel != 32:
+            raise SteganographyError(f"LSB steganografi sadece 24-bit veya 32-bit BMP dosyalarını destekler, şu anki: {self.bmp_file.bits_per_pixel}")
+        
+        if self.bmp_file.compression_type != "BI_RGB":
+            raise SteganographyError(f"LSB steganografi sıkıştırmasız BMP dosyaları gerektirir, şu anki: {self.bmp_file.compression_type}")
+    
+    def calculate_capacity(self, bit_depth: int = DEFAULT_LSB_DEPTH, channels: int = DEFAULT_LSB_CHANNELS) -> int:
+        """LSB steganografi ile saklanabilecek maksimum bayt sayısını hesaplar."""
+        bytes_per_pixel = self.bmp_file.bits_per_pixel // 8
+        usable_channels = min(channels, bytes_per_pixel)
+        
+        # Toplam bit kapasitesi
+        total_bits = self.bmp_file.width * self.bmp_file.height * usable_channels * bit_depth
+        
+        # Kapasite baytlara dönüştürülür (8 bit = 1 bayt)
+        byte_capacity = total_bits // 8
+        
+        # 4 baytlık veri uzunluğu bilgisi için alan ayır
+        return max(0, byte_capacity - 4)
+    
+    def _layout(self, bit_depth: int, channels: int) -> Tuple[int, int]:
+        """Piksel başına bayt ve kullanılabilir kanal sayısını döndürür."""
+        if not 1 <= bit_depth <= 8:
+            raise SteganographyError(f"Geçersiz bit derinliği: {bit_depth} (1-8 arası olmalı)")
+        if channels < 1:
+            raise SteganographyError(f"Geçersiz kanal sayısı: {channels}")
+        
+        bytes_per_pixel = self.bmp_file.bits_per_pixel // 8
+        return bytes_per_pixel, min(channels, bytes_per_pixel)
+    
+    @staticmethod
+    def _resolve_engine(engine: str) -> str:
+        """'auto' seçimini kullanılabilir motora çevirir ve motoru doğrular."""
+        if engine not in LSB_ENGINES:
+            raise SteganographyError(f"Bilinmeyen LSB motoru: {engine} (seçenekler: {', '.join(LSB_ENGINES)})")
+        
+        if engine == "auto":
+            return "numpy" if NUMPY_AVAILABLE else "python"
+        
+        if engine == "numpy" and not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy LSB motoru için numpy kütüphanesi gereklidir")
+        
+        return engine
+    
+    def hide_data(self, data: bytes, bit_depth: int = DEFAULT_LSB_DEPTH, 
+                 channels: int = DEFAULT_LSB_CHANNELS, password: Optional[str] = None,
+                 engine: str = DEFAULT_LSB_ENGINE, cipher: str = DEFAULT_CIPHER) -> None:
+        """Verilen veriyi BMP görüntüsünde gizler.
+        
+        engine: "python" bit bit çalışan döngüleri, "numpy" vektörel motoru
+        kullanır; "auto" numpy varsa onu seçer. İki motor bayt bayt aynı
+        çıktıyı üretir. cipher parola verildiğinde kullanılacak AEAD'dir
+        (bkz. CIPHERS); çıkarma sırasında başlıktan otomatik okunur.
+        """
+        engine = self._resolve_engine(engine)
+        
+        with profiling.span("lsb.hide", bytes=len(data), engine=engine):
+            # Şifreleme (eğer parola veya anahtarlık sağlanmışsa)
+            if (password or self.keyring) and CRYPTO_AVAILABLE:
+                data = self._encrypt_data(data, password, cipher)
+            
+            # Kapasite, başlık ve doğrulama etiketleri eklenmiş şifreli veriyle karşılaştırılır
+            max_capacity = self.calculate_capacity(bit_depth, channels)
+            if len(data) > max_capacity:
+                raise SteganographyError(f"Veri çok büyük: {len(data)} bayt > {max_capacity} bayt (maksimum kapasite)")
+            
+            # 4 baytlık veri uzunluğu + veri
+            data_to_hide = struct.pack("<I", len(data)) + data
+            
+            with profiling.span("lsb.embed"):
+                if engine == "numpy":
+                    self._hide_bits_numpy(data_to_hide, bit_depth, channels)
+                else:
+                    self._hide_bits_python(data_to_hide, bit_depth, channels)
+            
+            self._count_pixels(len(data_to_hide), bit_depth, channels)
+    
+    def _count_pixels(self, n_bytes: int, bit_depth: int, channels: int) -> None:
+        """n_bytes baytlık gizli verinin dokunduğu piksel sayısını sayaca ekler."""
+        if profiling.is_enabled():
+            _, usable_channels = self._layout(bit_depth, channels)
+            profiling.count("pixels_touched", -(-n_bytes * 8 // (usable_channels * bit_depth)))
+    
+    def _hide_bits_python(self, data_to_hide: bytes, bit_depth: int, channels: int) -> None:
+        """Veriyi piksel, kanal ve bit üzerinde dolaşan döngülerle gizler."""
+        # Veriyi bit dizisine dönüştür
+        data_bits = []
+        for byte in data_to_hide:
+            for i in range(8):
+                data_bits.append((byte >> i) & 1)
+        
+        # BMP piksel verisinin bir kopyasını oluştur
+        new_pixel_data = bytearray(self.bmp_file.pixel_data)
+        self._embed_bits_python(new_pixel_data, data_bits, bit_depth, channels)
+        
+        # Güncellenmiş piksel verisini BMP dosyasına kaydet
+        self.bmp_file.pixel_data = bytes(new_pixel_data)
+    
+    def _embed_bits_python(self, new_pixel_data: bytearray, data_bits: List[int],
+                           bit_depth: int, channels: int) -> None:
+        """Bit listesini tamponun başından itibaren yerinde gizler."""
+        bytes_per_pixel, usable_channels = self._layout(bit_depth, channels)
+        
+        bit_index = 0
+        total_bits = len(data_bits)
+        
+        # Her pikseldeki her kanalın her bitini güncelle
+        for i in range(0, len(new_pixel_data), bytes_per_pixel):
+            # Her kanal için
+            for c in range(usable_channels):
+                if i + c >= len(new_pixel_data):
+                    break
+                
+                # Her bit için (belirtilen bit derinliğine göre)
+                for b in range(bit_depth):
+                    if bit_index >= total_bits:
+                        break
+                    
+                    # En düşük önemli bit(ler)i değiştir
+                    if data_bits[bit_index] == 1:
+                        new_pixel_data[i + c] |= (1 << b)
+                    else:
+                        new_pixel_data[i + c] &= ~(1 << b)
+                    
+                    bit_index += 1
+                    
+                    if bit_index >= total_bits:
+                        break
+            
+            if bit_index >= total_bits:
+                break
+        
+        # Tampon bitmeden yazılamayan bit kaldıysa yarım kalan veri çözülemez
+        if bit_index < total_bits:
+            raise SteganographyError("Bit aralığı piksel verisinin dışında")
+    
+    def _hide_bits_numpy(self, data_to_hide: bytes, bit_depth: int, channels: int) -> None:
+        """Veriyi unpackbits ve maskelerle tek geçişte gizler."""
+        bytes_per_pixel, usable_channels = self._layout(bit_depth, channels)
+        
+        # Yazılabilir tampon (bytearray veya kopyala-yaz mmap) yerinde değiştirilir
+        if memoryview(self.bmp_file.pixel_data).readonly:
+            self.bmp_file.pixel_data = bytearray(self.bmp_file.pixel_data)
+        
+        pixels = np.frombuffer(self.bmp_file.pixel_data, dtype=np.uint8)
+        bits = np.unpackbits(np.frombuffer(data_to_hide, dtype=np.uint8), bitorder='little')
+        _lsb_write_bits(pixels, 0, bits, bytes_per_pixel, usable_channels, bit_depth)
+    
+    @profiling.traced("lsb.hide_stream")
+    def hide_stream(self, fileobj: BinaryIO, output_path: str, length: Optional[int] = None,
+                    bit_depth: int = DEFAULT_LSB_DEPTH, channels: int = DEFAULT_LSB_CHANNELS,
+                    password: Optional[str] = None, chunk_size: int = DEFAULT_STREAM_CHUNK,
+                    engine: str = DEFAULT_LSB_ENGINE, segment_size: int = DEFAULT_SEGMENT_SIZE,
+                    cipher: str = DEFAULT_CIPHER) -> int:
+        """Dosya nesnesindeki veriyi parça parça okuyup gizler ve sonucu output_path'e yazar.
+        
+        Yük ve taşıyıcı bantlar hâlinde işlenir: bellekte aynı anda en fazla
+        bir yük parçası ve onu taşıyan piksel bandı bulunur. Üretilen dosya
+        hide_data + save ile bayt bayt aynıdır. length verilmezse dosya
+        nesnesinin kalan boyutu seek/tell ile bulunur. Gizlenen bayt
+        sayısını döndürür.
+        
+        Parola verilirse yük parçalı AEAD kapsayıcısıyla (SegmentedEncryptor)
+        şifrelenir; şifreleme gizleme ile aynı akışta, parça parça yapılır.
+        cipher kapsayıcının AEAD'sini seçer ve başlığa kaydedilir.
+        """
+        engine = self._resolve_engine(engine)
+        bytes_per_pixel, usable_channels = self._layout(bit_depth, channels)
+        per_group = usable_channels * bit_depth
+        
+        if length is None:
+            try:
+                position = fileobj.tell()
+                length = fileobj.seek(0, os.SEEK_END) - position
+                fileobj.seek(position)
+            except (AttributeError, OSError):
+                raise SteganographyError("Akış uzunluğu belirlenemedi, length parametresini verin")
+        
+        if password or self.keyring:
+            try:
+                encryptor = SegmentedEncryptor(password, segment_size, keyring=self.keyring, cipher=cipher)
+            except EncryptionError as e:
+                raise SteganographyError(str(e))
+            hidden_length = encryptor.container_length(length)
+            payload = encryptor.encrypt_stream(fileobj, length)
+        else:
+            hidden_length = length
+            payload = _iter_file(fileobj, length, chunk_size)
+        
+        max_capacity = self.calculate_capacity(bit_depth, channels)
+        if hidden_length > max_capacity:
+            raise SteganographyError(f"Veri çok büyük: {hidden_length} bayt > {max_capacity} bayt (maksimum kapasite)")
+        
+        # Her parça tam sayıda piksel grubuna denk gelsin
+        chunk_size = max(per_group, chunk_size // per_group * per_group)
+        chunks = _rechunk(itertools.chain([struct.pack("<I", hidden_length)], payload), chunk_size)
+        
+        bmp = self.bmp_file
+        pixel_data = memoryview(bmp.pixel_data)
+        replace_source = bmp._overwrites_mapping(output_path)
+        target_path = output_path + '.tmp' if replace_source else output_path
+        position = 0
+        
+        with open(target_path, 'wb') as out:
+            out.write(bmp.raw_data[:bmp.file_header.pixel_offset])
+            
+            for chunk in chunks:
+                groups = -(-len(chunk) * 8 // per_group)
+                band = bytearray(pixel_data[position:position + groups * bytes_per_pixel])
+                
+                if engine == "numpy":
+                    bits = np.unpackbits(np.frombuffer(chunk, dtype=np.uint8), bitorder='little')
+                    _lsb_write_bits(np.frombuffer(band, dtype=np.uint8), 0, bits,
+                                    bytes_per_pixel, usable_channels, bit_depth)
+                else:
+                    bits = [(byte >> i) & 1 for byte in chunk for i in range(8)]
+                    self._embed_bits_python(band, bits, bit_depth, channels)
+                
+                out.write(band)
+                position += len(band)
+            
+            profiling.count("pixels_touched", position // bytes_per_pixel)
+            
+            # Yükten sonra kalan pikselleri değiştirmeden kopyala
+            for start in range(position, len(pixel_data), chunk_size):
+                out.write(pixel_data[start:start + chunk_size])
+            
+            out.write(bmp._metadata_bytes())
+        
+        if replace_source:
+            os.replace(target_path, output_path)
+        
+        return length
+    
+    @profiling.traced("lsb.extract_stream")
+    def extract_stream(self, out_fileobj: BinaryIO, bit_depth: int = DEFAULT_LSB_DEPTH,
+                       channels: int = DEFAULT_LSB_CHANNELS, password: Optional[str] = None,
+                       chunk_size: int = DEFAULT_STREAM_CHUNK, engine: str = DEFAULT_LSB_ENGINE) -> int:
+        """Gizli veriyi parça parça çıkarıp dosya nesnesine yazar, yazılan bayt sayısını döndürür.
+        
+        Parola verilirse parçalı kapsayıcının her parçası çıkarıldığı anda
+        çözülüp yazılır; bozuk bir parça ilk fırsatta hata verir.
+        """
+        if not self.bmp_file.pixel_data:
+            raise SteganographyError("Veri çıkarmak için piksel verisi gereklidir")
+        
+        engine = self._resolve_engine(engine)
+        
+        data_length = struct.unpack("<I", self._read_bytes(0, 4, bit_depth, channels, engine))[0]
+        self._check_length(data_length, bit_depth, channels)
+        
+        if password or self.keyring:
+            try:
+                return self._extract_stream_encrypted(out_fileobj, data_length, bit_depth, channels,
+                                                      password, engine)
+            except EncryptionError as e:
+                raise SteganographyError(f"Şifre çözme hatası: {e}")
+        
+        for offset in range(0, data_length, chunk_size):
+            count = min(chunk_size, data_length - offset)
+            out_fileobj.write(self._read_bytes(32 + offset * 8, count, bit_depth, channels, engine))
+        
+        return data_length
+    
+    def _segmented_decryptor(self, data_length: int, bit_depth: int, channels: int,
+                             password: str, engine: str) -> Optional[SegmentedDecryptor]:
+        """Yük parçalı kapsayıcıysa başlığını okuyup çözücü döndürür, değilse None."""
+        if data_length < SEGMENTED_HEADER_SIZE:
+            return None
+        
+        header = self._read_bytes(32, SEGMENTED_HEADER_SIZE, bit_depth, channels, engine)
+        if not is_segmented(header):
+            return None
+        
+        # Anahtarlıkla şifrelenmiş kapsayıcılarda başlığın sonunda ana tuz bulunur
+        header_size = segmented_header_size(header)
+        if header_size > data_length:
+            return None
+        if header_size > SEGMENTED_HEADER_SIZE:
+            header += self._read_bytes(32 + SEGMENTED_HEADER_SIZE * 8, header_size - SEGMENTED_HEADER_SIZE,
+                                       bit_depth, channels, engine)
+        
+        return SegmentedDecryptor(password, header, keyring=self.keyring)
+    
+    def _extract_stream_encrypted(self, out_fileobj: BinaryIO, data_length: int, bit_depth: int,
+                                  channels: int, password: str, engine: str) -> int:
+        """Şifreli yükü parça parça çıkarır, çözer ve yazar."""
+        decryptor = self._segmented_decryptor(data_length, bit_depth, channels, password, engine)
+        
+        if decryptor is None:
+            # Eski tek parça biçim: yalnızca bütün olarak çözülebilir
+            data = self._read_bytes(32, data_length, bit_depth, channels, engine)
+            plaintext = self._decrypt_data(data, password)
+            out_fileobj.write(plaintext)
+            return len(plaintext)
+        
+        segments = decryptor.segment_count(data_length)
+        step = decryptor.segment_size + AEAD_TAG_SIZE
+        written = 0
+        
+        for index in range(segments):
+            start = len(decryptor.header) + index * step
+            count = min(step, data_length - start)
+            chunk = self._read_bytes(32 + start * 8, count, bit_depth, channels, engine)
+            plaintext = decryptor.decrypt_segment(index, chunk, final=index == segments - 1)
+            out_fileobj.write(plaintext)
+            written += len(plaintext)
+        
+        return written
+    
+    def extract_data(self, bit_depth: int = DEFAULT_LSB_DEPTH, 
+                    channels: int = DEFAULT_LSB_CHANNELS, 
+                    password: Optional[str] = None,
+                    engine: str = DEFAULT_LSB_ENGINE) -> bytes:
+        """BMP görüntüsündeki gizli veriyi çıkarır."""
+        if not self.bmp_file.pixel_data:
+            raise SteganographyError("Veri çıkarmak için piksel verisi gereklidir")
+        
+        engine = self._resolve_engine(engine)
+        
+        with profiling.span("lsb.extract", engine=engine) as span:
+            with profiling.span("lsb.collect"):
+                if engine == "numpy":
+                    extracted_data = self._extract_bits_numpy(bit_depth, channels)
+                else:
+                    extracted_data = self._extract_bits_python(bit_depth, channels)
+            
+            self._count_pixels(len(extracted_data) + 4, bit_depth, channels)
+            
+            # Şifre çözme (eğer parola veya anahtarlık sağlanmışsa)
+            if (password or self.keyring) and CRYPTO_AVAILABLE:
+                try:
+                    extracted_data = self._decrypt_data(extracted_data, password)
+                except Exception as e:
+                    raise SteganographyError(f"Şifre çözme hatası: {e}")
+            
+            span.set(bytes=len(extracted_data))
+            return bytes(extracted_data)
+    
+    def _check_length(self, data_length: int, bit_depth: int, channels: int) -> None:
+        """Çıkarılan veri uzunluğunu maksimum kapasiteyle karşılaştırır."""
+        max_capacity = self.calculate_capacity(bit_depth, channels)
+        if data_length > max_capacity:
+            raise SteganographyError(f"Geçersiz veri uzunluğu: {data_length} > {max_capacity}")
+    
+    def _extract_bits_python(self, bit_depth: int, channels: int) -> bytearray:
+        """Gizli veriyi piksel, kanal ve bit üzerinde dolaşan döngülerle çıkarır."""
+        bytes_per_pixel, usable_channels = self._layout(bit_depth, channels)
+        
+        # Önce 4 baytlık veri uzunluğunu çıkar
+        length_bits = []
+        bit_index = 0
+        
+        # Piksel verilerinden bitleri çıkar
+        for i in range(0, len(self.bmp_file.pixel_data), bytes_per_pixel):
+            for c in range(usable_channels):
+                if i + c >= len(self.bmp_file.pixel_data):
+                    break
+                
+                for b in range(bit_depth):
+                    bit_value = (self.bmp_file.pixel_data[i + c] >> b) & 1
+                    length_bits.append(bit_value)
+                    
+                    bit_index += 1
+                    if bit_index >= 32:  # 4 bayt = 32 bit
+                        break
+                
+                if bit_index >= 32:
+                    break
+            
+            if bit_index >= 32:
+                break
+        
+        # Bit dizisini 4 baytlık uzunluk değerine dönüştür
+        length_bytes = bytearray(4)
+        for i, bit in enumerate(length_bits):
+            byte_index = i // 8
+            bit_position = i % 8
+            if bit:
+                length_bytes[byte_index] |= (1 << bit_position)
+        
+        data_length = struct.unpack("<I", length_bytes)[0]
+        
+        # Maksimum kapasiteyi kontrol et
+        self._check_length(data_length, bit_depth, channels)
+        
+        # Şimdi gerçek veriyi çıkar (ilk 32 bit uzunluk alanıdır, atlanır)
+        data_bits = []
+        bit_index = 0
+        bits_needed = data_length * 8
+        
+        for i in range(0, len(self.bmp_file.pixel_data), bytes_per_pixel):
+            for c in range(usable_channels):
+                if i + c >= len(self.bmp_file.pixel_data):
+                    break
+                
+                for b in range(bit_depth):
+                    if bit_index >= 32 + bits_needed:
+                        break
+                    
+                    if bit_index >= 32:
+                        bit_value = (self.bmp_file.pixel_data[i + c] >> b) & 1
+                        data_bits.append(bit_value)
+                    
+                    bit_index += 1
+                
+                if bit_index >= 32 + bits_needed:
+                    break
+            
+            if bit_index >= 32 + bits_needed:
+                break
+        
+        # Bit dizisini baytlara dönüştür
+        extracted_data = bytearray(data_length)
+        for i, bit in enumerate(data_bits[:bits_needed]):
+            byte_index = i // 8
+            bit_position = i % 8
+            if bit:
+                extracted_data[byte_index] |= (1 << bit_position)
+        
+        return extracted_data
+    
+    def _extract_bits_numpy(self, bit_depth: int, channels: int) -> bytes:
+        """Gizli veriyi kaydırma/maske işlemleri ve packbits ile çıkarır."""
+        bytes_per_pixel, usable_channels = self._layout(bit_depth, channels)
+        pixels = np.frombuffer(self.bmp_file.pixel_data, dtype=np.uint8)
+        
+        length_bits = _lsb_read_bits(pixels, 0, 32, bytes_per_pixel, usable_channels, bit_depth)
+        data_length = struct.unpack("<I", np.packbits(length_bits, bitorder='little').tobytes())[0]
+        
+        self._check_length(data_length, bit_depth, channels)
+        
+        data_bits = _lsb_read_bits(pixels, 32, data_length * 8, bytes_per_pixel, usable_channels, bit_depth)
+        return np.packbits(data_bits, bitorder='little').tobytes()
+    
+    def extract_range(self, offset: int, length: int, bit_depth: int = DEFAULT_LSB_DEPTH,
+                      channels: int = DEFAULT_LSB_CHANNELS, password: Optional[str] = None,
+                      engine: str = DEFAULT_LSB_ENGINE) -> bytes:
+        """Gizli verinin [offset, offset + length) bayt aralığını doğrudan çıkarır.
+        
+        Yalnızca uzunluk alanını ve istenen aralığın bitlerini taşıyan piksel
+        baytları okunur; maliyet yük boyutuna değil aralık uzunluğuna bağlıdır.
+        Parola verilirse aralık parçalı kapsayıcının düz metnine göre
+        yorumlanır ve yalnızca aralığı kapsayan parçalar çıkarılıp çözülür.
+        Eski tek parça şifreli yükler bu yolla okunamaz.
+        """
+        if offset < 0 or length < 0:
+            raise SteganographyError(f"Geçersiz aralık: offset={offset}, length={length}")
+        
+        if not self.bmp_file.pixel_data:
+            raise SteganographyError("Veri çıkarmak için piksel verisi gereklidir")
+        
+        engine = self._resolve_engine(engine)
+        
+        data_length = struct.unpack("<I", self._read_bytes(0, 4, bit_depth, channels, engine))[0]
+        self._check_length(data_length, bit_depth, channels)
+        
+        if password or self.keyring:
+            try:
+                return self._extract_range_encrypted(offset, length, data_length, bit_depth, channels,
+                                                     password, engine)
+            except EncryptionError as e:
+                raise SteganographyError(f"Şifre çözme hatası: {e}")
+        
+        if offset + length > data_length:
+            raise SteganographyError(f"Aralık gizli verinin dışında: {offset}+{length} > {data_length}")
+        
+        return self._read_bytes(32 + offset * 8, length, bit_depth, channels, engine)
+    
+    def _extract_range_encrypted(self, offset: int, length: int, data_length: int, bit_depth: int,
+                                 channels: int, password: str, engine: str) -> bytes:
+        """Parçalı kapsayıcıdan yalnızca aralığı kapsayan parçaları çıkarıp çözer."""
+        decryptor = self._segmented_decryptor(data_length, bit_depth, channels, password, engine)
+        if decryptor is None:
+            raise SteganographyError("Şifreli aralık okuma yalnızca parçalı kapsayıcıda desteklenir")
+        
+        segments = decryptor.segment_count(data_length)
+        plaintext_length = data_length - len(decryptor.header) - segments * AEAD_TAG_SIZE
+        
+        if offset + length > plaintext_length:
+            raise SteganographyError(f"Aralık gizli verinin dışında: {offset}+{length} > {plaintext_length}")
+        
+        if length == 0:
+            return b''
+        
+        segment_size = decryptor.segment_size
+        step = segment_size + AEAD_TAG_SIZE
+        first, last = offset // segment_size, (offset + length - 1) // segment_size
+        parts = []
+        
+        for index in range(first, last + 1):
+            start = len(decryptor.header) + index * step
+            count = min(step, data_length - start)
+            chunk = self._read_bytes(32 + start * 8, count, bit_depth, channels, engine)
+            parts.append(decryptor.decrypt_segment(index, chunk, final=index == segments - 1))
+        
+        start = offset - first * segment_size
+        return b''.join(parts)[start:start + length]
+    
+    def _read_bytes(self, start_bit: int, n_bytes: int, bit_depth: int, channels: int,
+                    engine: str) -> bytes:
+        """start_bit yuvasından başlayarak n_bytes baytı okur (yalnızca ilgili piksel baytları)."""
+        bytes_per_pixel, usable_channels = self._layout(bit_depth, channels)
+        
+        if engine == "numpy":
+            pixels = np.frombuffer(self.bmp_file.pixel_data, dtype=np.uint8)
+            bits = _lsb_read_bits(pixels, start_bit, n_bytes * 8, bytes_per_pixel, usable_channels, bit_depth)
+            return np.packbits(bits, bitorder='little').tobytes()
+        
+        per_group = usable_channels * bit_depth
+        pixels = self.bmp_file.pixel_data
+        result = bytearray(n_bytes)
+        
+        for k in range(n_bytes * 8):
+            group, rest = divmod(start_bit + k, per_group)
+            channel, bit = divmod(rest, bit_depth)
+            if (pixels[group * bytes_per_pixel + channel] >> bit) & 1:
+                result[k >> 3] |= 1 << (k & 7)
+        
+        return bytes(result)
+    
+    def _encrypt_data(self, data: bytes, password: Optional[str],
+                      cipher: str = DEFAULT_CIPHER) -> bytes:
+        """Veriyi şifreler."""
+        try:
+            with profiling.span("lsb.encrypt", bytes=len(data), cipher=cipher):
+                return encrypt_payload(data, password, self.keyring, cipher)
+        except EncryptionError as e:
+            raise SteganographyError(str(e))
+    
+    def _decrypt_data(self, encrypted_data: bytes, password: Optional[str]) -> bytes:
+        """Şifreli veriyi çözer."""
+        try:
+            with profiling.span("lsb.decrypt", bytes=len(encrypted_data)):
+                return decrypt_payload(encrypted_data, password, self.keyring)
+        except EncryptionError as e:
+            raise SteganographyError(str(e))
+    
+    def hide_text(self, text: str, encoding: str = 'utf-8', **kwargs) -> None:
+        """Metin mesajını BMP görüntüsünde gizler."""
+        text_data = text.encode(encoding)
+        self.hide_data(text_data, **kwargs)
+    
+    @staticmethod
+    def extract_text(bmp_path: str, encoding: str = 'utf-8', **kwargs) -> str:
+        """BMP görüntüsündeki gizli metni çıkarır."""
+        bmp = BMPFile(bmp_path)
+        stego = LSBSteganography(bmp)
+        extracted_data = stego.extract_data(**kwargs)
+        
+        try:
+            return extracted_data.decode(encoding)
+        except UnicodeDecodeError:
+            raise SteganographyError(f"{encoding} olarak metin çözme başarısız, farklı bir kodlama deneyin veya parola gerekebilir")
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Girdi yollarını açma
+====================
+
+Komut satırında verilen dosya, dizin ve glob desenlerini BMP dosya
+yollarına açar. Toplu işlem (batch) yolları üretildikçe işler; renk
+analizi (bmp_analysis.find_bmp_files) aynı üreteci listeye toplar. Bu
+modül numpy gibi ağır bağımlılıkları yüklemez.
+"""
+
+import os
+import glob
+from typing import Iterable, Iterator
+
+
+def _is_bmp(name: str) -> bool:
+    """Gizli olmayan, .bmp uzantılı dosya adı mı (glob da gizli adları atlar)."""
+    return not name.startswith(".") and name.lower().endswith(".bmp")
+
+
+def iter_bmp_files(paths: Iterable[str], recursive: bool = False) -> Iterator[str]:
+    """Dosya, dizin ve glob desenlerini BMP dosya yollarına açar.
+
+    Dizinlerden yalnızca .bmp uzantılı dosyalar alınır; recursive=True ise
+    alt dizinlere de inilir. Desenlerin yalnızca dosya olan eşleşmeleri
+    alınır (recursive=True ise ** kullanılabilir). Doğrudan verilen yollar
+    uzantısına ve varlığına bakılmadan üretilir; hatalı yol, işlendiği yerde
+    hata olarak raporlanır.
+
+    Yollar listeye toplanmadan üretilir: dizinler klasör klasör okunur, her
+    klasörün içeriği kendi içinde sıralanır. Desen eşleşmeleri sıralanmak
+    için desen başına toplanır.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            if recursive:
+                for root, dirs, files in os.walk(path):
+                    dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+                    for name in sorted(files):
+                        if _is_bmp(name):
+                            yield os.path.join(root, name)
+            else:
+                for name in sorted(os.listdir(path)):
+                    full_path = os.path.join(path, name)
+                    if _is_bmp(name) and os.path.isfile(full_path):
+                        yield full_path
+        elif glob.has_magic(path):
+            yield from sorted(match for match in glob.iglob(path, recursive=recursive)
+                              if os.path.isfile(match))
+        else:
+            yield path
@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+İsteğe bağlı zamanlama ölçümü
+=============================
+
+Sıcak yollardaki işlemler (dosya okuma, başlık ayrıştırma, KDF, şifreleme,
+bit paketleme, yazma) `span` bağlam yöneticisiyle sarılır; okunan/yazılan
+bayt ve işlenen piksel sayıları `count` ile sayılır. Ölçüm kapalıyken
+`span` paylaşılan boş bir bağlam döndürür ve `count` hemen döner; maliyet
+bir fonksiyon çağrısı düzeyindedir.
+
+Ölçüm iki yolla açılır:
+
+- Ortam değişkeni: BMP_PROFILE=iz.json (veya "-" ya da "1": standart hata
+  akışı), BMP_PROFILE_CHROME=chrome.json. İz, süreç sonunda yazılır.
+- Komut satırı: --profile (stderr), --profile-output DOSYA ve
+  --profile-chrome DOSYA.
+
+JSON iz her aralığın başlangıç ve süresini, ad başına toplam ve kendi
+süresini (alt aralıklar çıkarılmış) ve sayaçları içerir. Chrome izi
+chrome://tracing veya Perfetto ile açılabilir.
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import functools
+import threading
+from typing import Any, Dict, List, Optional
+
+ENV_PROFILE = "BMP_PROFILE"
+ENV_PROFILE_CHROME = "BMP_PROFILE_CHROME"
+
+# Ortam değişkeninde bu değerler izin dosya yerine stderr'e yazılacağı anlamına gelir
+STDERR_TARGETS = ("-", "1", "true", "yes", "on")
+
+
+class _NullSpan:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan aralık."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Kaydediciye süresini ve argümanlarını yazan zamanlama aralığı."""
+
+    __slots__ = ("recorder", "name", "args", "start", "parent")
+
+    def __init__(self, recorder: 'Recorder', name: str, args: Dict[str, Any]):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+        self.start = 0.0
+        self.parent: Optional[str] = None
+
+    def set(self, **args: Any) -> None:
+        """Aralık kapanmadan önce argüman ekler (ör. işlenen bayt sayısı)."""
+        self.args.update(args)
+
+    def __enter__(self) -> 'Span':
+        stack = self.recorder._stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        end = time.perf_counter()
+        self.recorder._stack().pop()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.recorder._finish(self, end)
+
+
+class Recorder:
+    """Aralıkları ve sayaçları toplayan, JSON ve Chrome izi üreten kaydedici."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.started = time.time()
+        self.spans: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _finish(self, span: Span, end: float) -> None:
+        record = {
+            "name": span.name,
+            "start": span.start - self.origin,
+            "duration": end - span.start,
+            "thread": threading.get_ident(),
+            "depth": len(self._stack()),
+            "parent": span.parent,
+            "args": span.args,
+        }
+        with self._lock:
+            self.spans.append(record)
+
+    def count(self, name: str, value: int) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Ad başına çağrı sayısı, toplam, kendi (alt aralıklar hariç) ve en uzun süre."""
+        # Aralıklar kapanış sırasıyla kaydedilir; alt aralıklar üst aralıktan önce gelir
+        child_time: Dict[tuple, float] = {}
+        totals: Dict[str, Dict[str, float]] = {}
+
+        for record in self.spans:
+            key = (record["thread"], record["depth"])
+            children = child_time.pop((record["thread"], record["depth"] + 1), 0.0)
+
+            entry = totals.setdefault(record["name"], {"count": 0, "total": 0.0, "self": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["total"] += record["duration"]
+            entry["self"] += record["duration"] - children
+            entry["max"] = max(entry["max"], record["duration"])
+
+            child_time[key] = child_time.get(key, 0.0) + record["duration"]
+
+        return totals
+
+    def report(self) -> Dict[str, Any]:
+        """JSON izi: çalışma bilgisi, aralıklar, ad başına özet ve sayaçlar."""
+        return {
+            "pid": os.getpid(),
+            "started": self.started,
+            "wall_time": time.perf_counter() - self.origin,
+            "summary": self.summary(),
+            "counters": dict(self.counters),
+            "spans": list(self.spans),
+        }
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Chrome trace-event biçiminde iz (tamamlanmış "X" olayları ve son sayaç değerleri)."""
+        pid = os.getpid()
+        events = [{
+            "name": record["name"],
+            "cat": record["name"].split(".", 1)[0],
+            "ph": "X",
+            "ts": record["start"] * 1e6,
+            "dur": record["duration"] * 1e6,
+            "pid": pid,
+            "tid": record["thread"],
+            "args": record["args"],
+        } for record in self.spans]
+
+        end = (time.perf_counter() - self.origin) * 1e6
+        for name, value in self.counters.items():
+            events.append({"name": name, "ph": "C", "ts": end, "pid": pid, "args": {name: value}})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+_recorder: Optional[Recorder] = None
+_outputs: Dict[str, Optional[str]] = {}
+
+
+def span(name: str, **args: Any):
+    """Adlandırılmış zamanlama aralığı; ölçüm kapalıyken boş bağlam döndürür.
+
+        with profiling.span("bmp.load", path=file_path) as s:
+            ...
+            s.set(bytes=len(data))
+    """
+    if _recorder is None:
+        return _NULL_SPAN
+    return Span(_recorder, name, args)
+
+
+def traced(name: str):
+    """Fonksiyonun tamamını bir aralıkla saran dekoratör; ölçüm kapalıyken doğrudan çağırır."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with Span(_recorder, name, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name: str, value: int) -> None:
+    """Sayaca değer ekler (ör. "bytes_read"); ölçüm kapalıyken bir şey yapmaz."""
+    if _recorder is not None:
+        _recorder.count(name, value)
+
+
+def is_enabled() -> bool:
+    """Ölçümün açık olup olmadığını döndürür."""
+    return _recorder is not None
+
+
+def enable(trace_path: Optional[str] = None, chrome_path: Optional[str] = None) -> Recorder:
+    """Ölçümü açar; trace_path ("-": stderr) ve chrome_path write_outputs ile yazılır."""
+    global _recorder
+
+    if _recorder is None:
+        _recorder = Recorder()
+    _outputs["trace"] = trace_path
+    _outputs["chrome"] = chrome_path
+    return _recorder
+
+
+def disable() -> Optional[Recorder]:
+    """Ölçümü kapatır ve toplanan kaydediciyi döndürür."""
+    global _recorder
+
+    recorder, _recorder = _recorder, None
+    _outputs.clear()
+    return recorder
+
+
+def write_outputs() -> None:
+    """Açık kaydedicinin JSON ve Chrome izlerini enable ile verilen hedeflere yazar."""
+    if _recorder is None:
+        return
+
+    trace_path, chrome_path = _outputs.get("trace"), _outputs.get("chrome")
+
+    if trace_path == "-":
+        json.dump(_recorder.report(), sys.stderr, indent=2, default=str)
+        sys.stderr.write("\n")
+    elif trace_path:
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(_recorder.report(), f, indent=2, default=str)
+
+    if chrome_path:
+        with open(chrome_path, "w", encoding="utf-8") as f:
+            json.dump(_recorder.chrome_trace(), f, default=str)
+
+
+def _enable_from_environment() -> None:
+    """BMP_PROFILE / BMP_PROFILE_CHROME ayarlıysa ölçümü açar ve izleri süreç sonunda yazar."""
+    trace_path = os.environ.get(ENV_PROFILE, "").strip()
+    chrome_path = os.environ.get(ENV_PROFILE_CHROME, "").strip() or None
+
+    if trace_path.lower() in ("", "0", "false", "no", "off"):
+        trace_path = None
+    elif trace_path.lower() in STDERR_TARGETS:
+        trace_path = "-"
+
+    if trace_path or chrome_path:
+        enable(trace_path, chrome_path)
+        atexit.register(write_outputs)
+
+
+_enable_from_environment()